@@ -0,0 +1,40 @@
+"""Compares the compiled speedups with the pure Python functions they replace.
+
+Run from the project root with `poetry run python -m benchmarks.speedups_benchmark`
+after compiling the speedups with `poetry run python build.py`.
+"""
+
+import sys
+import timeit
+from functools import partial
+from fixedcal import FixedDate
+from fixedcal.services import speedups
+from fixedcal.services.speedups import PURE_PYTHON
+
+# arguments of each accelerated function, a leap year and a day after leap day
+CASES = {
+    "is_leap_year": (2024,),
+    "leap_years_before": (2024,),
+    "leap_days_before": (2024, 200, 179),
+    "year_start_ordinal": (2024,),
+    "year_and_day_of_year": (739000,),
+    "fixed_fields": (200, 2024),
+}
+
+def main(number: int = 500000) -> int:
+    if not speedups.ENABLED:
+        print("Compiled speedups are not available, compile them with `python build.py` "
+              f"and unset {speedups.PURE_PYTHON_VARIABLE}")
+        return 1
+    FixedDate.fromordinal(1)                # builds the shared year table before timing
+    print(f"{'function':<30}{'pure Python':>14}{'compiled':>14}{'speedup':>10}")
+    for name, args in CASES.items():
+        compiled = getattr(speedups._speedups, name) # pylint: disable=protected-access
+        pure_time = min(timeit.repeat(partial(PURE_PYTHON[name], *args), number=number))
+        compiled_time = min(timeit.repeat(partial(compiled, *args), number=number))
+        print(f"{name:<30}{pure_time/number*1e9:>11.0f} ns"
+              f"{compiled_time/number*1e9:>11.0f} ns{pure_time/compiled_time:>9.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Benchmark suite for the hot paths of FixedDate.
+
+Run from the project root:
+
+    poetry run python -m benchmarks.suite --output results.json
+    poetry run python -m benchmarks.suite --compare results.json
+
+The first command stores the timings as a baseline, the second one measures again
+and exits with status 1 if some benchmark got slower than the allowed threshold.
+Timings depend on the machine, so no baseline is stored in the repository,
+and comparing exits with status 2 if the baseline is missing or covers none of the benchmarks.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+SETUP = """
+import datetime
+from fixedcal import FixedDate
+native = datetime.date(2024, 8, 3)
+fixed = FixedDate(native)
+leap_day = FixedDate(day=29, month=6, year=2024)
+week_later = fixed + datetime.timedelta(7)
+year_1 = FixedDate(day=1, month=1, year=1)
+year_9999 = FixedDate(day=28, month=13, year=9999)
+one_day = datetime.timedelta(1)
+long_span = datetime.timedelta(3000000)
+"""
+
+BENCHMARKS = {
+    "init/date": "FixedDate(date=native)",
+    "init/day_month_year": "FixedDate(day=3, month=8, year=2024)",
+    "init/day_of_year": "FixedDate(day_of_year=216, year=2024)",
+    "init/ordinal": "FixedDate.fromordinal(739101)",
+    "property/date": "fixed.date",
+    "property/day_of_month": "fixed.day_of_month",
+    "property/weekday": "fixed.weekday",
+    "property/weekday_leap_day": "leap_day.weekday",
+    "property/week_of_year": "fixed.week_of_year",
+    "property/year_quarter": "fixed.year_quarter",
+    "sub/short_span": "week_later - fixed",
+    "sub/long_span": "year_9999 - year_1",
+    "add/short_span": "fixed + one_day",
+    "add/long_span": "year_1 + long_span",
+    "str": "str(fixed)",
+    "format": "fixed.format('%A %d %B %Y')",
+    "parse/isoformat": "FixedDate.fromisoformat('2024-08-03')",
+}
+
+def measure(names=None, repeat: int = 5, min_time: float = 0.2) -> dict:
+    """Time the benchmarks.
+
+    Args:
+        names (Optional[Iterable[str]]): Benchmarks to run, all of them by default
+        repeat (int): Count of measurements, the fastest one is reported
+        min_time (float): Minimum duration of a single measurement in seconds
+
+    Returns:
+        dict: Nanoseconds per call keyed with benchmark name.
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        timer = timeit.Timer(BENCHMARKS[name], setup=SETUP)
+        number, elapsed = timer.autorange()
+        number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+        best = min(timer.repeat(repeat=repeat, number=number))
+        results[name] = best / number * 1e9
+    return results
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Find the benchmarks that got slower.
+
+    Args:
+        results (dict): Current nanoseconds per call keyed with benchmark name
+        baseline (dict): Earlier nanoseconds per call keyed with benchmark name
+        threshold (float): Allowed ratio of current and earlier time
+
+    Returns:
+        list: Names of the benchmarks slower than allowed.
+    """
+    return [name for name, time in results.items()
+            if name in baseline and time > baseline[name] * threshold]
+
+def _report(results: dict, baseline: dict) -> None:
+    for name, time in results.items():
+        line = f"{name:<28}{time:>10.0f} ns"
+        if name in baseline:
+            line += f"{baseline[name]:>12.0f} ns{time / baseline[name]:>8.2f}x"
+        print(line)
+
+def _load_baseline(path: str, names: list) -> dict:
+    """Results of the baseline file, None after printing the problem if it is not usable."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        print(f"Cannot read baseline {path}: {error!r}. "
+              "Create it with --output before your changes.", file=sys.stderr)
+        return None
+    missing = [name for name in names if name not in baseline]
+    if missing and len(missing) == len(names):
+        print(f"Baseline {path} has none of the benchmarks to compare.", file=sys.stderr)
+        return None
+    if missing:
+        print(f"Not in baseline, not compared: {', '.join(missing)}", file=sys.stderr)
+    return baseline
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="compare with results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="allowed slowdown ratio compared to the baseline (default 1.25)")
+    parser.add_argument("--filter", default="", help="run only benchmarks containing this text")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+
+    baseline = {}
+    if args.compare:
+        baseline = _load_baseline(args.compare, names)
+        if baseline is None:
+            return 2
+    results = measure(names)
+    _report(results, baseline)
+
+    if args.output:
+        document = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2)
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Slower than {args.threshold}x baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
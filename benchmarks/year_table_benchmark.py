@@ -0,0 +1,68 @@
+"""Compares the precomputed year table with the plain arithmetic it replaced.
+
+Run from the project root with `poetry run python -m benchmarks.year_table_benchmark`.
+Both columns time the pure Python functions, also when the compiled speedups
+replace them in the library, so that the difference is the one of the table alone.
+"""
+
+import datetime
+import timeit
+from fixedcal import FixedDate
+from fixedcal.services import speedups
+from fixedcal.services.speedups import PURE_PYTHON
+
+is_leap_year = PURE_PYTHON["is_leap_year"]
+leap_years_before = PURE_PYTHON["leap_years_before"]
+year_start_ordinal = PURE_PYTHON["year_start_ordinal"]
+year_and_day_of_year = PURE_PYTHON["year_and_day_of_year"]
+
+def arithmetic_year_start_ordinal(year: int) -> int:
+    return 365*(year-1) + leap_years_before(year) + 1
+
+def arithmetic_year_and_day_of_year(ordinal: int) -> tuple:
+    cycles_400, days = divmod(ordinal-1, 146097)
+    cycles_100, days = divmod(days, 36524)
+    cycles_4, days = divmod(days, 1461)
+    cycles_1, days = divmod(days, 365)
+    year = 400*cycles_400 + 100*cycles_100 + 4*cycles_4 + cycles_1 + 1
+    if cycles_1 == 4 or cycles_100 == 4:
+        return (year-1, 366)
+    return (year, days+1)
+
+def arithmetic_from_date(date: datetime.date) -> tuple:
+    # the conversion FixedDate(date=...) performs, without the table
+    year = date.year
+    day_of_year = date.toordinal() - arithmetic_year_start_ordinal(year) + 1
+    return (year, day_of_year, is_leap_year(year))
+
+def table_from_date(date: datetime.date) -> tuple:
+    year = date.year
+    day_of_year = date.toordinal() - year_start_ordinal(year) + 1
+    return (year, day_of_year, is_leap_year(year))
+
+CASES = [
+    ("year start ordinal", "arithmetic_year_start_ordinal(2024)", "year_start_ordinal(2024)"),
+    ("ordinal to year and day", "arithmetic_year_and_day_of_year(739000)",
+     "year_and_day_of_year(739000)"),
+    ("native date to year and day", "arithmetic_from_date(DATE)", "table_from_date(DATE)"),
+]
+
+def main(number: int = 500000) -> None:
+    namespace = dict(globals(), DATE=datetime.date(2024, 8, 3))
+    print("Pure Python functions")
+    print(f"{'operation':<30}{'arithmetic':>14}{'table':>14}{'speedup':>10}")
+    for name, arithmetic, table in CASES:
+        arithmetic_time = min(timeit.repeat(arithmetic, globals=namespace, number=number))
+        table_time = min(timeit.repeat(table, globals=namespace, number=number))
+        print(f"{name:<30}{arithmetic_time/number*1e9:>11.0f} ns"
+              f"{table_time/number*1e9:>11.0f} ns{arithmetic_time/table_time:>9.2f}x")
+
+    backend = "compiled speedups" if speedups.ENABLED else "pure Python"
+    print(f"\nFixedDate with {backend}")
+    for stmt in ("FixedDate(date=DATE)", "FixedDate.fromordinal(739000)"):
+        elapsed = min(timeit.repeat(stmt, globals=dict(namespace, FixedDate=FixedDate),
+                                    number=number))
+        print(f"{stmt:<30}{elapsed/number*1e9:>25.0f} ns")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Build script compiling the optional `fixedcal._speedups` extension.
+
+Poetry runs this when building the package. A failing compilation is not an
+error: fixedcal then uses its pure Python implementation.
+"""
+
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+EXTENSIONS = [Extension("fixedcal._speedups", ["fixedcal/_speedups.c"], optional=True)]
+
+class OptionalBuildExt(build_ext):
+    """Build command ignoring compilation failures"""
+
+    def run(self):
+        try:
+            super().run()
+        except (CCompilerError, ExecError, PlatformError, OSError):
+            print("fixedcal: compiling speedups failed, using pure Python implementation")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError, OSError):
+            print(f"fixedcal: compiling {ext.name} failed, using pure Python implementation")
+
+def build(setup_kwargs: dict) -> None:
+    """Add the extension to the arguments of setup(), called by Poetry.
+
+    Args:
+        setup_kwargs (dict): Arguments of setup()
+    """
+    setup_kwargs.update(ext_modules=EXTENSIONS, cmdclass={"build_ext": OptionalBuildExt})
+
+if __name__ == "__main__":
+    from setuptools import setup
+    setup(name="fixedcal", ext_modules=EXTENSIONS, cmdclass={"build_ext": OptionalBuildExt},
+          script_args=["build_ext", "--inplace"])
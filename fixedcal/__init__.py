@@ -1,3 +1,41 @@
-"""A module gathering all needed classes easily available for the user of this library"""
+"""A module gathering all needed classes easily available for the user of this library.
 
-from fixedcal.core.date import FixedDate
+The classes and submodules are imported on first access (PEP 562),
+so that `import fixedcal` stays cheap and optional integrations,
+such as `fixedcal.vectorized` with NumPy and `fixedcal.pandas` with pandas,
+are imported only when used.
+"""
+
+from importlib import import_module
+
+# module defining each class keyed with the class name
+_CLASSES = {
+    "FixedDate": "fixedcal.core.date",
+    "FixedClock": "fixedcal.core.date",
+    "FixedDateTime": "fixedcal.core.date_time",
+    "FixedDateRange": "fixedcal.core.date_range",
+}
+
+_SUBMODULES = ("aio", "calendar", "cli", "column", "index", "instrumentation", "pandas",
+               "parallel", "periods", "recurrence", "vectorized", "workdays")
+
+__all__ = list(_CLASSES)
+
+# the same as `typing.TYPE_CHECKING` without importing typing, for type checkers and linters
+if False: # pylint: disable=using-constant-test
+    from fixedcal.core.date import FixedDate, FixedClock
+    from fixedcal.core.date_time import FixedDateTime
+    from fixedcal.core.date_range import FixedDateRange
+
+def __getattr__(name: str):
+    if name in _CLASSES:
+        value = getattr(import_module(_CLASSES[name]), name)
+    elif name in _SUBMODULES:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_CLASSES) | set(_SUBMODULES))
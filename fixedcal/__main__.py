@@ -0,0 +1,6 @@
+"""Allows running the command line tool with `python -m fixedcal`"""
+
+import sys
+from fixedcal.cli import main
+
+sys.exit(main())
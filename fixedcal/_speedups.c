@@ -0,0 +1,177 @@
+/*
+ * Compiled counterparts of the hot functions in fixedcal.services.
+ *
+ * Every function here has a pure Python implementation with identical behavior
+ * for valid arguments, decorated with fixedcal.services.speedups.accelerated.
+ * tests/speedups_test.py compares the two.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#define LEAP_DAY_OF_YEAR 169
+
+static long long
+floor_div(long long a, long long b)
+{
+    long long quotient = a / b;
+    if ((a % b != 0) && ((a < 0) != (b < 0))) {
+        quotient--;
+    }
+    return quotient;
+}
+
+static long long
+floor_mod(long long a, long long b)
+{
+    return a - b * floor_div(a, b);
+}
+
+static int
+leap_year(long long year)
+{
+    return floor_mod(year, 4) == 0 && (floor_mod(year, 100) != 0 || floor_mod(year, 400) == 0);
+}
+
+static long long
+leap_years_before(long long year)
+{
+    year -= 1;
+    return floor_div(year, 4) - floor_div(year, 100) + floor_div(year, 400);
+}
+
+static long long
+year_start_ordinal(long long year)
+{
+    return 365 * (year - 1) + leap_years_before(year) + 1;
+}
+
+static PyObject *
+speedups_is_leap_year(PyObject *module, PyObject *arg)
+{
+    long long year = PyLong_AsLongLong(arg);
+    if (year == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    return PyBool_FromLong(leap_year(year));
+}
+
+static PyObject *
+speedups_leap_years_before(PyObject *module, PyObject *arg)
+{
+    long long year = PyLong_AsLongLong(arg);
+    if (year == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    return PyLong_FromLongLong(leap_years_before(year));
+}
+
+static PyObject *
+speedups_leap_days_before(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    long long year, day_of_year, leap_day_of_year, count;
+    if (nargs != 3) {
+        PyErr_SetString(PyExc_TypeError, "leap_days_before expected 3 arguments");
+        return NULL;
+    }
+    year = PyLong_AsLongLong(args[0]);
+    day_of_year = PyLong_AsLongLong(args[1]);
+    leap_day_of_year = PyLong_AsLongLong(args[2]);
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    count = leap_years_before(year);
+    if (day_of_year > leap_day_of_year && leap_year(year)) {
+        count++;
+    }
+    return PyLong_FromLongLong(count);
+}
+
+static PyObject *
+speedups_year_start_ordinal(PyObject *module, PyObject *arg)
+{
+    long long year = PyLong_AsLongLong(arg);
+    if (year == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    return PyLong_FromLongLong(year_start_ordinal(year));
+}
+
+static PyObject *
+speedups_year_and_day_of_year(PyObject *module, PyObject *arg)
+{
+    long long ordinal = PyLong_AsLongLong(arg);
+    long long year, start;
+    if (ordinal == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    /* average year length gives the year or one of its neighbours */
+    year = floor_div((ordinal - 1) * 400, 146097) + 1;
+    start = year_start_ordinal(year);
+    if (ordinal < start) {
+        year--;
+        start = year_start_ordinal(year);
+    }
+    else if (ordinal >= year_start_ordinal(year + 1)) {
+        year++;
+        start = year_start_ordinal(year);
+    }
+    return Py_BuildValue("(LL)", year, ordinal - start + 1);
+}
+
+static PyObject *
+speedups_fixed_fields(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    long long day_of_year, year, ordinal, month, day_of_month;
+    int is_leap;
+    if (nargs != 2) {
+        PyErr_SetString(PyExc_TypeError, "fixed_fields expected 2 arguments");
+        return NULL;
+    }
+    day_of_year = PyLong_AsLongLong(args[0]);
+    year = PyLong_AsLongLong(args[1]);
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    is_leap = leap_year(year);
+    ordinal = year_start_ordinal(year) + day_of_year - 1;
+    if (is_leap && day_of_year == LEAP_DAY_OF_YEAR) {
+        month = 6;
+        day_of_month = 29;
+    }
+    else if (day_of_year == 365 + is_leap) {
+        month = 13;
+        day_of_month = 29;
+    }
+    else {
+        long long index = day_of_year - 1 - (is_leap && day_of_year > LEAP_DAY_OF_YEAR);
+        month = floor_div(index, 28) + 1;
+        day_of_month = floor_mod(index, 28) + 1;
+    }
+    return Py_BuildValue("(LLLO)", ordinal, month, day_of_month, is_leap ? Py_True : Py_False);
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"is_leap_year", speedups_is_leap_year, METH_O, NULL},
+    {"leap_years_before", speedups_leap_years_before, METH_O, NULL},
+    {"leap_days_before", (PyCFunction)(void (*)(void))speedups_leap_days_before,
+     METH_FASTCALL, NULL},
+    {"year_start_ordinal", speedups_year_start_ordinal, METH_O, NULL},
+    {"year_and_day_of_year", speedups_year_and_day_of_year, METH_O, NULL},
+    {"fixed_fields", (PyCFunction)(void (*)(void))speedups_fixed_fields, METH_FASTCALL, NULL},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "fixedcal._speedups",
+    "Compiled counterparts of the hot functions in fixedcal.services.",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
@@ -0,0 +1,106 @@
+"""Conversion of dates read from asynchronous iterators, for asyncio pipelines.
+
+Dates are collected into batches, which are packed into columns of ordinals
+and converted like in `fixedcal.parallel`::
+
+    async for text in aconvert(consumer.dates(), TO_IFC, batch_size=500, max_latency=0.1):
+        ...
+
+A batch is converted as soon as it is full, or when `max_latency` seconds have passed
+since its first date arrived, so a slow source does not hold back the dates already read.
+The event loop is blocked only for the conversion of one batch at a time.
+The source is read ahead by at most `max_buffered` dates, so a slow consumer
+slows down the reading instead of letting the buffer grow.
+"""
+
+import asyncio
+import contextlib
+from typing import NamedTuple
+from fixedcal.parallel import TO_IFC, TO_GREGORIAN, convert_column, to_column
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_LATENCY = 0.05
+
+class _End(NamedTuple):
+    """Marks the end of the source in the buffer, with the error that ended it if any."""
+    error: BaseException = None
+
+async def _read(values, buffer: asyncio.Queue) -> None:
+    try:
+        async for value in values:
+            await buffer.put(value)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        await buffer.put(_End(error))
+    else:
+        await buffer.put(_End())
+
+async def _next_batch(buffer: asyncio.Queue, batch_size: int, max_latency: float) -> tuple:
+    loop = asyncio.get_running_loop()
+    batch = []
+    item = await buffer.get()
+    deadline = loop.time() + max_latency
+    while not isinstance(item, _End):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            return batch, None
+        if buffer.empty():
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                return batch, None
+            try:
+                item = await asyncio.wait_for(buffer.get(), timeout)
+            except asyncio.TimeoutError:
+                return batch, None
+        else:
+            item = buffer.get_nowait()
+    return batch, item
+
+def aconvert(values, direction: str = TO_IFC, batch_size: int = DEFAULT_BATCH_SIZE,
+             max_latency: float = DEFAULT_MAX_LATENCY, max_buffered: int = None):
+    """Convert dates of an asynchronous iterable in batches.
+    The arguments are checked immediately, and the source is read only during iteration.
+
+    Args:
+        values (AsyncIterable[Union[datetime.date, FixedDate, int]]): Dates or their ordinals
+        direction (str): `TO_IFC` for IFC strings, `TO_GREGORIAN` for Gregorian strings
+        batch_size (int): Maximum count of dates converted at once, positive
+        max_latency (float): Maximum time in seconds a date waits for its batch to fill up
+        max_buffered (Optional[int]): Maximum count of dates read ahead of the consumer,
+            two batches by default
+
+    Raises:
+        ValueError: Direction, batch size or latency is invalid,
+            or during iteration, some ordinal is invalid.
+
+    Returns:
+        AsyncIterator[str]: The dates as YYYY-MM-DD strings in the order of the input.
+        Errors raised by the source are raised after the dates read before them.
+    """
+    if direction not in (TO_IFC, TO_GREGORIAN):
+        raise ValueError(f"Direction should be either {TO_IFC} or {TO_GREGORIAN}")
+    if batch_size < 1:
+        raise ValueError("Batch size should be positive")
+    if max_latency < 0:
+        raise ValueError("Maximum latency should not be negative")
+    if max_buffered is None:
+        max_buffered = 2*batch_size
+    return _aconvert(values, direction, batch_size, max_latency, max(max_buffered, 1))
+
+async def _aconvert(values, direction: str, batch_size: int, max_latency: float,
+                    max_buffered: int):
+    buffer = asyncio.Queue(max_buffered)
+    reader = asyncio.ensure_future(_read(values, buffer))
+    try:
+        end = None
+        while end is None:
+            batch, end = await _next_batch(buffer, batch_size, max_latency)
+            for text in convert_column(direction, to_column(batch)):
+                yield text
+            # let the reader and other tasks run between batches
+            await asyncio.sleep(0)
+        if end.error is not None:
+            raise end.error
+    finally:
+        reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reader
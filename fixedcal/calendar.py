@@ -0,0 +1,257 @@
+"""Month and year calendars of IFC, like the ones of the standard `calendar` module.
+
+Every IFC month starts on Sunday and consists of four full weeks, so the grid of
+a month never changes. Only June of leap years and December (month 13) have
+an extra day, leap day or year day, which is outside of the weeks and
+is given as a row of its own::
+
+    monthdayscalendar(2024, 6)      # [[1, ..., 7], ..., [22, ..., 28], [29]]
+    monthdatescalendar(2024, 6)     # the same as FixedDates
+    print(month_text(2024, 6))
+    month_html(2024, 6)
+
+The text and HTML renderers fill precomputed templates, and only the functions
+returning dates construct FixedDates.
+"""
+
+from fixedcal.core.date import FixedDate
+from fixedcal.services.formatting import MONTH_NAMES, WEEKDAY_NAMES
+from fixedcal.services.year_table import FIRST_YEAR, LAST_YEAR, get_year_table
+
+LEAP_DAY = "Leap Day"
+YEAR_DAY = "Year Day"
+
+_LEAP_DAY_MONTH = 6
+_YEAR_DAY_MONTH = 13
+_WEEKS = tuple(list(range(7*week + 1, 7*week + 8)) for week in range(4))
+
+_TEXT_WIDTH = 20                        # seven days of width 2 separated with spaces
+_TEXT_MONTH_SPACING = " " * 3
+_TEXT_BODY = "\n".join([" ".join(name[:2] for name in WEEKDAY_NAMES)] +
+                       [" ".join(f"{day:2}" for day in week) for week in _WEEKS])
+
+_CSS_CLASSES = tuple(name[:3].lower() for name in WEEKDAY_NAMES)
+_HTML_BODY = "\n".join(
+    ["<tr>" + "".join(f'<th class="{css_class}">{name[:3]}</th>'
+                      for css_class, name in zip(_CSS_CLASSES, WEEKDAY_NAMES)) + "</tr>"] +
+    ["<tr>" + "".join(f'<td class="{css_class}">{day}</td>'
+                      for css_class, day in zip(_CSS_CLASSES, week)) + "</tr>"
+     for week in _WEEKS])
+_HTML_SPECIAL_CLASSES = {LEAP_DAY: "leap-day", YEAR_DAY: "year-day"}
+
+def _check(year: int, month: int) -> None:
+    if year < FIRST_YEAR or year > LAST_YEAR:
+        raise ValueError(f"Year should be in range {FIRST_YEAR}...{LAST_YEAR}")
+    if month < 1 or month > 13:
+        raise ValueError("Month should be in range 1...13")
+
+def special_day(year: int, month: int) -> str:
+    """Name of the day of the month outside of its weeks.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        Optional[str]: `LEAP_DAY` for June of leap years, `YEAR_DAY` for month 13
+        and None for the others.
+    """
+    _check(year, month)
+    if month == _YEAR_DAY_MONTH:
+        return YEAR_DAY
+    if month == _LEAP_DAY_MONTH and get_year_table().leap_flags[year]:
+        return LEAP_DAY
+    return None
+
+def monthrange(year: int, month: int) -> tuple:
+    """Weekday of the first day and count of days of the month, like `calendar.monthrange`.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        tuple: Weekday (always 1 for Sunday) and count of days (28 or 29).
+    """
+    return (1, 28 if special_day(year, month) is None else 29)
+
+def itermonthdays(year: int, month: int):
+    """Days of month of the month.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        Iterator[int]: Numbers 1...28, and 29 for leap day and year day.
+    """
+    return iter(range(1, monthrange(year, month)[1] + 1))
+
+def itermonthdays2(year: int, month: int):
+    """Days of month of the month with their weekdays.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        Iterator[tuple]: Day of month and weekday like in `FixedDate.weekday`,
+        None as the weekday of leap day and year day.
+    """
+    days = itermonthdays(year, month)
+    return ((day, (day-1) % 7 + 1 if day <= 28 else None) for day in days)
+
+def itermonthdates(year: int, month: int):
+    """Dates of the month.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        Iterator[FixedDate]: The dates in order.
+    """
+    days = monthrange(year, month)[1]
+    year_starts, leap_flags = get_year_table()
+    start = year_starts[year] + 28*(month-1) + (month > _LEAP_DAY_MONTH and leap_flags[year])
+    return map(FixedDate.fromordinal, range(start, start + days))
+
+def monthdayscalendar(year: int, month: int) -> list:
+    """Weeks of the month as lists of days of month.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        list: Four weeks of seven days, followed by `[29]` for leap day and year day.
+    """
+    weeks = [list(week) for week in _WEEKS]
+    if special_day(year, month) is not None:
+        weeks.append([29])
+    return weeks
+
+def monthdatescalendar(year: int, month: int) -> list:
+    """Weeks of the month as lists of dates.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        list: Four weeks of seven FixedDates, followed by a list of only leap day or year day.
+    """
+    dates = list(itermonthdates(year, month))
+    return [dates[start:start+7] for start in range(0, len(dates), 7)]
+
+def yeardatescalendar(year: int, width: int = 3) -> list:
+    """Months of the year as calendars of `monthdatescalendar`, in rows of months.
+
+    Args:
+        year (int): In range 1...9999
+        width (int): Count of months in a row, positive
+
+    Raises:
+        ValueError: Year or width is out of range.
+
+    Returns:
+        list: Rows of at most `width` months.
+    """
+    if width < 1:
+        raise ValueError("Width should be positive")
+    months = [monthdatescalendar(year, month) for month in range(1, 14)]
+    return [months[start:start+width] for start in range(0, 13, width)]
+
+def _month_title(year: int, month: int) -> str:
+    return f"{MONTH_NAMES[month-1]} {year}"
+
+def month_text(year: int, month: int) -> str:
+    """Month as text, like `calendar.month`.
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        str: Lines of the month, 20 characters wide.
+    """
+    special = special_day(year, month)
+    text = _month_title(year, month).center(_TEXT_WIDTH).rstrip() + "\n" + _TEXT_BODY
+    if special is not None:
+        text += "\n" + f"29 {special}".center(_TEXT_WIDTH).rstrip()
+    return text
+
+def year_text(year: int, width: int = 3) -> str:
+    """Year as text, like `calendar.calendar`.
+
+    Args:
+        year (int): In range 1...9999
+        width (int): Count of months side by side, positive
+
+    Raises:
+        ValueError: Year or width is out of range.
+
+    Returns:
+        str: Lines of the months in rows.
+    """
+    if width < 1:
+        raise ValueError("Width should be positive")
+    months = [month_text(year, month).split("\n") for month in range(1, 14)]
+    total_width = width*_TEXT_WIDTH + (width-1)*len(_TEXT_MONTH_SPACING)
+    lines = [str(year).center(total_width).rstrip()]
+    for start in range(0, 13, width):
+        row = months[start:start+width]
+        for line in range(max(len(month) for month in row)):
+            lines.append(_TEXT_MONTH_SPACING.join(
+                (month[line] if line < len(month) else "").ljust(_TEXT_WIDTH)
+                for month in row).rstrip())
+        lines.append("")
+    return "\n".join(lines[:-1])
+
+def month_html(year: int, month: int) -> str:
+    """Month as HTML table, like `calendar.HTMLCalendar.formatmonth`.
+    Cells have the lowercase weekday abbreviations as CSS classes, and
+    the cell of leap day or year day has class "leap-day" or "year-day".
+
+    Args:
+        year (int): In range 1...9999
+        month (int): In range 1...13
+
+    Raises:
+        ValueError: Year or month is out of range.
+
+    Returns:
+        str: The table with class "month".
+    """
+    special = special_day(year, month)
+    html = '<table class="month">\n' \
+        f'<tr><th colspan="7" class="month">{_month_title(year, month)}</th></tr>\n' \
+        + _HTML_BODY + "\n"
+    if special is not None:
+        html += f'<tr><td colspan="7" class="{_HTML_SPECIAL_CLASSES[special]}">' \
+            f'29 {special}</td></tr>\n'
+    return html + "</table>"
@@ -0,0 +1,223 @@
+"""Command line tool converting date columns of CSV and JSON Lines files.
+
+Rows are streamed in chunks, so memory usage does not depend on the size of the input.
+"""
+
+import argparse
+import contextlib
+import csv
+import datetime
+import json
+import sys
+from itertools import islice
+from typing import NamedTuple
+from fixedcal.core.date import FixedDate
+from fixedcal.parallel import TO_IFC, TO_GREGORIAN
+from fixedcal.services.pool import ordered_imap
+
+ISO_FORMAT = "%Y-%m-%d"
+FIELD_NAMES = ("year", "month", "day_of_month", "weekday", "week_of_year", "year_quarter",
+               "is_leap_day", "is_year_day")
+
+class ConversionOptions(NamedTuple):
+    """What to convert and how, passed also to worker processes"""
+    columns: tuple
+    direction: str = TO_IFC
+    fields: bool = False
+    ifc_format: str = ISO_FORMAT
+    gregorian_format: str = ISO_FORMAT
+
+class ConversionError(ValueError):
+    """Value of some row could not be converted.
+
+    Args:
+        row_number (int): Number of the row in the input, starting from 1
+        message (str): Description of the problem
+    """
+
+    def __init__(self, row_number: int, message: str) -> None:
+        super().__init__(row_number, message)
+        self.row_number = row_number
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"row {self.row_number}: {self.message}"
+
+def _parse_gregorian(value: str, gregorian_format: str) -> datetime.date:
+    if gregorian_format == ISO_FORMAT:
+        return datetime.date.fromisoformat(value)
+    return datetime.datetime.strptime(value, gregorian_format).date()
+
+def _format_gregorian(date: datetime.date, gregorian_format: str) -> str:
+    if gregorian_format == ISO_FORMAT:
+        return date.isoformat()
+    return date.strftime(gregorian_format)
+
+def _parse_ifc(value: str, ifc_format: str) -> FixedDate:
+    if ifc_format == ISO_FORMAT:
+        return FixedDate.fromisoformat(value)
+    return FixedDate.parse(value, ifc_format)
+
+def convert_row(row: dict, options: ConversionOptions) -> dict:
+    """Convert the date columns of one row in place.
+    Missing and empty values are left as they are.
+
+    Args:
+        row (dict): Column values keyed with column names
+        options (ConversionOptions): What to convert
+
+    Raises:
+        ValueError: Some value is not a valid date.
+        TypeError: Row is not a dict, such as a JSON line holding an array.
+
+    Returns:
+        dict: The same row.
+    """
+    if not isinstance(row, dict):
+        raise TypeError("row should be an object of column values")
+    for column in options.columns:
+        value = row.get(column)
+        if value is None or value == "":
+            if options.fields:
+                row.update((f"{column}_{name}", None) for name in FIELD_NAMES)
+            continue
+        if options.direction == TO_GREGORIAN:
+            gregorian = _parse_ifc(value, options.ifc_format).date
+            row[column] = _format_gregorian(gregorian, options.gregorian_format)
+            continue
+        fixed_date = FixedDate(_parse_gregorian(value, options.gregorian_format))
+        if options.fields:
+            row.update((f"{column}_{name}", getattr(fixed_date, name)) for name in FIELD_NAMES)
+        elif options.ifc_format == ISO_FORMAT:
+            row[column] = str(fixed_date)
+        else:
+            row[column] = fixed_date.format(options.ifc_format)
+    return row
+
+def convert_chunk(chunk: tuple) -> list:
+    """Convert a chunk of rows, the unit of work of worker processes.
+
+    Args:
+        chunk (tuple): Number of the first row, list of rows and `ConversionOptions`
+
+    Raises:
+        ConversionError: Some value is not a valid date.
+
+    Returns:
+        list: The converted rows.
+    """
+    first_row_number, rows, options = chunk
+    for offset, row in enumerate(rows):
+        try:
+            convert_row(row, options)
+        except (ValueError, TypeError) as error:
+            raise ConversionError(first_row_number + offset, str(error)) from error
+    return rows
+
+def _chunks(rows, chunk_size: int, options: ConversionOptions):
+    rows = iter(rows)
+    row_number = 1
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield (row_number, chunk, options)
+        row_number += len(chunk)
+
+def convert_chunks(chunks, workers: int = 0):
+    """Convert chunks in order, in worker processes if workers is positive.
+    At most two chunks per worker are in progress at the same time.
+
+    Args:
+        chunks (Iterable[tuple]): Chunks as accepted by `convert_chunk`
+        workers (int): Count of worker processes, 0 to convert in this process
+
+    Yields:
+        list: Converted rows of each chunk.
+    """
+    yield from ordered_imap(convert_chunk, chunks, workers, 2*workers)
+
+def _read_jsonl(file):
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+def _convert_csv(input_file, output_file, options: ConversionOptions,
+                 chunk_size: int, workers: int) -> None:
+    reader = csv.DictReader(input_file)
+    fieldnames = list(reader.fieldnames or [])
+    missing = [column for column in options.columns if column not in fieldnames]
+    if missing:
+        raise ValueError(f"columns not found: {', '.join(missing)}")
+    if options.fields:
+        fieldnames += [f"{column}_{name}" for column in options.columns for name in FIELD_NAMES]
+    writer = csv.DictWriter(output_file, fieldnames, lineterminator="\n")
+    writer.writeheader()
+    for rows in convert_chunks(_chunks(reader, chunk_size, options), workers):
+        writer.writerows(rows)
+
+def _convert_jsonl(input_file, output_file, options: ConversionOptions,
+                   chunk_size: int, workers: int) -> None:
+    for rows in convert_chunks(_chunks(_read_jsonl(input_file), chunk_size, options), workers):
+        output_file.write("".join(json.dumps(row) + "\n" for row in rows))
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="fixedcal",
+        description="Convert date columns of CSV or JSON Lines data between "
+                    "Gregorian and International Fixed Calendar.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="input file, standard input by default")
+    parser.add_argument("-c", "--column", action="append", required=True, dest="columns",
+                        help="name of a date column, can be given multiple times")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file, standard output by default")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"),
+                        help="format of the data, deduced from the input file name by default")
+    parser.add_argument("--to-gregorian", action="store_const", const=TO_GREGORIAN,
+                        default=TO_IFC, dest="direction",
+                        help="convert IFC dates to Gregorian instead of the other way around")
+    parser.add_argument("--fields", action="store_true",
+                        help="add IFC fields as new columns instead of replacing the dates")
+    parser.add_argument("--ifc-format", default=ISO_FORMAT,
+                        help="format of IFC dates, see FixedDate.format (default %%Y-%%m-%%d)")
+    parser.add_argument("--gregorian-format", default=ISO_FORMAT,
+                        help="strftime format of Gregorian dates (default %%Y-%%m-%%d)")
+    parser.add_argument("--chunk-size", type=int, default=10000,
+                        help="count of rows converted at once (default 10000)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="count of worker processes, 0 for none (default 0)")
+    return parser
+
+def main(argv=None) -> int:
+    """Entry point of the `fixedcal` command.
+
+    Args:
+        argv (Optional[list]): Command line arguments, `sys.argv` by default
+
+    Returns:
+        int: Exit status, 0 for success and 1 for conversion error.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.fields and args.direction == TO_GREGORIAN:
+        parser.error("--fields can only be used when converting to IFC")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size should be positive")
+    input_format = args.input_format or ("jsonl" if args.input.endswith((".jsonl", ".ndjson"))
+                                         else "csv")
+    options = ConversionOptions(tuple(args.columns), args.direction, args.fields,
+                                args.ifc_format, args.gregorian_format)
+    convert = _convert_jsonl if input_format == "jsonl" else _convert_csv
+
+    with contextlib.ExitStack() as stack:
+        input_file = sys.stdin if args.input == "-" else \
+            stack.enter_context(open(args.input, encoding="utf-8", newline=""))
+        output_file = sys.stdout if args.output == "-" else \
+            stack.enter_context(open(args.output, "w", encoding="utf-8", newline=""))
+        try:
+            convert(input_file, output_file, options, args.chunk_size, args.workers)
+        except ValueError as error:
+            print(f"fixedcal: {error}", file=sys.stderr)
+            return 1
+    return 0
@@ -0,0 +1,208 @@
+"""Compact columns of IFC dates for storage and sharing between processes.
+
+A column stores each date as its proleptic Gregorian ordinal packed into
+a 4-byte integer, the same encoding as `FixedDate.to_bytes`::
+
+    column = FixedDateColumn(dates)
+    column[0], column[10:20]                # FixedDate and a column sharing the memory
+    column.save("dates.ifcd")
+    column = FixedDateColumn.load("dates.ifcd")     # memory-mapped, not read up front
+
+Columns opened with `load`, `frombytes` or pickle are not scanned up front.
+Their ordinals are checked when the dates are accessed, or all at once with `validate`.
+
+The packed ordinals are available as a read-only memoryview in `ordinals`,
+for example for ``numpy.frombuffer(column.ordinals, dtype=numpy.int32)``.
+On Python 3.12 and later, the column itself supports the buffer protocol.
+With pickle protocol 5 the ordinals are passed as an out-of-band buffer,
+so processes can share a column without copying or parsing it::
+
+    buffers = []
+    data = pickle.dumps(column, protocol=5, buffer_callback=buffers.append)
+    column = pickle.loads(data, buffers=buffers)
+
+Bytes are little-endian in files, pickles and `tobytes`, and native in `ordinals`.
+"""
+
+import mmap
+import pickle
+import sys
+from array import array
+from fixedcal.core.date import FixedDate
+from fixedcal.services.ordinals import MIN_ORDINAL, MAX_ORDINAL, PACKED_ORDINAL_SIZE
+
+_FILE_HEADER = b"IFCDATE\x01"           # magic and version, 8 bytes keep the ordinals aligned
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+def _check_range(ordinals) -> None:
+    if len(ordinals) and (min(ordinals) < MIN_ORDINAL or max(ordinals) > MAX_ORDINAL):
+        raise ValueError(f"Ordinals should be in range {MIN_ORDINAL}...{MAX_ORDINAL}")
+
+def _read_only(ordinals: array) -> memoryview:
+    return memoryview(ordinals).toreadonly()
+
+def _unpack(data) -> memoryview:
+    """Native-order view of little-endian packed ordinals, copied only on big-endian hosts."""
+    data = memoryview(data).cast("B")
+    if len(data) % PACKED_ORDINAL_SIZE:
+        raise ValueError(f"Length of packed ordinals should be a multiple of "
+                         f"{PACKED_ORDINAL_SIZE} bytes")
+    if _NATIVE_LITTLE_ENDIAN:
+        ordinals = data.toreadonly().cast("i")
+    else:
+        swapped = array("i", data.tobytes())
+        swapped.byteswap()
+        ordinals = _read_only(swapped)
+    return ordinals
+
+class FixedDateColumn:
+    """Immutable sequence of IFC dates packed as ordinals.
+
+    Args:
+        dates (Iterable[Union[FixedDate, datetime.date]]): The dates
+    """
+
+    __slots__ = ("_ordinals",)
+
+    def __init__(self, dates=()) -> None:
+        self._ordinals = _read_only(array("i", (date.toordinal() for date in dates)))
+
+    @classmethod
+    def _from_view(cls, ordinals: memoryview) -> "FixedDateColumn":
+        column = cls.__new__(cls)
+        column._ordinals = ordinals
+        return column
+
+    @classmethod
+    def from_ordinals(cls, ordinals) -> "FixedDateColumn":
+        """Construct column from proleptic Gregorian ordinals.
+
+        Args:
+            ordinals (Iterable[int]): Ordinals in range 1...3652059
+
+        Raises:
+            ValueError: Some ordinal is out of range.
+
+        Returns:
+            FixedDateColumn: Column of the dates.
+        """
+        ordinals = list(ordinals)
+        _check_range(ordinals)
+        return cls._from_view(_read_only(array("i", ordinals)))
+
+    @classmethod
+    def frombytes(cls, data) -> "FixedDateColumn":
+        """Construct column from the output of `tobytes`. On little-endian hosts
+        the column uses the given buffer without copying, and the buffer should
+        therefore not be modified afterwards. The ordinals are not checked, see `validate`.
+
+        Args:
+            data (bytes-like): Little-endian packed ordinals
+
+        Raises:
+            ValueError: Data is not a whole number of ordinals.
+
+        Returns:
+            FixedDateColumn: Column of the dates.
+        """
+        return cls._from_view(_unpack(data))
+
+    def tobytes(self) -> bytes:
+        """Binary encoding of the column, the concatenation of `FixedDate.to_bytes` of its dates.
+
+        Returns:
+            bytes: Little-endian packed ordinals.
+        """
+        return bytes(self._little_endian())
+
+    def _little_endian(self) -> memoryview:
+        if _NATIVE_LITTLE_ENDIAN:
+            return self._ordinals
+        swapped = array("i", self._ordinals)
+        swapped.byteswap()
+        return _read_only(swapped)
+
+    def validate(self) -> None:
+        """Check that all ordinals of the column are valid dates. This reads the whole column,
+        so prefer calling it once after `load` or `frombytes` of untrusted data
+        over relying on the checks of each accessed date.
+
+        Raises:
+            ValueError: Some ordinal is out of range.
+        """
+        _check_range(self._ordinals)
+
+    @property
+    def ordinals(self) -> memoryview:
+        """Read-only view of the ordinals of the dates as native 4-byte integers"""
+        return self._ordinals
+
+    def __buffer__(self, flags: int) -> memoryview: # pylint: disable=unused-argument
+        # the view is read-only, so requests for writable buffers fail
+        return memoryview(self._ordinals)
+
+    def save(self, path) -> None:
+        """Write the column into a file, to be opened with `load`.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the file
+        """
+        with open(path, "wb") as file:
+            file.write(_FILE_HEADER)
+            file.write(self._little_endian())
+
+    @classmethod
+    def load(cls, path, memory_map: bool = True) -> "FixedDateColumn":
+        """Open a column written with `save`.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the file
+            memory_map (bool): Whether to map the file into memory instead of reading it.
+                Memory-mapped column reads the file lazily and shares its pages
+                with other processes mapping the same file.
+
+        Raises:
+            ValueError: The file is not a saved column.
+
+        Returns:
+            FixedDateColumn: The saved column, with ordinals not checked, see `validate`.
+        """
+        with open(path, "rb") as file:
+            # checked before mapping, which fails for empty files
+            if file.read(len(_FILE_HEADER)) != _FILE_HEADER:
+                raise ValueError("File should be written with FixedDateColumn.save")
+            if memory_map:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                file.seek(0)
+                data = file.read()
+        return cls._from_view(_unpack(memoryview(data)[len(_FILE_HEADER):]))
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        if protocol >= 5:
+            return (type(self).frombytes, (pickle.PickleBuffer(self._little_endian()),))
+        return (type(self).frombytes, (self.tobytes(),))
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            ordinals = self._ordinals[index]
+            if not ordinals.contiguous:
+                ordinals = _read_only(array("i", ordinals))
+            return self._from_view(ordinals)
+        return FixedDate.fromordinal(self._ordinals[index])
+
+    def __iter__(self):
+        return map(FixedDate.fromordinal, self._ordinals)
+
+    def __eq__(self, other: "FixedDateColumn") -> bool:
+        if not isinstance(other, FixedDateColumn):
+            return NotImplemented
+        return self._ordinals == other._ordinals
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FixedDateColumn(length={len(self)})"
@@ -1,21 +1,38 @@
-"""Module containing class for IFC date"""
+"""Module containing class for IFC date and clock telling the current date"""
 
 import datetime
-from fixedcal.services.leap_days import is_leap_year,\
-    gregorian_leap_days_between, fixed_leap_days_between
-
-class FixedDate:
+import time
+from fixedcal.services.leap_days import is_leap_year, leap_days_before,\
+    GREGORIAN_LEAP_DAY_OF_YEAR, FIXED_LEAP_DAY_OF_YEAR
+from fixedcal.services.ordinals import year_start_ordinal, year_and_day_of_year,\
+    fixed_fields, MIN_ORDINAL, MAX_ORDINAL, PACKED_ORDINAL_SIZE
+from fixedcal.services.year_table import get_year_table
+from fixedcal.services.cache import LRUCache, CacheInfo
+from fixedcal.services.validation import FieldError, check_error_mode, field_error,\
+    RAISE, MASK
+from fixedcal.services.formatting import compile_formatter, compile_parser, parsed_fields,\
+    iso_string
+
+DEFAULT_CACHE_SIZE = 4096
+
+class FixedDate: # pylint: disable=too-many-public-methods
     """IFC date
 
-    Construct the date by passing either date argument or
-    both day_of_year and year arguments.
+    Construct the date by passing either date argument,
+    all day, month and year arguments or both day_of_year and year arguments.
+    Instances are immutable and hashable.
 
     Args:
         date (Optional[datetime.date]): Gregorian date that will be represented
         day_of_year (Optional[int]): The ordinal of the date in year. In range 1...366.
+        day (Optional[int]): Day of month in range 1...29.
+        month (Optional[int]): Month in range 1...13.
         year (Optional[int]): The year in range 1...9999.
     """
 
+    __slots__ = ("_ordinal", "_year", "_day_of_year", "_month", "_day_of_month",
+                 "_is_leap_year")
+
     def __init__(self,
                 date: datetime.date = None,
                 day_of_year: int = None,
@@ -31,21 +48,35 @@ class FixedDate:
         else:
             raise ValueError("Invalid FixedDate initialization")
 
-        self._day_of_year, self._year = init_tuple
+        self._set_fields(*init_tuple)
+
+    def _set_fields(self, day_of_year: int, year: int) -> None:
+        """Store the date and derive its month and day of month once.
+
+        Args:
+            day_of_year (int): In range 1...366
+            year (int): In range 1...9999
+        """
+        self._ordinal, self._month, self._day_of_month, self._is_leap_year = \
+            fixed_fields(day_of_year, year)
+        self._year = year
+        self._day_of_year = day_of_year
 
     def _from_datetime(self, date: datetime.date) -> tuple:
         """Initialize this class with native datetime object.
 
         Args:
-            date (datetime.date): _description_
+            date (datetime.date): Gregorian date
 
         Returns:
             tuple: day of year (1...366) and year (1...9999) in a tuple
         """
-        day_of_year = date.timetuple().tm_yday
-        return self._from_day_of_year(day_of_year, date.year)
+        day_of_year = date.toordinal() - year_start_ordinal(date.year) + 1
+        return (day_of_year, date.year)
 
     def _from_fixed_date(self, day: int, month: int, year: int) -> tuple:
+        if year < 1 or year > 9999:
+            raise ValueError("Parameter year should be in range 1...9999")
         is_this_leap_year = is_leap_year(year)
 
         maximum_allowed_day = 29 if (is_this_leap_year and month == 6) or month == 13 else 28
@@ -69,16 +100,208 @@ class FixedDate:
         Returns:
             tuple: day of year (1...366) and year (1...9999) in a tuple
         """
+        if year < 1 or year > 9999:
+            raise ValueError("Parameter year should be in range 1...9999")
+        days_in_year = 366 if is_leap_year(year) else 365
+        if day_of_year < 1 or day_of_year > days_in_year:
+            raise ValueError(f"Parameter day_of_year should be in range 1...{days_in_year}")
         return (day_of_year, year)
 
+    @classmethod
+    def _from_fields(cls, day_of_year: int, year: int) -> "FixedDate":
+        """Construct fixed date from already validated day of year and year."""
+        fixed_date = cls.__new__(cls)
+        fixed_date._set_fields(day_of_year, year)
+        return fixed_date
+
+    @staticmethod
+    def from_fields_many(days, months, years, errors: str = RAISE):
+        """Validate and convert many IFC dates given as columns of fields at once.
+        For NumPy arrays, `fixedcal.vectorized.from_fixed_fields` is faster.
+
+        Args:
+            days (Sequence[int]): Days of month in range 1...29
+            months (Sequence[int]): Months in range 1...13
+            years (Sequence[int]): Years in range 1...9999
+            errors (str): What to do with invalid rows: "raise" raises ValueError
+                on the first one, "mask" and "collect" give them ordinal 0 and
+                report them as an error mask or a list of `FieldError`s.
+
+        Raises:
+            ValueError: The columns have different lengths, the error mode is unknown,
+                or some row is invalid and errors is "raise".
+
+        Returns:
+            Union[list, tuple]: With "raise", the list of proleptic ordinals of the dates.
+            With "mask", the ordinals and a list of booleans telling which rows are invalid.
+            With "collect", the ordinals and a list of `FieldError`s of the invalid rows.
+        """
+        check_error_mode(errors)
+        columns = [column.tolist() if hasattr(column, "tolist") else column
+                   for column in (days, months, years)]
+        if not len(columns[0]) == len(columns[1]) == len(columns[2]):
+            raise ValueError("Parameters days, months and years should have equal lengths")
+
+        year_starts, leap_flags = get_year_table()
+        ordinals = []
+        invalid_rows = []
+        for index, (day, month, year) in enumerate(zip(*columns)):
+            message = field_error(day, month, year, leap_flags)
+            if message is None:
+                ordinals.append(year_starts[year] + 28*(month-1) + day - 1
+                                + (month > 6 and leap_flags[year]))
+            elif errors == RAISE:
+                raise ValueError(f"Invalid date on row {index}: {message}")
+            else:
+                ordinals.append(0)
+                invalid_rows.append(FieldError(index, message))
+
+        if errors == RAISE:
+            return ordinals
+        if errors == MASK:
+            return ordinals, [ordinal == 0 for ordinal in ordinals]
+        return ordinals, invalid_rows
+
+    @classmethod
+    def fromordinal(cls, ordinal: int) -> "FixedDate":
+        """Initialize fixed date from its proleptic ordinal.
+        Ordinal 1 is the first day of year 1, which is the same day
+        in both IFC and Gregorian calendar, and therefore the ordinal
+        matches the one of `datetime.date`.
+
+        Args:
+            ordinal (int): In range 1...3652059
+
+        Raises:
+            ValueError: Ordinal is out of range.
+
+        Returns:
+            FixedDate: Fixed date with the given ordinal.
+        """
+        if ordinal < MIN_ORDINAL or ordinal > MAX_ORDINAL:
+            raise ValueError(f"Ordinal should be in range {MIN_ORDINAL}...{MAX_ORDINAL}")
+        year, day_of_year = year_and_day_of_year(ordinal)
+        return cls._from_fields(day_of_year, year)
+
+    def toordinal(self) -> int:
+        """Proleptic ordinal of the date, where the first day of year 1 has ordinal 1.
+
+        Returns:
+            int: Ordinal equal to `self.date.toordinal()`.
+        """
+        return self._ordinal
+
+    def to_bytes(self) -> bytes:
+        """Compact binary encoding of the date: its ordinal as
+        a 4-byte little-endian signed integer.
+
+        Returns:
+            bytes: The encoded date, to be decoded with `from_bytes`.
+        """
+        return self._ordinal.to_bytes(PACKED_ORDINAL_SIZE, "little", signed=True)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "FixedDate":
+        """Decode a date encoded with `to_bytes`.
+
+        Args:
+            data (bytes): Exactly 4 bytes
+
+        Raises:
+            ValueError: Data has wrong length or the ordinal is out of range.
+
+        Returns:
+            FixedDate: The decoded date.
+        """
+        if len(data) != PACKED_ORDINAL_SIZE:
+            raise ValueError(f"Encoded date should be {PACKED_ORDINAL_SIZE} bytes long")
+        return cls.fromordinal(int.from_bytes(data, "little", signed=True))
+
     @classmethod
     def today(cls) -> "FixedDate":
-        """Initialize fixed date representing today.
+        """Fixed date representing today, told by the default clock,
+        see `set_default_clock`.
 
         Returns:
             FixedDate: Today as fixed date.
         """
-        return FixedDate(date=datetime.date.today())
+        date = _default_clock.today()
+        if cls is not FixedDate:
+            return cls._from_fields(date.day_of_year, date.year)
+        return date
+
+    @staticmethod
+    def cached(date: datetime.date) -> "FixedDate":
+        """Fixed date shared from the global cache of recently used dates.
+        Cheaper than constructing a new instance when the same dates are needed repeatedly.
+        The cache is bounded and evicts the least recently used dates,
+        see `configure_cache`.
+
+        Args:
+            date (Union[datetime.date, FixedDate]): The date
+
+        Raises:
+            ValueError: The date is neither native date nor fixed date.
+
+        Returns:
+            FixedDate: Equal fixed date, the same instance for the same date while cached.
+        """
+        if not isinstance(date, (datetime.date, FixedDate)):
+            raise ValueError("Parameter date should be datetime.date or FixedDate")
+        return _cache.get(date.toordinal())
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Statistics of the cache used by `cached`.
+
+        Returns:
+            CacheInfo: Hits, misses, maximum size and current size.
+        """
+        return _cache.info()
+
+    @staticmethod
+    def configure_cache(maxsize: int = DEFAULT_CACHE_SIZE, clear: bool = False) -> None:
+        """Change the size of the cache used by `cached`.
+
+        Args:
+            maxsize (int): Maximum count of cached dates, positive
+            clear (bool): Whether to remove all cached dates and reset the statistics
+
+        Raises:
+            ValueError: Size is not positive.
+        """
+        _cache.resize(maxsize)
+        if clear:
+            _cache.clear()
+
+    @staticmethod
+    def default_clock() -> "FixedClock":
+        """The clock used by `today`.
+
+        Returns:
+            FixedClock: The default clock.
+        """
+        return _default_clock
+
+    @staticmethod
+    def set_default_clock(clock: "FixedClock") -> "FixedClock":
+        """Replace the clock used by `today`, for example with a clock
+        having a fixed time source in tests.
+
+        Args:
+            clock (FixedClock): The new default clock
+
+        Raises:
+            ValueError: The clock is not FixedClock.
+
+        Returns:
+            FixedClock: The previous default clock, to be restored later.
+        """
+        global _default_clock # pylint: disable=global-statement
+        if not isinstance(clock, FixedClock):
+            raise ValueError("Parameter clock should be FixedClock")
+        previous, _default_clock = _default_clock, clock
+        return previous
 
     @property
     def is_leap_year(self) -> bool:
@@ -87,7 +310,7 @@ class FixedDate:
         Returns:
             bool: Is this leap year
         """
-        return is_leap_year(self._year)
+        return self._is_leap_year
 
     @property
     def is_leap_day(self) -> bool:
@@ -96,7 +319,7 @@ class FixedDate:
         Returns:
             bool: Whether this is a leap day
         """
-        return self.is_leap_year and self._day_of_year == 169
+        return self._day_of_month == 29 and self._month == 6
 
     @property
     def date(self) -> datetime.date:
@@ -105,7 +328,7 @@ class FixedDate:
         Returns:
             datetime.date: Native date equal to the fixed date.
         """
-        return datetime.date(self.year, 1, 1) + datetime.timedelta(self._day_of_year-1)
+        return datetime.date.fromordinal(self._ordinal)
 
     @property
     def day_of_year(self) -> int:
@@ -119,20 +342,12 @@ class FixedDate:
     @property
     def day_of_month(self):
         """In range 1...29"""
-        if self.is_leap_day or self.is_year_day:
-            return 29
-        if self.is_leap_year and self.day_of_year > 169: # leap day past this year
-            return ((self._day_of_year-2) % 28) + 1
-        return ((self._day_of_year-1) % 28) + 1
+        return self._day_of_month
 
     @property
     def month(self):
         """In range 1...13"""
-        if self.is_leap_day:
-            return 6
-        if self.is_year_day:
-            return 13
-        return ((self._day_of_year-1) // 28) + 1
+        return self._month
 
     @property
     def year(self):
@@ -146,9 +361,7 @@ class FixedDate:
         Returns:
             bool: Is the day year day
         """
-        if self.is_leap_year:
-            return self._day_of_year == 366
-        return self._day_of_year == 365
+        return self._day_of_month == 29 and self._month == 13
 
     @property
     def week_of_month(self) -> int:
@@ -157,9 +370,9 @@ class FixedDate:
         Returns:
             int: In range 1...4
         """
-        if self.is_leap_day or self.is_year_day:
+        if self._day_of_month == 29:    # leap day or year day
             return 4
-        return ((self.day_of_month-1) // 7) + 1
+        return ((self._day_of_month-1) // 7) + 1
 
     @property
     def weekday(self) -> int:
@@ -169,9 +382,9 @@ class FixedDate:
             Optional[int]: 1 for Sunday, 2 for Monday, 7 for Saturday
             None for leap day and year day.
         """
-        if self.is_leap_day or self.is_year_day:
+        if self._day_of_month == 29:    # leap day or year day
             return None
-        return ((self.day_of_month-1) % 7) + 1
+        return ((self._day_of_month-1) % 7) + 1
 
     @property
     def week_of_year(self) -> int:
@@ -180,11 +393,9 @@ class FixedDate:
         Returns:
             int: In range 1...52
         """
-        if self.is_leap_day:
-            return 24
-        if self.is_year_day:
-            return 52
-        return ((self._day_of_year-1) // 7) + 1
+        if self._day_of_month == 29:    # leap day or year day
+            return 24 if self._month == 6 else 52
+        return 4*(self._month-1) + ((self._day_of_month-1) // 7) + 1
 
     @property
     def year_quarter(self) -> int:
@@ -193,17 +404,35 @@ class FixedDate:
         Returns:
             int: In range 1...4
         """
-        if self.is_year_day:
-            return 4
-        return ((self.day_of_year-1) // 91) + 1
+        return ((self.week_of_year-1) // 13) + 1
 
     def __eq__(self, other: "FixedDate") -> bool:
-        return self._day_of_year == other.day_of_year and self._year == other.year
+        if not isinstance(other, FixedDate):
+            return NotImplemented
+        return self._ordinal == other._ordinal
+
+    def __lt__(self, other: "FixedDate") -> bool:
+        if not isinstance(other, FixedDate):
+            return NotImplemented
+        return self._ordinal < other._ordinal
+
+    def __le__(self, other: "FixedDate") -> bool:
+        if not isinstance(other, FixedDate):
+            return NotImplemented
+        return self._ordinal <= other._ordinal
 
     def __gt__(self, other: "FixedDate") -> bool:
-        if self._year == other.year:
-            return self._day_of_year > other.day_of_year
-        return self._year > other.year
+        if not isinstance(other, FixedDate):
+            return NotImplemented
+        return self._ordinal > other._ordinal
+
+    def __ge__(self, other: "FixedDate") -> bool:
+        if not isinstance(other, FixedDate):
+            return NotImplemented
+        return self._ordinal >= other._ordinal
+
+    def __hash__(self) -> int:
+        return hash(self._ordinal)
 
     def __add__(self, other: datetime.timedelta) -> "FixedDate":
         """Addition of FixedDate and timedelta.
@@ -215,8 +444,11 @@ class FixedDate:
         Returns:
             FixedDate: New FixedDate instance that will hold the new date.
         """
-        new_date = self.date + other
-        return FixedDate(date=new_date)
+        if isinstance(other, datetime.timedelta):
+            return self.add_days(other.days)
+        return NotImplemented
+
+    __radd__ = __add__
 
     def __sub__(self, other):
         """Subtraction of FixedDate and some other value.
@@ -230,24 +462,270 @@ class FixedDate:
 
         Returns:
             Union[FixedDate, datetime.timedelta]: With FixedDate as argument,
-            timedelta will be returned representing the difference of given fixed dates.
-            With timedelta as argument, new FixedDate will be returned.
+            timedelta will be returned representing the difference of given fixed dates,
+            negative if the given date is later. With timedelta as argument,
+            new FixedDate will be returned.
         """
         if isinstance(other, FixedDate):
-            difference = self.date - other.date
-            greg_leap_days = gregorian_leap_days_between(self.date, other.date)
-            fixed_leap_days = fixed_leap_days_between(self.date, other.date)
-            return difference + datetime.timedelta(fixed_leap_days - greg_leap_days)
+            difference = self._ordinal - other._ordinal
+            # leap days in between are negative when the other date is later
+            greg_leap_days = self._leap_days_before(GREGORIAN_LEAP_DAY_OF_YEAR) \
+                - other._leap_days_before(GREGORIAN_LEAP_DAY_OF_YEAR)
+            fixed_leap_days = self._leap_days_before(FIXED_LEAP_DAY_OF_YEAR) \
+                - other._leap_days_before(FIXED_LEAP_DAY_OF_YEAR)
+            return datetime.timedelta(difference + fixed_leap_days - greg_leap_days)
         if isinstance(other, datetime.timedelta):
-            new_date = self.date - other
-            return FixedDate(date=new_date)
+            return self.add_days(-other.days)
         raise ValueError("Invalid subtractor type, expected FixedDate or timedelta")
 
+    def _leap_days_before(self, leap_day_of_year: int) -> int:
+        return leap_days_before(self._year, self._day_of_year, leap_day_of_year)
+
+    def add_days(self, days: int) -> "FixedDate":
+        """New fixed date the given number of days later.
+
+        Args:
+            days (int): Count of days, negative to go backwards.
+
+        Raises:
+            OverflowError: The result is outside of years 1...9999.
+
+        Returns:
+            FixedDate: The new date.
+        """
+        ordinal = self._ordinal + days
+        if ordinal < MIN_ORDINAL or ordinal > MAX_ORDINAL:
+            raise OverflowError("Result is out of range of years 1...9999")
+        year, day_of_year = year_and_day_of_year(ordinal)
+        return self._from_fields(day_of_year, year)
+
+    def add_weeks(self, weeks: int) -> "FixedDate":
+        """New fixed date the given number of IFC weeks later.
+        Leap days and year days do not belong to any week and are skipped,
+        so the result has always the same weekday.
+        Leap day and year day themselves count as the 28th day of their month.
+
+        Args:
+            weeks (int): Count of weeks, negative to go backwards.
+
+        Raises:
+            OverflowError: The result is outside of years 1...9999.
+
+        Returns:
+            FixedDate: The new date.
+        """
+        day_of_month = min(self._day_of_month, 28)
+        week_day_index = 364*(self._year-1) + 28*(self._month-1) + day_of_month-1 + 7*weeks
+        year_index, day_in_year = divmod(week_day_index, 364)
+        return self._add_to_fields(day_in_year % 28 + 1, day_in_year // 28 + 1, year_index+1)
+
+    def add_months(self, months: int) -> "FixedDate":
+        """New fixed date the given number of IFC months later.
+        Day 29 is clamped to 28 when the new month has no leap day or year day.
+
+        Args:
+            months (int): Count of months, negative to go backwards.
+
+        Raises:
+            OverflowError: The result is outside of years 1...9999.
+
+        Returns:
+            FixedDate: The new date.
+        """
+        year_index, month_index = divmod(13*(self._year-1) + self._month-1 + months, 13)
+        return self._add_to_fields(self._day_of_month, month_index+1, year_index+1)
+
+    def add_years(self, years: int) -> "FixedDate":
+        """New fixed date with the same month and day the given number of years later.
+        Leap day is clamped to 28th June when the new year is not a leap year.
+
+        Args:
+            years (int): Count of years, negative to go backwards.
+
+        Raises:
+            OverflowError: The result is outside of years 1...9999.
+
+        Returns:
+            FixedDate: The new date.
+        """
+        return self._add_to_fields(self._day_of_month, self._month, self._year+years)
+
+    def _add_to_fields(self, day: int, month: int, year: int) -> "FixedDate":
+        """Construct the result of calendar arithmetic, clamping day 29 when needed."""
+        if year < 1 or year > 9999:
+            raise OverflowError("Result is out of range of years 1...9999")
+        if day == 29 and month != 13 and not (month == 6 and is_leap_year(year)):
+            day = 28
+        return self._from_fields(*self._from_fixed_date(day, month, year))
+
+    @classmethod
+    def fromisoformat(cls, date_string: str) -> "FixedDate":
+        """Initialize fixed date from its string representation YYYY-MM-DD.
+
+        Args:
+            date_string (str): Date as returned by `str`
+
+        Raises:
+            ValueError: The string is not a valid fixed date.
+
+        Returns:
+            FixedDate: The parsed date.
+        """
+        if len(date_string) != 10 or date_string[4] != "-" or date_string[7] != "-":
+            raise ValueError(f"Invalid isoformat string: {date_string!r}")
+        year, month, day = date_string[:4], date_string[5:7], date_string[8:]
+        if not (year + month + day).isdigit() or not date_string.isascii():
+            raise ValueError(f"Invalid isoformat string: {date_string!r}")
+        return cls(day=int(day), month=int(month), year=int(year))
+
+    @classmethod
+    def parse(cls, date_string: str, format_string: str = "%Y-%m-%d") -> "FixedDate":
+        """Initialize fixed date from a string in the given format.
+        See `format` for the supported directives.
+        The format must contain year and either day of year or day and month.
+
+        Args:
+            date_string (str): The string to be parsed
+            format_string (str): The format of the string
+
+        Raises:
+            ValueError: The string does not match the format or is not a valid date.
+
+        Returns:
+            FixedDate: The parsed date.
+        """
+        pattern, needs_verification = compile_parser(format_string)
+        match = pattern.fullmatch(date_string)
+        if match is None:
+            raise ValueError(f"{date_string!r} does not match format {format_string!r}")
+        fixed_date = cls(**parsed_fields(match))
+        if needs_verification and fixed_date.format(format_string) != date_string:
+            raise ValueError(f"{date_string!r} is not consistent with format {format_string!r}")
+        return fixed_date
+
+    @classmethod
+    def parse_many(cls, date_strings, format_string: str = "%Y-%m-%d") -> list:
+        """Parse multiple strings in the same format.
+
+        Args:
+            date_strings (Iterable[str]): The strings to be parsed
+            format_string (str): The format of the strings
+
+        Raises:
+            ValueError: Some string does not match the format or is not a valid date.
+
+        Returns:
+            list: Parsed fixed dates in the same order.
+        """
+        if format_string == "%Y-%m-%d":
+            return [cls.fromisoformat(date_string) for date_string in date_strings]
+        return [cls.parse(date_string, format_string) for date_string in date_strings]
+
+    def format(self, format_string: str) -> str:
+        """Format the date like `datetime.date.strftime` but with IFC fields.
+
+        Supported directives are %Y (year), %m (month 01...13), %d (day of month 01...29),
+        %j (day of year), %B (month name, Sol for the 7th month), %b (abbreviated month name),
+        %A (weekday name, "Leap Day" or "Year Day" for those days), %a (abbreviated weekday name),
+        %u (weekday 1...7, 0 for leap day and year day), %W (week of year 01...52),
+        %w (week of month), %q (quarter) and %% (percent sign).
+        Compiled formats are cached.
+
+        Args:
+            format_string (str): The format
+
+        Raises:
+            ValueError: Format string contains unknown directive.
+
+        Returns:
+            str: The formatted date.
+        """
+        template, getters = compile_formatter(format_string)
+        return template.format(*[getter(self) for getter in getters])
+
+    @staticmethod
+    def format_many(dates, format_string: str) -> list:
+        """Format multiple dates with the same format.
+
+        Args:
+            dates (Iterable[FixedDate]): The dates to be formatted
+            format_string (str): The format, see `format`
+
+        Returns:
+            list: Formatted strings in the same order.
+        """
+        template, getters = compile_formatter(format_string)
+        template_format = template.format
+        return [template_format(*[getter(date) for getter in getters]) for date in dates]
+
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec:
+            return str(self)
+        return self.format(format_spec)
+
     def __str__(self) -> str:
         """String representation of fixed date.
-        For year day, month is 14 and date 1.
+        For leap day and year day, date is 29.
 
         Returns:
             str: Date as YYYY-MM-DD
         """
-        return f"{self._year:04.0f}-{self.month:02.0f}-{self.day_of_month:02.0f}"
+        return iso_string(self._year, self._month, self._day_of_month)
+
+class FixedClock:
+    """Clock telling the current IFC date. The date is cached and recomputed
+    only when the time source passes the next midnight, or goes back
+    before the previous one. Instances are safe to share between threads and tasks.
+
+    Args:
+        time_source (Callable[[], float]): Function returning the current POSIX timestamp,
+            `time.time` by default. Useful for tests and simulations.
+        tz (Optional[datetime.tzinfo]): Timezone of the dates, None for local time
+    """
+
+    __slots__ = ("_time_source", "_tz", "_state")
+
+    def __init__(self, time_source=time.time, tz: datetime.tzinfo = None) -> None:
+        if tz is not None and not isinstance(tz, datetime.tzinfo):
+            raise ValueError("Parameter tz should be datetime.tzinfo or None")
+        self._time_source = time_source
+        self._tz = tz
+        # the date and the timestamps of its beginning and end, replaced as a whole
+        # so that concurrent readers always see a consistent state
+        self._state = (0.0, 0.0, None)
+
+    @property
+    def tz(self) -> datetime.tzinfo:
+        """Timezone of the dates, None for local time"""
+        return self._tz
+
+    def today(self) -> FixedDate:
+        """The current date.
+
+        Returns:
+            FixedDate: Today as fixed date, the same instance until the day changes.
+        """
+        now = self._time_source()
+        start, end, date = self._state
+        if start <= now < end:
+            return date
+        return self._refresh(now)
+
+    def _refresh(self, now: float) -> FixedDate:
+        moment = datetime.datetime.fromtimestamp(now, self._tz)
+        midnight = datetime.datetime.combine(moment.date(), datetime.time(), moment.tzinfo)
+        date = FixedDate(moment.date())
+        try:
+            # wall-clock arithmetic gives the next midnight even across DST transitions
+            end = (midnight + datetime.timedelta(days=1)).timestamp()
+        except OverflowError:               # today is the last day of year 9999
+            end = float("inf")
+        self._state = (midnight.timestamp(), end, date)
+        return date
+
+    def __repr__(self) -> str:
+        return f"FixedClock(time_source={self._time_source!r}, tz={self._tz!r})"
+
+_default_clock = FixedClock()
+
+_cache = LRUCache(FixedDate.fromordinal, DEFAULT_CACHE_SIZE)
@@ -0,0 +1,150 @@
+"""Module containing range class for IFC dates"""
+
+from fixedcal.core.date import FixedDate
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+
+_UNIT_LENGTHS = {DAY: 1, WEEK: 7, MONTH: 28}
+
+class FixedDateRange:
+    """Lazy range of IFC dates, modeled after the built-in `range`.
+
+    Dates are generated from start (inclusive) to stop (exclusive) with the given step.
+    Steps are counted in days, IFC weeks (7 days) or IFC months (28 days).
+    Leap day and year day do not belong to any week or month and therefore
+    week and month steps skip them and never produce them.
+    Day steps treat them like any other day.
+
+    Args:
+        start (FixedDate): The first date of the range
+        stop (FixedDate): The date that ends the range, not itself included
+        step (int): Count of units between consecutive dates, negative to go backwards
+        unit (str): One of "day", "week" and "month"
+
+    Raises:
+        ValueError: Step is zero or unit is unknown.
+    """
+
+    def __init__(self, start: FixedDate, stop: FixedDate, step: int = 1, unit: str = DAY) -> None:
+        if unit not in _UNIT_LENGTHS:
+            raise ValueError(f"Unit should be one of {', '.join(_UNIT_LENGTHS)}")
+        if step == 0:
+            raise ValueError("Step should not be zero")
+
+        if unit == DAY:
+            start_index, stop_index = start.toordinal(), stop.toordinal()
+        else:
+            start_index = self._regular_day_index(start, step > 0)
+            stop_index = self._regular_day_index(stop, step > 0)
+        self._unit = unit
+        self._range = range(start_index, stop_index, step * _UNIT_LENGTHS[unit])
+
+    @classmethod
+    def _from_range(cls, indices: range, unit: str) -> "FixedDateRange":
+        date_range = cls.__new__(cls)
+        date_range._unit = unit
+        date_range._range = indices
+        return date_range
+
+    @staticmethod
+    def _regular_day_index(date: FixedDate, round_up: bool) -> int:
+        """Index of the date when counting only the days belonging to some month.
+        Leap day and year day get the index of the following regular day
+        when rounding up and the index of the preceding one otherwise.
+        """
+        index = 364*(date.year-1) + 28*(date.month-1) + date.day_of_month-1
+        if date.day_of_month == 29:
+            return index if round_up else index-1
+        return index
+
+    def _date_at(self, index: int) -> FixedDate:
+        if self._unit == DAY:
+            return FixedDate.fromordinal(index)
+        year_index, day_in_year = divmod(index, 364)
+        return FixedDate(day=day_in_year % 28 + 1, month=day_in_year // 28 + 1, year=year_index+1)
+
+    def _index_of(self, date: FixedDate):
+        """Index of the date in the underlying range or None if it never appears"""
+        if self._unit == DAY:
+            return date.toordinal()
+        if date.day_of_month == 29:
+            return None
+        return self._regular_day_index(date, True)
+
+    @property
+    def step(self) -> int:
+        """Count of units between consecutive dates.
+
+        Returns:
+            int: Step, negative for descending ranges.
+        """
+        return self._range.step // _UNIT_LENGTHS[self._unit]
+
+    @property
+    def unit(self) -> str:
+        """Unit of the step.
+
+        Returns:
+            str: One of "day", "week" and "month".
+        """
+        return self._unit
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __iter__(self):
+        date_at = self._date_at
+        for index in self._range:
+            yield date_at(index)
+
+    def __reversed__(self):
+        date_at = self._date_at
+        for index in reversed(self._range):
+            yield date_at(index)
+
+    def __contains__(self, date) -> bool:
+        if not isinstance(date, FixedDate):
+            return False
+        index = self._index_of(date)
+        return index is not None and index in self._range
+
+    def __getitem__(self, key):
+        """Date at the given position or a new range for a slice.
+
+        Raises:
+            IndexError: Position is out of range.
+        """
+        if isinstance(key, slice):
+            return self._from_range(self._range[key], self._unit)
+        return self._date_at(self._range[key])
+
+    def index(self, date: FixedDate) -> int:
+        """Position of the date in this range.
+
+        Args:
+            date (FixedDate): The searched date
+
+        Raises:
+            ValueError: The date is not in this range.
+
+        Returns:
+            int: Position starting from zero.
+        """
+        if date not in self:
+            raise ValueError(f"{date} is not in range")
+        return self._range.index(self._index_of(date))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FixedDateRange):
+            return NotImplemented
+        return self._unit == other.unit and self._range == other._range
+
+    def __hash__(self) -> int:
+        return hash((self._unit, self._range))
+
+    def __repr__(self) -> str:
+        if len(self._range) == 0:
+            return f"FixedDateRange(empty, step={self.step}, unit={self._unit!r})"
+        return f"FixedDateRange({self[0]}...{self[-1]}, step={self.step}, unit={self._unit!r})"
@@ -0,0 +1,271 @@
+"""Module containing class for IFC date with time of day"""
+
+import datetime
+import math
+from fixedcal.core.date import FixedDate
+from fixedcal.services.ordinals import MIN_ORDINAL, MAX_ORDINAL
+
+_EPOCH_ORDINAL = 719163     # ordinal of 1970-01-01
+
+class FixedDateTime:
+    """IFC date with time of day and optional timezone.
+
+    Args:
+        date (FixedDate): The date
+        time (datetime.time): Time of day with timezone, or without it for naive local time.
+            Midnight by default.
+
+    Raises:
+        ValueError: Parameters are of wrong type.
+    """
+
+    __slots__ = ("_date", "_time")
+
+    def __init__(self, date: FixedDate, time: datetime.time = datetime.time()) -> None:
+        if not isinstance(date, FixedDate):
+            raise ValueError("Parameter date should be FixedDate")
+        if not isinstance(time, datetime.time):
+            raise ValueError("Parameter time should be datetime.time")
+        self._date = date
+        self._time = time
+
+    @classmethod
+    def _from_parts(cls, date: FixedDate, time: datetime.time) -> "FixedDateTime":
+        date_time = cls.__new__(cls)
+        date_time._date = date
+        date_time._time = time
+        return date_time
+
+    @classmethod
+    def fromdatetime(cls, date_time: datetime.datetime) -> "FixedDateTime":
+        """Initialize from native datetime, keeping its timezone.
+
+        Args:
+            date_time (datetime.datetime): Gregorian date and time
+
+        Returns:
+            FixedDateTime: The same moment in IFC.
+        """
+        return cls._from_parts(FixedDate.fromordinal(date_time.toordinal()), date_time.timetz())
+
+    @classmethod
+    def fromtimestamp(cls, timestamp: float, tz: datetime.tzinfo = None) -> "FixedDateTime":
+        """Initialize from POSIX timestamp.
+        Timestamps in fixed-offset timezones such as `datetime.timezone.utc`
+        are split into days, seconds and microseconds directly, whereas other timezones
+        go through `datetime.datetime.fromtimestamp`. Both round fractions of
+        float timestamps to the nearest microsecond, ties to even.
+
+        Args:
+            timestamp (float): Seconds since 1970-01-01 00:00 UTC
+            tz (Optional[datetime.tzinfo]): Timezone of the result, None for naive local time
+
+        Raises:
+            ValueError: The moment is outside of years 1...9999.
+
+        Returns:
+            FixedDateTime: The moment in IFC.
+        """
+        if not isinstance(tz, datetime.timezone) or not isinstance(timestamp, (int, float)) \
+                or (isinstance(timestamp, float) and not math.isfinite(timestamp)):
+            return cls.fromdatetime(datetime.datetime.fromtimestamp(timestamp, tz))
+
+        microsecond = 0
+        if isinstance(timestamp, float):
+            fraction, whole = math.modf(timestamp)
+            timestamp = int(whole)
+            microsecond = round(fraction * 1000000)
+            # rounding may reach a whole second, and negative fractions borrow one
+            if microsecond >= 1000000:
+                timestamp += 1
+                microsecond -= 1000000
+            elif microsecond < 0:
+                timestamp -= 1
+                microsecond += 1000000
+        offset = tz.utcoffset(None)
+        days, seconds = divmod(timestamp + offset.days*86400 + offset.seconds, 86400)
+        ordinal = days + _EPOCH_ORDINAL
+        if ordinal < MIN_ORDINAL or ordinal > MAX_ORDINAL:
+            raise ValueError("Timestamp is out of range of years 1...9999")
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        return cls._from_parts(FixedDate.fromordinal(ordinal),
+                               datetime.time(hour, minute, second, microsecond, tz))
+
+    @classmethod
+    def fromtimestamp_many(cls, timestamps, tz: datetime.tzinfo = None) -> list:
+        """Initialize multiple dates from POSIX timestamps, see `fromtimestamp`.
+        For NumPy arrays, `fixedcal.vectorized.timestamps_to_fixed_fields` is faster.
+
+        Args:
+            timestamps (Iterable[float]): Seconds since 1970-01-01 00:00 UTC
+            tz (Optional[datetime.tzinfo]): Timezone of the results
+
+        Returns:
+            list: The moments in IFC in the same order.
+        """
+        return [cls.fromtimestamp(timestamp, tz) for timestamp in timestamps]
+
+    @classmethod
+    def now(cls, tz: datetime.tzinfo = None) -> "FixedDateTime":
+        """Current moment.
+
+        Args:
+            tz (Optional[datetime.tzinfo]): Timezone of the result, None for naive local time
+
+        Returns:
+            FixedDateTime: Current date and time.
+        """
+        return cls.fromdatetime(datetime.datetime.now(tz))
+
+    def to_datetime(self) -> datetime.datetime:
+        """Construct a native datetime object.
+
+        Returns:
+            datetime.datetime: The same moment in Gregorian calendar.
+        """
+        return datetime.datetime.combine(self._date.date, self._time)
+
+    def timestamp(self) -> float:
+        """POSIX timestamp of the moment. Naive times are considered local time.
+
+        Returns:
+            float: Seconds since 1970-01-01 00:00 UTC.
+        """
+        tz = self._time.tzinfo
+        if not isinstance(tz, datetime.timezone):
+            return self.to_datetime().timestamp()
+        time = self._time
+        seconds = (self._date.toordinal() - _EPOCH_ORDINAL) * 86400 \
+            + time.hour*3600 + time.minute*60 + time.second
+        return seconds - tz.utcoffset(None).total_seconds() + time.microsecond / 1000000
+
+    def astimezone(self, tz: datetime.tzinfo = None) -> "FixedDateTime":
+        """The same moment in another timezone.
+
+        Args:
+            tz (Optional[datetime.tzinfo]): The timezone, None for the local timezone
+
+        Returns:
+            FixedDateTime: The converted moment.
+        """
+        return self.fromdatetime(self.to_datetime().astimezone(tz))
+
+    @property
+    def fixed_date(self) -> FixedDate:
+        """The date part.
+
+        Returns:
+            FixedDate: The IFC date.
+        """
+        return self._date
+
+    @property
+    def time(self) -> datetime.time:
+        """The time part including timezone.
+
+        Returns:
+            datetime.time: Time of day.
+        """
+        return self._time
+
+    @property
+    def hour(self) -> int:
+        """In range 0...23"""
+        return self._time.hour
+
+    @property
+    def minute(self) -> int:
+        """In range 0...59"""
+        return self._time.minute
+
+    @property
+    def second(self) -> int:
+        """In range 0...59"""
+        return self._time.second
+
+    @property
+    def microsecond(self) -> int:
+        """In range 0...999999"""
+        return self._time.microsecond
+
+    @property
+    def tzinfo(self) -> datetime.tzinfo:
+        """Timezone or None for naive time"""
+        return self._time.tzinfo
+
+    def utcoffset(self) -> datetime.timedelta:
+        """Offset from UTC or None for naive time.
+
+        Returns:
+            Optional[datetime.timedelta]: The offset.
+        """
+        return self.to_datetime().utcoffset()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FixedDateTime):
+            return NotImplemented
+        return self.to_datetime() == other.to_datetime()
+
+    def __lt__(self, other: "FixedDateTime") -> bool:
+        if not isinstance(other, FixedDateTime):
+            return NotImplemented
+        return self.to_datetime() < other.to_datetime()
+
+    def __le__(self, other: "FixedDateTime") -> bool:
+        if not isinstance(other, FixedDateTime):
+            return NotImplemented
+        return self.to_datetime() <= other.to_datetime()
+
+    def __gt__(self, other: "FixedDateTime") -> bool:
+        if not isinstance(other, FixedDateTime):
+            return NotImplemented
+        return self.to_datetime() > other.to_datetime()
+
+    def __ge__(self, other: "FixedDateTime") -> bool:
+        if not isinstance(other, FixedDateTime):
+            return NotImplemented
+        return self.to_datetime() >= other.to_datetime()
+
+    def __hash__(self) -> int:
+        return hash(self.to_datetime())
+
+    def __add__(self, other: datetime.timedelta) -> "FixedDateTime":
+        """Addition of FixedDateTime and timedelta.
+
+        Args:
+            other (datetime.timedelta): The time delta that will be added.
+
+        Returns:
+            FixedDateTime: New instance holding the new moment.
+        """
+        if not isinstance(other, datetime.timedelta):
+            return NotImplemented
+        return self.fromdatetime(self.to_datetime() + other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtraction of timedelta or another FixedDateTime.
+
+        Args:
+            other (Union[FixedDateTime, datetime.timedelta]): The value that will be subtracted.
+
+        Returns:
+            Union[FixedDateTime, datetime.timedelta]: With FixedDateTime as argument,
+            the time elapsed from the given moment, negative if the given moment is later.
+            With timedelta as argument, new FixedDateTime.
+        """
+        if isinstance(other, FixedDateTime):
+            return self.to_datetime() - other.to_datetime()
+        if isinstance(other, datetime.timedelta):
+            return self.fromdatetime(self.to_datetime() - other)
+        return NotImplemented
+
+    def __str__(self) -> str:
+        """String representation of the moment.
+
+        Returns:
+            str: Moment as YYYY-MM-DD HH:MM:SS with optional fraction and UTC offset.
+        """
+        return f"{self._date} {self._time.isoformat()}"
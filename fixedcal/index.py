@@ -0,0 +1,141 @@
+"""Sorted index of values by IFC date with range queries.
+
+The index keeps the ordinals of the dates in a sorted array next to the values,
+so that every query is a pair of binary searches and a list slice::
+
+    index = FixedDateIndex(event.date for event in events)
+    index = FixedDateIndex([event.date for event in events], values=events)
+    index.insert(event.date, event)
+    index.slice_by_month(2024, 6)           # values dated in June 2024, leap day included
+    index.between(start, end)
+
+Weeks, months and quarters are the ones of `fixedcal.periods`,
+so leap day and year day belong to the preceding week, month and quarter.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from fixedcal.periods import IFCWeek, IFCMonth, IFCQuarter, IFCYear
+
+class FixedDateIndex:
+    """Values sorted by their dates. Values with equal dates keep their insertion order.
+
+    Args:
+        dates (Iterable[Union[FixedDate, datetime.date]]): Dates of the values
+        values (Optional[Iterable]): Values in the same order as the dates,
+            the dates themselves if None
+
+    Raises:
+        ValueError: Counts of dates and values differ.
+    """
+
+    __slots__ = ("_ordinals", "_values")
+
+    def __init__(self, dates=(), values=None) -> None:
+        dates = list(dates)
+        values = dates if values is None else list(values)
+        if len(values) != len(dates):
+            raise ValueError("Parameters dates and values should have equal lengths")
+        ordinals = [date.toordinal() for date in dates]
+        order = sorted(range(len(ordinals)), key=ordinals.__getitem__)
+        self._ordinals = array("i", (ordinals[position] for position in order))
+        self._values = [values[position] for position in order]
+
+    def insert(self, date, value=None) -> None:
+        """Add a value after the values with the same date.
+
+        Args:
+            date (Union[FixedDate, datetime.date]): Date of the value
+            value (Optional[Any]): The value, the date itself if None
+        """
+        ordinal = date.toordinal()
+        position = bisect_right(self._ordinals, ordinal)
+        self._ordinals.insert(position, ordinal)
+        self._values.insert(position, date if value is None else value)
+
+    def _slice(self, first_ordinal: int, end_ordinal: int) -> list:
+        start = bisect_left(self._ordinals, first_ordinal)
+        return self._values[start:bisect_left(self._ordinals, end_ordinal, start)]
+
+    def between(self, start, end) -> list:
+        """Values dated from start (inclusive) to end (exclusive).
+
+        Args:
+            start (Union[FixedDate, datetime.date]): The first date
+            end (Union[FixedDate, datetime.date]): The date ending the span, not itself included
+
+        Returns:
+            list: Values in date order.
+        """
+        return self._slice(start.toordinal(), end.toordinal())
+
+    def _slice_by_period(self, period) -> list:
+        return self._slice(period.start_ordinal, period.end_ordinal + 1)
+
+    def slice_by_week(self, year: int, week: int) -> list:
+        """Values dated in the week.
+
+        Args:
+            year (int): In range 1...9999
+            week (int): In range 1...52
+
+        Raises:
+            ValueError: Year or week is out of range.
+
+        Returns:
+            list: Values in date order.
+        """
+        return self._slice_by_period(IFCWeek(year, week))
+
+    def slice_by_month(self, year: int, month: int) -> list:
+        """Values dated in the month.
+
+        Args:
+            year (int): In range 1...9999
+            month (int): In range 1...13
+
+        Raises:
+            ValueError: Year or month is out of range.
+
+        Returns:
+            list: Values in date order.
+        """
+        return self._slice_by_period(IFCMonth(year, month))
+
+    def slice_by_quarter(self, year: int, quarter: int) -> list:
+        """Values dated in the quarter.
+
+        Args:
+            year (int): In range 1...9999
+            quarter (int): In range 1...4
+
+        Raises:
+            ValueError: Year or quarter is out of range.
+
+        Returns:
+            list: Values in date order.
+        """
+        return self._slice_by_period(IFCQuarter(year, quarter))
+
+    def slice_by_year(self, year: int) -> list:
+        """Values dated in the year.
+
+        Args:
+            year (int): In range 1...9999
+
+        Raises:
+            ValueError: Year is out of range.
+
+        Returns:
+            list: Values in date order.
+        """
+        return self._slice_by_period(IFCYear(year))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __repr__(self) -> str:
+        return f"FixedDateIndex(length={len(self)})"
@@ -0,0 +1,164 @@
+"""Opt-in counters of FixedDate operations for profiling and metrics.
+
+While enabled, the instrumented methods and properties of `FixedDate` count
+their calls and accumulate their duration::
+
+    from fixedcal import instrumentation
+
+    with instrumentation.recording():
+        handle_requests()
+    for name, stats in instrumentation.snapshot().items():
+        metrics.gauge(f"fixedcal.{name}.calls", stats.calls)
+
+Operations are named like the benchmarks in `benchmarks.suite`, for example
+"init/date", "init/day_month_year", "property/weekday" and "add/days".
+Subtractions of two dates are counted by the span between them,
+from "sub/span<=7" to "sub/span>36525" days, which reveals long-span
+differences. Durations include the operations called inside the operation.
+
+Instrumentation replaces the methods of `FixedDate` with wrappers when enabled
+and restores the original ones when disabled, so it costs nothing while disabled.
+"""
+
+import functools
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter_ns
+from typing import NamedTuple
+from fixedcal.core.date import FixedDate
+
+# upper bounds of the span buckets of subtraction in days: week, month, year, decade, century
+SPAN_BUCKETS = (7, 28, 366, 3653, 36525)
+
+# instrumented attributes of FixedDate other than properties and subtraction
+_OPERATIONS = {
+    "_from_datetime": "init/date",
+    "_from_fixed_date": "init/day_month_year",
+    "_from_day_of_year": "init/day_of_year",
+    "fromordinal": "init/ordinal",
+    "fromisoformat": "parse/isoformat",
+    "parse": "parse/format",
+    "__add__": "add/timedelta",
+    "__radd__": "add/timedelta",
+    "add_days": "add/days",
+    "add_weeks": "add/weeks",
+    "add_months": "add/months",
+    "add_years": "add/years",
+    "format": "format",
+    "__str__": "str",
+}
+
+class OperationStats(NamedTuple):
+    """Statistics of an operation.
+
+    Attributes:
+        calls (int): Count of calls.
+        total_time (float): Total duration of the calls in seconds.
+    """
+    calls: int
+    total_time: float
+
+_lock = Lock()
+_counters = {}              # operation name -> [calls, nanoseconds]
+_originals = {}             # attribute name -> original attribute while enabled
+
+def _record(name: str, started: int) -> None:
+    elapsed = perf_counter_ns() - started
+    with _lock:
+        counter = _counters.get(name)
+        if counter is None:
+            _counters[name] = [1, elapsed]
+        else:
+            counter[0] += 1
+            counter[1] += elapsed
+
+def _timed(function, name: str):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        started = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(name, started)
+    return wrapper
+
+def _span_name(days: int) -> str:
+    for bound in SPAN_BUCKETS:
+        if days <= bound:
+            return f"sub/span<={bound}"
+    return f"sub/span>{SPAN_BUCKETS[-1]}"
+
+def _timed_sub(function):
+    @functools.wraps(function)
+    def wrapper(self, other):
+        started = perf_counter_ns()
+        try:
+            return function(self, other)
+        finally:
+            if isinstance(other, FixedDate):
+                _record(_span_name(abs(self.toordinal() - other.toordinal())), started)
+            else:
+                _record("sub/timedelta", started)
+    return wrapper
+
+def _instrumented(name: str, attribute):
+    if isinstance(attribute, property):
+        return property(_timed(attribute.fget, f"property/{name}"), doc=attribute.__doc__)
+    if isinstance(attribute, classmethod):
+        return classmethod(_timed(attribute.__func__, _OPERATIONS[name]))
+    if name == "__sub__":
+        return _timed_sub(attribute)
+    return _timed(attribute, _OPERATIONS[name])
+
+def is_enabled() -> bool:
+    """Whether the instrumentation is enabled.
+
+    Returns:
+        bool: True between `enable` and `disable`.
+    """
+    return bool(_originals)
+
+def enable() -> None:
+    """Start counting the operations. Does nothing if already enabled."""
+    with _lock:
+        if _originals:
+            return
+        for name, attribute in list(vars(FixedDate).items()):
+            if isinstance(attribute, property) or name in _OPERATIONS or name == "__sub__":
+                _originals[name] = attribute
+                setattr(FixedDate, name, _instrumented(name, attribute))
+
+def disable() -> None:
+    """Stop counting the operations. The statistics are kept until `reset`."""
+    with _lock:
+        for name, attribute in _originals.items():
+            setattr(FixedDate, name, attribute)
+        _originals.clear()
+
+def snapshot() -> dict:
+    """Statistics collected so far.
+
+    Returns:
+        dict: `OperationStats` keyed with operation name, for the operations called at least once.
+    """
+    with _lock:
+        return {name: OperationStats(calls, nanoseconds / 1e9)
+                for name, (calls, nanoseconds) in sorted(_counters.items())}
+
+def reset() -> None:
+    """Clear the collected statistics."""
+    with _lock:
+        _counters.clear()
+
+@contextmanager
+def recording():
+    """Context manager enabling the instrumentation within its block,
+    and disabling it afterwards unless it was enabled already before.
+    """
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
@@ -0,0 +1,303 @@
+"""Pandas integration for IFC dates.
+
+This module requires pandas and NumPy, which are available as an optional extra:
+``pip install fixedcal[pandas]``.
+
+Importing the module registers the ``fixeddate`` dtype and the ``.ifc`` Series accessor::
+
+    import fixedcal.pandas
+    series = pandas.Series(dates, dtype="fixeddate")
+    series.ifc.month
+    frame.groupby(frame["date"].ifc.month_start).sum()
+
+The accessor works both for ``fixeddate`` and ``datetime64`` series.
+Missing values are given as ``pandas.NA`` and so is weekday of leap day and year day.
+"""
+
+import datetime
+import numbers
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pandas.api.extensions import ExtensionArray, ExtensionDtype,\
+        register_extension_dtype, register_series_accessor, take
+except ImportError as error:
+    raise ImportError("fixedcal.pandas requires pandas, "
+                      "install it with `pip install fixedcal[pandas]`") from error
+
+from fixedcal.core.date import FixedDate
+from fixedcal.vectorized import to_ordinals, to_fixed_fields, WEEKDAY_NONE
+
+_NA_ORDINAL = 0
+
+@register_extension_dtype
+class FixedDateDtype(ExtensionDtype):
+    """Pandas dtype of IFC dates, available also with name "fixeddate"."""
+
+    name = "fixeddate"
+    type = FixedDate
+    kind = "O"
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls): # pylint: disable=arguments-differ
+        return FixedDateArray
+
+class FixedDateArray(ExtensionArray): # pylint: disable=abstract-method
+    """Pandas extension array of IFC dates stored as int32 ordinals.
+
+    Args:
+        ordinals (array_like): Proleptic ordinals of the dates, see `FixedDate.toordinal`
+        mask (Optional[array_like]): True for missing values
+    """
+
+    def __init__(self, ordinals, mask=None) -> None:
+        ordinals = np.asarray(ordinals, dtype=np.int32)
+        if mask is None:
+            mask = ordinals == _NA_ORDINAL
+        self._mask = np.asarray(mask, dtype=bool)
+        self._ordinals = np.where(self._mask, _NA_ORDINAL, ordinals).astype(np.int32, copy=False)
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        values = np.asarray(scalars, dtype=object) if not isinstance(scalars, np.ndarray) \
+            else scalars
+        if np.issubdtype(values.dtype, np.datetime64):
+            return cls.from_datetime64(values)
+        ordinals = np.zeros(len(values), dtype=np.int32)
+        mask = np.zeros(len(values), dtype=bool)
+        for index, value in enumerate(values):
+            if isinstance(value, FixedDate):
+                ordinals[index] = value.toordinal()
+            elif isinstance(value, datetime.date):
+                ordinals[index] = value.toordinal()
+            elif isinstance(value, str):
+                ordinals[index] = FixedDate.fromisoformat(value).toordinal()
+            elif pd.isna(value):
+                mask[index] = True
+            else:
+                raise TypeError(f"Cannot convert {value!r} to FixedDate")
+        return cls(ordinals, mask)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values)
+
+    @classmethod
+    def from_datetime64(cls, values) -> "FixedDateArray":
+        """Construct the array from datetime64 values, NaT becoming missing value.
+
+        Args:
+            values (array_like): datetime64 values
+
+        Returns:
+            FixedDateArray: The dates in IFC.
+        """
+        values = np.asarray(values).astype("datetime64[D]")
+        mask = np.isnat(values)
+        filled = np.where(mask, np.datetime64("1970-01-01"), values)
+        return cls(to_ordinals(filled), mask)
+
+    def to_ordinals(self) -> np.ndarray:
+        """Ordinals of the dates, 0 for missing values.
+
+        Returns:
+            np.ndarray: Copy of the int32 ordinals.
+        """
+        return self._ordinals.copy()
+
+    def to_datetime64(self) -> np.ndarray:
+        """The dates as Gregorian datetime64, NaT for missing values.
+
+        Returns:
+            np.ndarray: datetime64[D] array.
+        """
+        days = self._ordinals.astype(np.int64) - datetime.date(1970, 1, 1).toordinal()
+        dates = days.astype("datetime64[D]")
+        dates[self._mask] = np.datetime64("NaT")
+        return dates
+
+    @property
+    def dtype(self) -> FixedDateDtype:
+        return FixedDateDtype()
+
+    @property
+    def nbytes(self) -> int:
+        return self._ordinals.nbytes + self._mask.nbytes
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __getitem__(self, item):
+        if isinstance(item, numbers.Integral):
+            if self._mask[item]:
+                return pd.NA
+            return FixedDate.fromordinal(int(self._ordinals[item]))
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._ordinals[item], self._mask[item])
+
+    def __setitem__(self, key, value) -> None:
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if pd.api.types.is_scalar(value) or isinstance(value, FixedDate):
+            values = type(self)._from_sequence([value])
+            self._ordinals[key] = values._ordinals[0]
+            self._mask[key] = values._mask[0]
+        else:
+            values = type(self)._from_sequence(value)
+            self._ordinals[key] = values._ordinals
+            self._mask[key] = values._mask
+
+    def __iter__(self):
+        for ordinal, missing in zip(self._ordinals.tolist(), self._mask.tolist()):
+            yield pd.NA if missing else FixedDate.fromordinal(ordinal)
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, FixedDate):
+            return (self._ordinals == other.toordinal()) & ~self._mask
+        if not isinstance(other, FixedDateArray):
+            other = type(self)._from_sequence(other)
+        return (self._ordinals == other._ordinals) & ~self._mask & ~other._mask
+
+    def __array__(self, dtype=None, copy=None):
+        del copy    # a new array is always created
+        return np.array(list(self), dtype=dtype or object)
+
+    def isna(self) -> np.ndarray:
+        return self._mask.copy()
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_ordinal = fill_value.toordinal()
+        else:
+            fill_ordinal = _NA_ORDINAL
+        ordinals = take(self._ordinals, indices, allow_fill=allow_fill, fill_value=fill_ordinal)
+        return type(self)(ordinals)
+
+    def copy(self) -> "FixedDateArray":
+        return type(self)(self._ordinals.copy(), self._mask.copy())
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(np.concatenate([array.to_ordinals() for array in to_concat]),
+                   np.concatenate([array.isna() for array in to_concat]))
+
+    def _values_for_factorize(self):
+        return self._ordinals.copy(), _NA_ORDINAL
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._ordinals
+
+    def _formatter(self, boxed=False):
+        return str
+
+@register_series_accessor("ifc")
+class IFCAccessor:
+    """IFC fields of a Series with fixeddate or datetime64 dtype, accessed with `series.ifc`.
+
+    Raises:
+        AttributeError: The Series has some other dtype.
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        if isinstance(series.dtype, FixedDateDtype):
+            self._array = series.array
+        elif isinstance(series.dtype, pd.DatetimeTZDtype):
+            self._array = FixedDateArray.from_datetime64(
+                series.dt.tz_localize(None).to_numpy())
+        elif pd.api.types.is_datetime64_dtype(series.dtype):
+            self._array = FixedDateArray.from_datetime64(series.to_numpy())
+        else:
+            raise AttributeError("Can only use .ifc accessor with fixeddate or datetime64 values")
+        self._series = series
+        self._fields = None
+
+    def _field(self, name: str, dtype: str) -> pd.Series:
+        if self._fields is None:
+            ordinals = np.where(self._array.isna(), 1, self._array.to_ordinals())
+            self._fields = to_fixed_fields(ordinals)
+        values = pd.array(self._fields[name], dtype=dtype)
+        values[self._array.isna()] = pd.NA
+        return pd.Series(values, index=self._series.index, name=self._series.name)
+
+    def to_fixed(self) -> pd.Series:
+        """The dates as a Series with fixeddate dtype.
+
+        Returns:
+            pd.Series: IFC dates.
+        """
+        return pd.Series(self._array, index=self._series.index, name=self._series.name)
+
+    @property
+    def year(self) -> pd.Series:
+        """Year, see `FixedDate.year`"""
+        return self._field("year", "Int16")
+
+    @property
+    def day_of_year(self) -> pd.Series:
+        """Day of year, see `FixedDate.day_of_year`"""
+        return self._field("day_of_year", "Int16")
+
+    @property
+    def month(self) -> pd.Series:
+        """Month, see `FixedDate.month`"""
+        return self._field("month", "Int8")
+
+    @property
+    def day_of_month(self) -> pd.Series:
+        """Day of month, see `FixedDate.day_of_month`"""
+        return self._field("day_of_month", "Int8")
+
+    @property
+    def week_of_month(self) -> pd.Series:
+        """Week of month, see `FixedDate.week_of_month`"""
+        return self._field("week_of_month", "Int8")
+
+    @property
+    def weekday(self) -> pd.Series:
+        """Weekday, see `FixedDate.weekday`. Missing value for leap day and year day."""
+        weekday = self._field("weekday", "Int8")
+        weekday[weekday == WEEKDAY_NONE] = pd.NA
+        return weekday
+
+    @property
+    def week_of_year(self) -> pd.Series:
+        """Week of year, see `FixedDate.week_of_year`"""
+        return self._field("week_of_year", "Int8")
+
+    @property
+    def year_quarter(self) -> pd.Series:
+        """Quarter, see `FixedDate.year_quarter`"""
+        return self._field("year_quarter", "Int8")
+
+    @property
+    def is_leap_year(self) -> pd.Series:
+        """Whether the year is leap year, see `FixedDate.is_leap_year`"""
+        return self._field("is_leap_year", "boolean")
+
+    @property
+    def is_leap_day(self) -> pd.Series:
+        """Whether the date is leap day, see `FixedDate.is_leap_day`"""
+        return self._field("is_leap_day", "boolean")
+
+    @property
+    def is_year_day(self) -> pd.Series:
+        """Whether the date is year day, see `FixedDate.is_year_day`"""
+        return self._field("is_year_day", "boolean")
+
+    @property
+    def month_start(self) -> pd.Series:
+        """The first day of the IFC month of each date, for grouping by month.
+        Leap day belongs to June and year day to December like `FixedDate.month` tells.
+
+        Returns:
+            pd.Series: Series with fixeddate dtype.
+        """
+        day_of_month = self._field("day_of_month", "Int8").to_numpy(dtype=np.int32, na_value=1)
+        ordinals = self._array.to_ordinals() - day_of_month + 1
+        return pd.Series(FixedDateArray(ordinals, self._array.isna()),
+                         index=self._series.index, name=self._series.name)
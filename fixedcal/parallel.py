@@ -0,0 +1,120 @@
+"""Conversion of large amounts of dates in worker processes.
+
+Dates are sent to the workers in chunks of packed ordinals, see `fixedcal.column`,
+and the workers send back the dates formatted in the requested calendar::
+
+    convert(dates, TO_IFC)                  # ["2024-06-29", ...] using all cores
+    for text in iconvert(dates, TO_GREGORIAN, chunksize=50000, workers=4):
+        ...
+
+The input may be any iterable of native dates, FixedDates or ordinals,
+in any mix. `iconvert` reads it lazily and keeps only a bounded count of
+chunks in progress, so memory usage does not depend on the size of the input.
+"""
+
+import datetime
+import os
+from functools import partial
+from itertools import islice
+from fixedcal.column import FixedDateColumn
+from fixedcal.services.formatting import iso_string
+from fixedcal.services.ordinals import year_and_day_of_year, fixed_fields
+from fixedcal.services.pool import ordered_imap
+
+TO_IFC = "to-ifc"
+TO_GREGORIAN = "to-gregorian"
+DEFAULT_CHUNKSIZE = 10000
+
+def to_column(values) -> FixedDateColumn:
+    """Pack dates or ordinals into a column.
+
+    Args:
+        values (Iterable[Union[datetime.date, FixedDate, int]]): Dates or their ordinals
+
+    Raises:
+        ValueError: Some ordinal is out of range.
+
+    Returns:
+        FixedDateColumn: The dates.
+    """
+    return FixedDateColumn.from_ordinals(value if isinstance(value, int) else value.toordinal()
+                                         for value in values)
+
+def _columns(values, chunksize: int):
+    values = iter(values)
+    while True:
+        chunk = list(islice(values, chunksize))
+        if not chunk:
+            return
+        yield to_column(chunk)
+
+def _ifc_iso_string(ordinal: int) -> str:
+    year, day_of_year = year_and_day_of_year(ordinal)
+    _, month, day_of_month, _ = fixed_fields(day_of_year, year)
+    return iso_string(year, month, day_of_month)
+
+def _gregorian_iso_string(ordinal: int) -> str:
+    return datetime.date.fromordinal(ordinal).isoformat()
+
+def convert_column(direction: str, column: FixedDateColumn) -> list:
+    """Format the dates of a column, the unit of work of worker processes.
+
+    Args:
+        direction (str): `TO_IFC` or `TO_GREGORIAN`
+        column (FixedDateColumn): The dates
+
+    Returns:
+        list: The dates as YYYY-MM-DD strings in IFC or Gregorian calendar.
+    """
+    formatter = _gregorian_iso_string if direction == TO_GREGORIAN else _ifc_iso_string
+    return list(map(formatter, column.ordinals))
+
+def iconvert(values, direction: str = TO_IFC, chunksize: int = DEFAULT_CHUNKSIZE,
+             workers: int = None, max_pending: int = None):
+    """Convert dates in worker processes lazily, like `multiprocessing.Pool.imap`.
+
+    Args:
+        values (Iterable[Union[datetime.date, FixedDate, int]]): Dates or their ordinals
+        direction (str): `TO_IFC` for IFC strings, `TO_GREGORIAN` for Gregorian strings
+        chunksize (int): Count of dates sent to a worker at once, positive
+        workers (Optional[int]): Count of worker processes, the count of CPUs by default,
+            0 to convert in this process
+        max_pending (Optional[int]): Maximum count of chunks in progress or waiting
+            to be yielded, two per worker by default
+
+    Raises:
+        ValueError: Direction, chunk size or some ordinal is invalid.
+
+    Returns:
+        Iterator[str]: The dates as YYYY-MM-DD strings in the order of the input.
+    """
+    if direction not in (TO_IFC, TO_GREGORIAN):
+        raise ValueError(f"Direction should be either {TO_IFC} or {TO_GREGORIAN}")
+    if chunksize < 1:
+        raise ValueError("Chunk size should be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * workers
+    results = ordered_imap(partial(convert_column, direction), _columns(values, chunksize),
+                           workers, max(max_pending, 1))
+    return (text for chunk in results for text in chunk)
+
+def convert(values, direction: str = TO_IFC, chunksize: int = DEFAULT_CHUNKSIZE,
+            workers: int = None) -> list:
+    """Convert dates in worker processes.
+
+    Args:
+        values (Iterable[Union[datetime.date, FixedDate, int]]): Dates or their ordinals
+        direction (str): `TO_IFC` for IFC strings, `TO_GREGORIAN` for Gregorian strings
+        chunksize (int): Count of dates sent to a worker at once, positive
+        workers (Optional[int]): Count of worker processes, the count of CPUs by default,
+            0 to convert in this process
+
+    Raises:
+        ValueError: Direction, chunk size or some ordinal is invalid.
+
+    Returns:
+        list: The dates as YYYY-MM-DD strings in the order of the input.
+    """
+    return list(iconvert(values, direction, chunksize, workers))
@@ -0,0 +1,284 @@
+"""IFC weeks, months, quarters and years as periods, and grouping of dates by them.
+
+Every period is a contiguous span of days::
+
+    month = IFCMonth(2024, 6)
+    month.start, month.end          # FixedDates 2024-06-01 and 2024-06-29 (leap day)
+    FixedDate(day=3, month=7, year=2024) in month.next()
+
+    for month, rows in bucketize(rows, IFCMonth, key=lambda row: row["date"]):
+        ...
+
+Leap day and year day do not belong to any week or month in IFC, but for grouping
+they are attached to the preceding days, just like `FixedDate.month`,
+`FixedDate.week_of_year` and `FixedDate.year_quarter` tell:
+
+- leap day belongs to week 24, June and quarter 2, which are one day longer in leap years
+- year day belongs to week 52, December (month 13) and quarter 4, which are therefore
+  one day longer than the other weeks, months and quarters
+
+Other periods have exactly 7, 28 or 91 days.
+"""
+
+from fixedcal.core.date import FixedDate
+from fixedcal.core.date_time import FixedDateTime
+from fixedcal.services.ordinals import MIN_ORDINAL, MAX_ORDINAL, year_and_day_of_year
+from fixedcal.services.year_table import FIRST_YEAR, LAST_YEAR, get_year_table
+
+_EPOCH_ORDINAL = 719163     # ordinal of 1970-01-01
+_LEAP_DAY_OF_YEAR = 169
+_LAST_REGULAR_INDEX = 363   # zero-based index of the last day of December among regular days
+
+class FixedPeriod:
+    """Base class of IFC periods. Periods are immutable and hashable.
+
+    Args:
+        year (int): In range 1...9999
+        number (int): Number of the period in the year, starting from 1
+
+    Raises:
+        ValueError: Year or number is out of range.
+    """
+
+    _length = 364           # count of regular days, leap day and year day excluded
+    _count = 1              # count of the periods in a year
+    __slots__ = ("_year", "_number", "_start_ordinal")
+
+    def __init__(self, year: int, number: int) -> None:
+        if year < FIRST_YEAR or year > LAST_YEAR:
+            raise ValueError(f"Year should be in range {FIRST_YEAR}...{LAST_YEAR}")
+        if number < 1 or number > self._count:
+            raise ValueError(f"Number should be in range 1...{self._count}")
+        self._set_fields(year, number)
+
+    def _set_fields(self, year: int, number: int) -> None:
+        year_starts, leap_flags = get_year_table()
+        regular_index = self._length * (number-1)
+        # leap day shifts the later days of the year by one
+        if leap_flags[year] and regular_index >= _LEAP_DAY_OF_YEAR-1:
+            regular_index += 1
+        self._year = year
+        self._number = number
+        self._start_ordinal = year_starts[year] + regular_index
+
+    @classmethod
+    def _from_fields(cls, year: int, number: int) -> "FixedPeriod":
+        period = cls.__new__(cls)
+        period._set_fields(year, number)
+        return period
+
+    @classmethod
+    def of_ordinal(cls, ordinal: int) -> "FixedPeriod":
+        """The period containing the day with the given proleptic ordinal.
+
+        Args:
+            ordinal (int): Ordinal in range 1...3652059, see `FixedDate.toordinal`
+
+        Raises:
+            ValueError: Ordinal is out of range.
+
+        Returns:
+            FixedPeriod: The period of the day.
+        """
+        if ordinal < MIN_ORDINAL or ordinal > MAX_ORDINAL:
+            raise ValueError(f"Ordinal should be in range {MIN_ORDINAL}...{MAX_ORDINAL}")
+        year, day_of_year = year_and_day_of_year(ordinal)
+        leap_year = get_year_table().leap_flags[year]
+        if day_of_year == 365 + leap_year:                  # year day
+            regular_index = _LAST_REGULAR_INDEX
+        elif leap_year and day_of_year >= _LEAP_DAY_OF_YEAR:
+            regular_index = day_of_year - 2                 # leap day joins the day before
+        else:
+            regular_index = day_of_year - 1
+        return cls._from_fields(year, regular_index // cls._length + 1)
+
+    @classmethod
+    def of(cls, date) -> "FixedPeriod":
+        """The period containing the given date.
+
+        Args:
+            date (Union[FixedDate, datetime.date]): The date
+
+        Returns:
+            FixedPeriod: The period of the date.
+        """
+        return cls.of_ordinal(date.toordinal())
+
+    @property
+    def year(self) -> int:
+        """Year of the period"""
+        return self._year
+
+    @property
+    def number(self) -> int:
+        """Number of the period in its year, starting from 1"""
+        return self._number
+
+    @property
+    def start_ordinal(self) -> int:
+        """Proleptic ordinal of the first day of the period"""
+        return self._start_ordinal
+
+    @property
+    def end_ordinal(self) -> int:
+        """Proleptic ordinal of the last day of the period"""
+        if self._number == self._count:
+            return get_year_table().year_starts[self._year+1] - 1
+        return self._from_fields(self._year, self._number+1).start_ordinal - 1
+
+    @property
+    def start(self) -> FixedDate:
+        """The first day of the period"""
+        return FixedDate.fromordinal(self._start_ordinal)
+
+    @property
+    def end(self) -> FixedDate:
+        """The last day of the period, included in the period"""
+        return FixedDate.fromordinal(self.end_ordinal)
+
+    def contains(self, date) -> bool:
+        """Whether the date belongs to this period.
+
+        Args:
+            date (Union[FixedDate, datetime.date]): The date
+
+        Returns:
+            bool: True if the date is within the period.
+        """
+        return self._start_ordinal <= date.toordinal() <= self.end_ordinal
+
+    __contains__ = contains
+
+    def next(self) -> "FixedPeriod":
+        """The following period of the same kind.
+
+        Raises:
+            OverflowError: The period would be after year 9999.
+
+        Returns:
+            FixedPeriod: The next period.
+        """
+        if self._number < self._count:
+            return self._from_fields(self._year, self._number+1)
+        if self._year == LAST_YEAR:
+            raise OverflowError("Period out of range")
+        return self._from_fields(self._year+1, 1)
+
+    def prev(self) -> "FixedPeriod":
+        """The preceding period of the same kind.
+
+        Raises:
+            OverflowError: The period would be before year 1.
+
+        Returns:
+            FixedPeriod: The previous period.
+        """
+        if self._number > 1:
+            return self._from_fields(self._year, self._number-1)
+        if self._year == FIRST_YEAR:
+            raise OverflowError("Period out of range")
+        return self._from_fields(self._year-1, self._count)
+
+    def __len__(self) -> int:
+        """Count of days in the period, including leap day and year day"""
+        return self.end_ordinal - self._start_ordinal + 1
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._start_ordinal == other._start_ordinal
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._start_ordinal))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._year}, {self._number})"
+
+class IFCWeek(FixedPeriod):
+    """IFC week of 7 days from Sunday to Saturday, see `FixedPeriod`.
+    Numbered 1...52 like `FixedDate.week_of_year`."""
+    _length = 7
+    _count = 52
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return f"{self._year:04d}-W{self._number:02d}"
+
+class IFCMonth(FixedPeriod):
+    """IFC month of 28 days, see `FixedPeriod`. Numbered 1...13 like `FixedDate.month`."""
+    _length = 28
+    _count = 13
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return f"{self._year:04d}-{self._number:02d}"
+
+class IFCQuarter(FixedPeriod):
+    """Quarter of 13 IFC weeks, see `FixedPeriod`. Numbered 1...4 like `FixedDate.year_quarter`."""
+    _length = 91
+    _count = 4
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return f"{self._year:04d}-Q{self._number}"
+
+class IFCYear(FixedPeriod):
+    """IFC year, see `FixedPeriod`. The number of a year is always 1.
+
+    Args:
+        year (int): In range 1...9999
+    """
+    __slots__ = ()
+
+    def __init__(self, year: int, number: int = 1) -> None:
+        super().__init__(year, number)
+
+    def __repr__(self) -> str:
+        return f"IFCYear({self._year})"
+
+    def __str__(self) -> str:
+        return f"{self._year:04d}"
+
+def _ordinal(value, utc_offset: int) -> int:
+    if isinstance(value, (int, float)):
+        return int((value + utc_offset) // 86400) + _EPOCH_ORDINAL
+    if isinstance(value, FixedDateTime):
+        return value.fixed_date.toordinal()
+    return value.toordinal()
+
+def bucketize(values, period: type, key=None, utc_offset: int = 0):
+    """Group sorted values by IFC periods in a single pass, like `itertools.groupby`.
+    Periods without any values are not yielded.
+
+    Values are FixedDates, FixedDateTimes, native dates and datetimes or
+    POSIX timestamps, or any objects from which `key` picks one of those.
+    Only ordinals of the values are computed, no FixedDate is constructed for them.
+
+    Args:
+        values (Iterable): Values sorted in ascending order by their dates
+        period (type): One of `IFCWeek`, `IFCMonth`, `IFCQuarter` and `IFCYear`
+        key (Optional[Callable]): Function returning the date of a value, the value itself if None
+        utc_offset (int): Offset of timezone from UTC in seconds, used for timestamps
+
+    Raises:
+        ValueError: Values are not sorted or some date is out of range.
+
+    Yields:
+        tuple: The period and the list of its values.
+    """
+    current = None
+    start = end = 0
+    bucket = []
+    for value in values:
+        ordinal = _ordinal(value if key is None else key(value), utc_offset)
+        if ordinal > end:
+            if bucket:
+                yield current, bucket
+            current = period.of_ordinal(ordinal)
+            start, end = current.start_ordinal, current.end_ordinal
+            bucket = []
+        elif ordinal < start:
+            raise ValueError("Values should be sorted by date")
+        bucket.append(value)
+    if bucket:
+        yield current, bucket
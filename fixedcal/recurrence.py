@@ -0,0 +1,342 @@
+"""Recurring IFC dates, such as "every 2nd tuesday of every month".
+
+All IFC months and years have the same layout of regular days, so a rule is
+a set of days in a week, month or year, repeated with some interval.
+Leap day and year day do not belong to any week or month and
+are added to the occurrences separately when the rule asks for them::
+
+    rule = Recurrence.parse("day 28 of every month plus year day")
+    rule.occurrences_between(FixedDate(day=1, month=1, year=2024),
+                             FixedDate(day=1, month=1, year=2025))
+    rule.count_between(start, end)
+
+The occurrences are computed arithmetically from the first one,
+so their count is the only thing affecting the time taken.
+
+Supported rule specs, case-insensitive, "each" working like "every":
+
+- "every day", "daily" and "every 3 days"
+- "every tuesday", "every monday and friday" and "every 2 weeks on monday"
+- "day 28 of every month", "every month on day 1 and 15" and "every 3 months on day 2"
+- "2nd tuesday of every month" and "last saturday of every month"
+- "every year on sol 5" and "every 2 years on 1 january"
+- any of the above followed by "plus leap day", "plus year day" or "plus leap day and year day"
+
+"every day" includes leap day and year day, whereas other rules
+contain regular days only unless followed by "plus".
+"""
+
+import re
+from bisect import bisect_left
+from fixedcal.core.date import FixedDate
+from fixedcal.core.date_range import DAY, WEEK, MONTH
+from fixedcal.services.formatting import MONTH_NAMES, WEEKDAY_NAMES
+from fixedcal.services.leap_days import leap_years_before
+from fixedcal.services.ordinals import MAX_ORDINAL, year_and_day_of_year, regular_day_index, \
+    regular_day_ordinal
+from fixedcal.services.year_table import get_year_table
+
+YEAR = "year"
+LEAP_DAY = "leap_day"
+YEAR_DAY = "year_day"
+
+_UNIT_LENGTHS = {DAY: 1, WEEK: 7, MONTH: 28, YEAR: 364}
+_LEAP_DAY_OF_YEAR = 169
+_NTH = {"1st": 1, "first": 1, "2nd": 2, "second": 2, "3rd": 3, "third": 3,
+        "4th": 4, "fourth": 4, "last": 4}
+_WEEKDAYS = {name.lower(): number for number, name in enumerate(WEEKDAY_NAMES, 1)}
+_MONTHS = {name.lower(): number for number, name in enumerate(MONTH_NAMES, 1)}
+
+class Recurrence:
+    """Rule of recurring IFC dates. Instances are immutable.
+
+    Args:
+        unit (str): One of "day", "week", "month" and "year"
+        days (Iterable[int]): Days of the unit where the dates occur, starting from 1:
+            weekdays 1...7 for weeks, days of month 1...28 for months and
+            days of year 1...364 counting regular days only for years.
+            Ignored for days.
+        interval (int): The dates occur in every interval-th unit
+        special_days (Iterable[str]): "leap_day" and "year_day" if those are occurrences too
+        anchor (Optional[FixedDate]): A date in the first unit with occurrences,
+            matters only when interval is more than one. 0001-01-01 by default.
+
+    Raises:
+        ValueError: Some argument is out of range.
+    """
+
+    def __init__(self, unit: str, days=(1,), interval: int = 1, special_days=(),
+                 anchor: FixedDate = None) -> None:
+        if unit not in _UNIT_LENGTHS:
+            raise ValueError(f"Unit should be one of {', '.join(_UNIT_LENGTHS)}")
+        if interval < 1:
+            raise ValueError("Interval should be positive")
+        length = _UNIT_LENGTHS[unit]
+        offsets = (0,) if unit == DAY else tuple(sorted({day-1 for day in days}))
+        if not offsets or offsets[0] < 0 or offsets[-1] >= length:
+            raise ValueError(f"Days should be in range 1...{length}")
+        special_days = set(special_days)
+        if not special_days <= {LEAP_DAY, YEAR_DAY}:
+            raise ValueError(f"Special days should be {LEAP_DAY} or {YEAR_DAY}")
+        self._unit = unit
+        self._offsets = offsets
+        self._interval = interval
+        self._leap_day = LEAP_DAY in special_days
+        self._year_day = YEAR_DAY in special_days
+        anchor_ordinal = 1 if anchor is None else anchor.toordinal()
+        self._phase = (regular_day_index(anchor_ordinal) // length) % interval
+
+    @classmethod
+    def parse(cls, spec: str) -> "Recurrence":
+        """Construct the rule from a spec such as "2nd tuesday of every month".
+        See the module documentation for the supported specs.
+
+        Args:
+            spec (str): The rule spec
+
+        Raises:
+            ValueError: The spec is not understood.
+
+        Returns:
+            Recurrence: The rule.
+        """
+        text = " ".join(word for word in spec.lower().replace("each", "every").split()
+                       if word != "ifc")
+        special_days = set()
+        if " plus " in text:
+            text, specials = text.split(" plus ", 1)
+            for item in _split_list(specials):
+                if item not in ("leap day", "year day"):
+                    raise ValueError(f"Unknown special day {item!r} in rule {spec!r}")
+                special_days.add(item.replace(" ", "_"))
+        try:
+            unit, days, interval = _parse_body(text)
+        except (KeyError, ValueError) as error:
+            raise ValueError(f"Invalid recurrence rule {spec!r}") from error
+        if unit == DAY and interval == 1:
+            special_days = {LEAP_DAY, YEAR_DAY}
+        return cls(unit, days, interval, special_days)
+
+    @property
+    def unit(self) -> str:
+        """One of "day", "week", "month" and "year\""""
+        return self._unit
+
+    @property
+    def days(self) -> tuple:
+        """Sorted days of the unit where the dates occur, starting from 1"""
+        return tuple(offset+1 for offset in self._offsets)
+
+    @property
+    def interval(self) -> int:
+        """The dates occur in every interval-th unit"""
+        return self._interval
+
+    @property
+    def special_days(self) -> frozenset:
+        """"leap_day" and "year_day" if those are occurrences too"""
+        return frozenset(name for name, included in ((LEAP_DAY, self._leap_day),
+                                                     (YEAR_DAY, self._year_day)) if included)
+
+    def _next_special(self, ordinal: int) -> int:
+        """Ordinal of the first included leap day or year day on or after the given day,
+        beyond `MAX_ORDINAL` if there is none"""
+        if not (self._leap_day or self._year_day) or ordinal > MAX_ORDINAL:
+            return MAX_ORDINAL + 1
+        year_table = get_year_table()
+        year, _ = year_and_day_of_year(ordinal)
+        while year <= 9999:
+            year_start = year_table.year_starts[year]
+            if self._leap_day and year_table.leap_flags[year] \
+                    and ordinal <= year_start + _LEAP_DAY_OF_YEAR - 1:
+                return year_start + _LEAP_DAY_OF_YEAR - 1
+            if self._year_day:
+                return year_table.year_starts[year+1] - 1
+            year += 1
+        return MAX_ORDINAL + 1
+
+    def _specials_before(self, ordinal: int) -> int:
+        year, day_of_year = (10000, 1) if ordinal > MAX_ORDINAL else year_and_day_of_year(ordinal)
+        count = 0
+        if self._leap_day:
+            leap_year = get_year_table().leap_flags[year]
+            count += leap_years_before(year) + (leap_year and day_of_year > _LEAP_DAY_OF_YEAR)
+        if self._year_day:
+            count += year - 1
+        return count
+
+    def _regular_before(self, index: int) -> int:
+        """Count of regular occurrences with smaller regular day index"""
+        unit, offset = divmod(index, _UNIT_LENGTHS[self._unit])
+        # units before this one having occurrences
+        units = (unit - self._phase + self._interval - 1) // self._interval
+        count = units * len(self._offsets)
+        if (unit - self._phase) % self._interval == 0:
+            count += bisect_left(self._offsets, offset)
+        return count
+
+    def ordinals_between(self, start, end, skip_special_days: bool = False):
+        """Ordinals of the occurrences from start (inclusive) to end (exclusive) in order.
+
+        Args:
+            start (Union[FixedDate, datetime.date]): The first date of the span
+            end (Union[FixedDate, datetime.date]): The date ending the span, not itself included
+            skip_special_days (bool): Whether to leave out leap days and year days
+
+        Returns:
+            Iterator[int]: Proleptic ordinals of the occurrences.
+        """
+        return self._ordinals(start.toordinal(), end.toordinal(), skip_special_days)
+
+    def _ordinals(self, start_ordinal: int, end_ordinal: int, skip_special_days: bool):
+        first_index, end_index = _regular_day_index(start_ordinal), _regular_day_index(end_ordinal)
+        special = MAX_ORDINAL + 1 if skip_special_days else self._next_special(start_ordinal)
+        length = _UNIT_LENGTHS[self._unit]
+        offsets = self._offsets
+
+        # the first unit with occurrences on or after the start
+        unit = first_index // length
+        unit += (self._phase - unit) % self._interval
+        unit_start = unit * length
+        first = bisect_left(offsets, first_index - unit_start) if unit_start < first_index else 0
+        while unit_start < end_index:
+            for offset in offsets[first:]:
+                index = unit_start + offset
+                if index >= end_index:
+                    break
+                ordinal = regular_day_ordinal(index)
+                while special < ordinal:
+                    yield special
+                    special = self._next_special(special + 1)
+                yield ordinal
+            unit_start += length * self._interval
+            first = 0
+        while special < end_ordinal:
+            yield special
+            special = self._next_special(special + 1)
+
+    def occurrences_between(self, start, end, skip_special_days: bool = False):
+        """Occurrences from start (inclusive) to end (exclusive) in order, lazily.
+
+        Args:
+            start (Union[FixedDate, datetime.date]): The first date of the span
+            end (Union[FixedDate, datetime.date]): The date ending the span, not itself included
+            skip_special_days (bool): Whether to leave out leap days and year days
+
+        Yields:
+            FixedDate: The occurrences.
+        """
+        for ordinal in self.ordinals_between(start, end, skip_special_days):
+            yield FixedDate.fromordinal(ordinal)
+
+    def occurrences(self, start, skip_special_days: bool = False):
+        """Occurrences from start (inclusive) onwards until the end of year 9999, lazily.
+
+        Args:
+            start (Union[FixedDate, datetime.date]): The first date
+            skip_special_days (bool): Whether to leave out leap days and year days
+
+        Yields:
+            FixedDate: The occurrences.
+        """
+        for ordinal in self._ordinals(start.toordinal(), MAX_ORDINAL + 1, skip_special_days):
+            yield FixedDate.fromordinal(ordinal)
+
+    def count_between(self, start, end, skip_special_days: bool = False) -> int:
+        """Count of the occurrences from start (inclusive) to end (exclusive) in constant time.
+
+        Args:
+            start (Union[FixedDate, datetime.date]): The first date of the span
+            end (Union[FixedDate, datetime.date]): The date ending the span, not itself included
+            skip_special_days (bool): Whether to leave out leap days and year days
+
+        Returns:
+            int: Count of the occurrences, zero if end is not after start.
+        """
+        start_ordinal, end_ordinal = start.toordinal(), end.toordinal()
+        if end_ordinal <= start_ordinal:
+            return 0
+        count = self._regular_before(_regular_day_index(end_ordinal)) \
+            - self._regular_before(_regular_day_index(start_ordinal))
+        if not skip_special_days:
+            count += self._specials_before(end_ordinal) - self._specials_before(start_ordinal)
+        return count
+
+    def __repr__(self) -> str:
+        return f"Recurrence({self._unit!r}, days={list(self.days)}, " \
+               f"interval={self._interval}, special_days={sorted(self.special_days)})"
+
+def _regular_day_index(ordinal: int) -> int:
+    """`regular_day_index` accepting also the day after year 9999"""
+    return 364*9999 if ordinal > MAX_ORDINAL else regular_day_index(ordinal)
+
+def _split_list(text: str) -> list:
+    return [item for item in re.split(r"\s*(?:,|\band\b)\s*", text) if item]
+
+def _day_number(text: str) -> int:
+    match = re.fullmatch(r"(\d+)(?:st|nd|rd|th)?", text)
+    if match is None:
+        raise ValueError(f"invalid day {text!r}")
+    return int(match.group(1))
+
+def _day_of_month(item: str) -> int:
+    """Day of month from "28", "28th", "last day" or "2nd tuesday\""""
+    words = item.split()
+    if words[0] == "day":
+        words = words[1:]
+    if len(words) == 1:
+        return _day_number(words[0])
+    nth, name = words
+    if name == "day":
+        return 28 if nth == "last" else _day_number(nth)
+    return 7*(_NTH[nth]-1) + _WEEKDAYS[name.rstrip("s")]
+
+def _day_of_year(item: str) -> int:
+    """Regular day of year from "sol 5", "5 sol" or "day 5 of sol\""""
+    words = [word for word in item.split() if word not in ("day", "of")]
+    if words[0] in _MONTHS:
+        month, day = words
+    else:
+        day, month = words
+    day = _day_of_month(day)
+    if day > 28:
+        raise ValueError("Day of month should be in range 1...28")
+    return 28*(_MONTHS[month]-1) + day
+
+def _interval(text: str) -> int:
+    return int(text) if text else 1
+
+def _parse_body(text: str) -> tuple:
+    """Unit, days and interval of rule spec without its special days.
+
+    Raises:
+        ValueError: The spec is not understood.
+        KeyError: The spec contains unknown name.
+    """
+    match = re.fullmatch(r"every (?:(\d+) )?days?|daily", text)
+    if match:
+        return (DAY, (1,), _interval(match.group(1)))
+    match = re.fullmatch(r"every (?:(\d+) )?weeks? on (.+)", text)
+    if match:
+        days = [_WEEKDAYS[name.rstrip("s")] for name in _split_list(match.group(2))]
+        return (WEEK, days, _interval(match.group(1)))
+    match = re.fullmatch(r"every (?:(\d+) )?months? on (.+)", text)
+    if match:
+        items = _split_list(match.group(2))
+        if items[0].startswith("days "):
+            items[0] = items[0][5:]
+        return (MONTH, [_day_of_month(item) for item in items], _interval(match.group(1)))
+    match = re.fullmatch(r"(?:every )?(?:on )?(?:the )?(.+) of every (?:(\d+) )?months?", text)
+    if match:
+        items = _split_list(match.group(1))
+        if items[0].startswith("days "):
+            items[0] = items[0][5:]
+        return (MONTH, [_day_of_month(item) for item in items], _interval(match.group(2)))
+    match = re.fullmatch(r"every (?:(\d+) )?years? on (.+)", text)
+    if match:
+        days = [_day_of_year(item) for item in _split_list(match.group(2))]
+        return (YEAR, days, _interval(match.group(1)))
+    match = re.fullmatch(r"every (.+)", text)
+    if match:
+        return (WEEK, [_WEEKDAYS[name.rstrip("s")] for name in _split_list(match.group(1))], 1)
+    raise ValueError("Unknown rule")
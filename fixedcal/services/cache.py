@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache, like the ones of `functools.lru_cache`.
+
+    Attributes:
+        hits (int): Count of lookups that found the value in the cache.
+        misses (int): Count of lookups that had to create the value.
+        maxsize (int): Maximum count of values kept in the cache.
+        currsize (int): Count of values in the cache now.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class LRUCache:
+    """Thread-safe cache evicting the least recently used values.
+
+    Args:
+        factory (Callable): Function creating the value of a key on cache miss
+        maxsize (int): Maximum count of values kept in the cache, positive
+    """
+
+    def __init__(self, factory, maxsize: int) -> None:
+        self._factory = factory
+        self._values = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = 0
+        self._hits = 0
+        self._misses = 0
+        self.resize(maxsize)
+
+    def get(self, key):
+        """The value of the key, created with the factory if it is not in the cache.
+        Concurrent misses of the same key return the same value.
+
+        Args:
+            key (Hashable): The key
+
+        Returns:
+            Any: The cached value.
+        """
+        values = self._values
+        with self._lock:
+            value = values.get(key)
+            if value is not None:
+                values.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        # the factory may raise, so it is called outside of the lock
+        value = self._factory(key)
+        with self._lock:
+            value = values.setdefault(key, value)
+            if len(values) > self._maxsize:
+                values.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Current statistics of the cache.
+
+        Returns:
+            CacheInfo: Hits, misses, maximum size and current size.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._values))
+
+    def clear(self) -> None:
+        """Remove all values and reset the statistics."""
+        with self._lock:
+            self._values.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum size, evicting the least recently used values if needed.
+
+        Args:
+            maxsize (int): New maximum size, positive
+
+        Raises:
+            ValueError: Size is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size should be positive")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._values) > maxsize:
+                self._values.popitem(last=False)
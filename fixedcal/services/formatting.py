@@ -0,0 +1,213 @@
+import re
+from functools import lru_cache
+from operator import attrgetter
+
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "Sol",
+               "July", "August", "September", "October", "November", "December")
+WEEKDAY_NAMES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+LEAP_DAY_NAME = "Leap Day"
+YEAR_DAY_NAME = "Year Day"
+
+# zero-padded numbers are looked up because format specs are slow
+_TWO_DIGITS = tuple(f"{number:02d}" for number in range(100))
+_THREE_DIGITS = tuple(f"{number:03d}" for number in range(367))
+
+def _year_string(year: int) -> str:
+    return str(year) if year >= 1000 else f"{year:04d}"
+
+def iso_string(year: int, month: int, day: int) -> str:
+    """Date as YYYY-MM-DD.
+
+    Args:
+        year (int): Year in range 1...9999
+        month (int): Month in range 1...13
+        day (int): Day of month in range 1...29
+
+    Returns:
+        str: The formatted date.
+    """
+    return f"{_year_string(year)}-{_TWO_DIGITS[month]}-{_TWO_DIGITS[day]}"
+
+def _year(date) -> str:
+    return _year_string(date.year)
+
+def _month(date) -> str:
+    return _TWO_DIGITS[date.month]
+
+def _day_of_month(date) -> str:
+    return _TWO_DIGITS[date.day_of_month]
+
+def _day_of_year(date) -> str:
+    return _THREE_DIGITS[date.day_of_year]
+
+def _week_of_year(date) -> str:
+    return _TWO_DIGITS[date.week_of_year]
+
+def _month_name(date) -> str:
+    return MONTH_NAMES[date.month-1]
+
+def _month_abbreviation(date) -> str:
+    return MONTH_NAMES[date.month-1][:3]
+
+def _weekday_name(date) -> str:
+    weekday = date.weekday
+    if weekday is None:
+        return LEAP_DAY_NAME if date.is_leap_day else YEAR_DAY_NAME
+    return WEEKDAY_NAMES[weekday-1]
+
+def _weekday_abbreviation(date) -> str:
+    weekday = date.weekday
+    if weekday is None:
+        return LEAP_DAY_NAME[:4] if date.is_leap_day else YEAR_DAY_NAME[:4]
+    return WEEKDAY_NAMES[weekday-1][:3]
+
+def _weekday_number(date) -> int:
+    return date.weekday or 0
+
+def _alternatives(names) -> str:
+    return "|".join(sorted(names, key=len, reverse=True))
+
+# Supported format directives:
+#   %Y  year, four digits
+#   %m  month 01...13, 13 for year day
+#   %d  day of month 01...29, 29 for leap day and year day
+#   %j  day of year 001...366
+#   %B  month name, Sol between June and July
+#   %b  month name abbreviated to three letters
+#   %A  weekday name, "Leap Day" and "Year Day" for those days
+#   %a  weekday name abbreviated, "Leap" and "Year" for leap day and year day
+#   %u  weekday 1...7 starting from Sunday, 0 for leap day and year day
+#   %W  week of year 01...52
+#   %w  week of month 1...4
+#   %q  quarter of year 1...4
+#   %%  literal percent sign
+# Each directive maps to (template field, value getter, parse pattern).
+DIRECTIVES = {
+    "Y": ("{}", _year, r"[0-9]{4}"),
+    "m": ("{}", _month, r"[0-9]{2}"),
+    "d": ("{}", _day_of_month, r"[0-9]{2}"),
+    "j": ("{}", _day_of_year, r"[0-9]{3}"),
+    "B": ("{}", _month_name, _alternatives(MONTH_NAMES)),
+    "b": ("{}", _month_abbreviation, _alternatives(name[:3] for name in MONTH_NAMES)),
+    "A": ("{}", _weekday_name, _alternatives(WEEKDAY_NAMES + (LEAP_DAY_NAME, YEAR_DAY_NAME))),
+    "a": ("{}", _weekday_abbreviation,
+          _alternatives([name[:3] for name in WEEKDAY_NAMES] + ["Leap", "Year"])),
+    "u": ("{:d}", _weekday_number, r"[0-7]"),
+    "W": ("{}", _week_of_year, r"[0-9]{2}"),
+    "w": ("{:d}", attrgetter("week_of_month"), r"[1-4]"),
+    "q": ("{:d}", attrgetter("year_quarter"), r"[1-4]"),
+}
+
+_DIRECTIVE_PATTERN = re.compile(r"%(.)", re.DOTALL)
+
+def _tokenize(format_string: str) -> list:
+    """Split format string into literal strings and directive letters.
+
+    Raises:
+        ValueError: Format string contains unknown directive.
+    """
+    tokens = []
+    position = 0
+    for match in _DIRECTIVE_PATTERN.finditer(format_string):
+        literal = format_string[position:match.start()]
+        letter = match.group(1)
+        if letter == "%":
+            literal += "%"
+        elif letter not in DIRECTIVES:
+            raise ValueError(f"Unknown format directive %{letter}")
+        if literal:
+            tokens.append(literal)
+        if letter != "%":
+            tokens.append((letter,))
+        position = match.end()
+    rest = format_string[position:]
+    if "%" in rest:
+        raise ValueError("Format string should not end with a single %")
+    if rest:
+        tokens.append(rest)
+    return tokens
+
+@lru_cache(maxsize=128)
+def compile_formatter(format_string: str) -> tuple:
+    """Compile format string into a `str.format` template and value getters.
+
+    Args:
+        format_string (str): Format with directives listed in `DIRECTIVES`
+
+    Raises:
+        ValueError: Format string contains unknown directive.
+
+    Returns:
+        tuple: Template string and a tuple of getters taking the date.
+    """
+    template = []
+    getters = []
+    for token in _tokenize(format_string):
+        if isinstance(token, tuple):
+            field, getter, _ = DIRECTIVES[token[0]]
+            template.append(field)
+            getters.append(getter)
+        else:
+            template.append(token.replace("{", "{{").replace("}", "}}"))
+    return ("".join(template), tuple(getters))
+
+@lru_cache(maxsize=128)
+def compile_parser(format_string: str) -> tuple:
+    """Compile format string into a regular expression.
+
+    Args:
+        format_string (str): Format with directives listed in `DIRECTIVES`
+
+    Raises:
+        ValueError: Format string contains unknown directive or lacks
+            the directives needed to determine the date.
+
+    Returns:
+        tuple: Compiled pattern with directive letters as group names and a boolean
+        telling whether the parsed date should be verified by formatting it again.
+    """
+    pattern = []
+    letters = set()
+    needs_verification = False
+    for token in _tokenize(format_string):
+        if isinstance(token, tuple):
+            letter = token[0]
+            if letter in letters:
+                pattern.append(f"(?:{DIRECTIVES[letter][2]})")
+                needs_verification = True
+            else:
+                pattern.append(f"(?P<{letter}>{DIRECTIVES[letter][2]})")
+                letters.add(letter)
+        else:
+            pattern.append(re.escape(token))
+
+    if "Y" not in letters:
+        raise ValueError("Format should contain year (%Y)")
+    if "j" not in letters and not ("d" in letters and letters & {"m", "B", "b"}):
+        raise ValueError("Format should contain day of year (%j) or day and month (%d and %m)")
+    if letters - {"Y", "m", "d", "j", "B", "b"} or len(letters & {"j", "m", "B", "b"}) > 1 \
+            or {"j", "d"} <= letters:
+        # some parsed values are not used to construct the date
+        needs_verification = True
+    return (re.compile("".join(pattern)), needs_verification)
+
+def parsed_fields(match: re.Match) -> dict:
+    """Construction arguments of `FixedDate` from a match of a compiled parser.
+
+    Args:
+        match (re.Match): Successful match of a pattern from `compile_parser`
+
+    Returns:
+        dict: Either day_of_year and year or day, month and year.
+    """
+    groups = match.groupdict()
+    year = int(groups["Y"])
+    if groups.get("j") is not None:
+        return {"day_of_year": int(groups["j"]), "year": year}
+    if groups.get("m") is not None:
+        month = int(groups["m"])
+    elif groups.get("B") is not None:
+        month = MONTH_NAMES.index(groups["B"]) + 1
+    else:
+        month = [name[:3] for name in MONTH_NAMES].index(groups["b"]) + 1
+    return {"day": int(groups["d"]), "month": month, "year": year}
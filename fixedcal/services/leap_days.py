@@ -1,13 +1,56 @@
 import datetime
+from fixedcal.services.speedups import accelerated
 
+@accelerated
 def is_leap_year(year: int) -> bool:
     if year % 100 == 0:
         return year % 4 == 0 and year % 400 == 0
     return year % 4 == 0
 
+GREGORIAN_LEAP_DAY_OF_YEAR = 60     # 29th Feb
+FIXED_LEAP_DAY_OF_YEAR = 179        # 27th June, see fixed_leap_days_between
+
+@accelerated
+def leap_years_before(year: int) -> int:
+    """Counts the leap years from year 1 up to, but not including, the given year.
+
+    Args:
+        year (int): The first year that is not included in the count
+
+    Returns:
+        int: Count of the leap years.
+    """
+    year -= 1
+    return year // 4 - year // 100 + year // 400
+
+@accelerated
+def leap_days_before(year: int, day_of_year: int, leap_day_of_year: int) -> int:
+    """Counts the occurrences of a leap-year-only day
+    that fall strictly before the given day.
+
+    Args:
+        year (int): The year of the day
+        day_of_year (int): Ordinal of the day in its year
+        leap_day_of_year (int): Ordinal of the counted day in leap years,
+            `GREGORIAN_LEAP_DAY_OF_YEAR` or `FIXED_LEAP_DAY_OF_YEAR`
+
+    Returns:
+        int: Count of the leap days.
+    """
+    count = leap_years_before(year)
+    if day_of_year > leap_day_of_year and is_leap_year(year):
+        count += 1
+    return count
+
+def _leap_days_before_date(date: datetime.date, leap_day_of_year: int) -> int:
+    year = date.year
+    # day of year from the ordinal, closed-form as building a time tuple is slow
+    day_of_year = date.toordinal() - 365*(year-1) - leap_years_before(year)
+    return leap_days_before(year, day_of_year, leap_day_of_year)
+
 def gregorian_leap_days_between(date1: datetime.date, date2: datetime.date) -> int:
     """Counts the gregorian leap days (29th Feb) between given dates.
-    Count includes both ends (date1 and date2 themselves).
+    Count includes the earlier date but not the later one.
 
     Args:
         date1 (datetime.date): The beginning of the count
@@ -16,23 +59,20 @@ def gregorian_leap_days_between(date1: datetime.date, date2: datetime.date) -> i
     Returns:
         int: Count of the leap days.
     """
-    count = 0
-    if date1 > date2:
-        date1, date2 = date2, date1
-    days_between = (date2 - date1).days
-    for plusday in range(0, days_between):
-        date = date1 + datetime.timedelta(plusday)
-        if is_leap_year(date.year) and date.month == 2 and date.day == 29:
-            count += 1
-    return count
+    return abs(_leap_days_before_date(date2, GREGORIAN_LEAP_DAY_OF_YEAR)
+               - _leap_days_before_date(date1, GREGORIAN_LEAP_DAY_OF_YEAR))
 
 def fixed_leap_days_between(date1: datetime.date, date2: datetime.date) -> int:
-    count = 0
-    if date1 > date2:
-        date1, date2 = date2, date1
-    days_between = (date2 - date1).days
-    for plusday in range(0, days_between):
-        date = date1 + datetime.timedelta(plusday)
-        if is_leap_year(date.year) and date.month == 6 and date.day == 27:
-            count += 1
-    return count
+    """Counts the fixed leap days between given dates.
+    Fixed leap day is counted on 27th June (Gregorian) of leap years.
+    Count includes the earlier date but not the later one.
+
+    Args:
+        date1 (datetime.date): The beginning of the count
+        date2 (datetime.date): The end of the count
+
+    Returns:
+        int: Count of the leap days.
+    """
+    return abs(_leap_days_before_date(date2, FIXED_LEAP_DAY_OF_YEAR)
+               - _leap_days_before_date(date1, FIXED_LEAP_DAY_OF_YEAR))
@@ -0,0 +1,103 @@
+from fixedcal.services.speedups import accelerated
+from fixedcal.services.year_table import get_year_table
+
+MIN_ORDINAL = 1             # ordinal of 0001-01-01
+MAX_ORDINAL = 3652059       # ordinal of 9999-12-31
+
+PACKED_ORDINAL_SIZE = 4     # bytes of an ordinal packed as little-endian signed integer
+
+@accelerated
+def year_start_ordinal(year: int) -> int:
+    """Proleptic Gregorian ordinal of the first day of the given year.
+    Matches `datetime.date(year, 1, 1).toordinal()`.
+
+    Args:
+        year (int): The year in range 1...9999
+
+    Returns:
+        int: Ordinal of the first day of the year.
+    """
+    return get_year_table().year_starts[year]
+
+@accelerated
+def year_and_day_of_year(ordinal: int) -> tuple:
+    """Split proleptic Gregorian ordinal into year and the ordinal of the day in year.
+
+    Args:
+        ordinal (int): Ordinal in range 1...3652059
+
+    Returns:
+        tuple: year (1...9999) and day of year (1...366) in a tuple
+    """
+    year_starts = get_year_table().year_starts
+    # average year length gives the year or one of its neighbours
+    year = (ordinal-1) * 400 // 146097 + 1
+    if ordinal < year_starts[year]:
+        year -= 1
+    elif ordinal >= year_starts[year+1]:
+        year += 1
+    return (year, ordinal - year_starts[year] + 1)
+
+def _month_and_day_table(leap_year: int) -> tuple:
+    table = [None]                                          # days of year start from 1
+    for day_of_year in range(1, 366 + leap_year):
+        if leap_year and day_of_year == 169:                # leap day
+            table.append((6, 29))
+        elif day_of_year == 365 + leap_year:                # year day
+            table.append((13, 29))
+        else:
+            index = day_of_year - 1 - (leap_year and day_of_year > 169)
+            table.append((index // 28 + 1, index % 28 + 1))
+    return tuple(table)
+
+# month and day of month of each day of year, indexed by leap flag and day of year
+_MONTH_AND_DAY = (_month_and_day_table(0), _month_and_day_table(1))
+
+@accelerated
+def fixed_fields(day_of_year: int, year: int) -> tuple:
+    """Derive the IFC fields of a day.
+
+    Args:
+        day_of_year (int): In range 1...366
+        year (int): In range 1...9999
+
+    Returns:
+        tuple: Ordinal, month, day of month and whether the year is leap year.
+    """
+    year_starts, leap_flags = get_year_table()
+    leap_year = leap_flags[year]
+    month, day_of_month = _MONTH_AND_DAY[leap_year][day_of_year]
+    return (year_starts[year] + day_of_year - 1, month, day_of_month, leap_year == 1)
+
+def regular_day_index(ordinal: int) -> int:
+    """Index of the day when counting only the days belonging to some IFC month,
+    that is, all days except leap days and year days, starting from zero on 0001-01-01.
+    Leap day and year day get the index of the following regular day.
+
+    Args:
+        ordinal (int): Ordinal in range 1...3652059
+
+    Returns:
+        int: Index of the day among regular days.
+    """
+    year, day_of_year = year_and_day_of_year(ordinal)
+    leap_year = get_year_table().leap_flags[year]
+    if day_of_year == 365 + leap_year:                      # year day
+        return 364 * year
+    return 364*(year-1) + day_of_year - 1 - (leap_year and day_of_year > 169)
+
+def regular_day_ordinal(index: int) -> int:
+    """Inverse of `regular_day_index` for regular days.
+
+    Args:
+        index (int): Index of the day among regular days, non-negative
+
+    Returns:
+        int: Ordinal of the day, beyond `MAX_ORDINAL` for indices after year 9999.
+    """
+    year_table = get_year_table()
+    year, index = divmod(index, 364)
+    year += 1
+    if year > 9999:
+        return MAX_ORDINAL + 1 + 364*(year-10000) + index
+    return year_table.year_starts[year] + index + (year_table.leap_flags[year] and index >= 168)
@@ -0,0 +1,34 @@
+from collections import deque
+
+def ordered_imap(function, items, workers: int, max_pending: int):
+    """Apply the function to the items in worker processes, like `multiprocessing.Pool.imap`.
+    Items are submitted lazily, so that at most `max_pending` of them are in progress
+    or waiting to be yielded at the same time.
+
+    Args:
+        function (Callable): Picklable function of one argument
+        items (Iterable): Picklable arguments of the function
+        workers (int): Count of worker processes, 0 to apply the function in this process
+        max_pending (int): Maximum count of submitted items whose result is not yielded yet
+
+    Yields:
+        Any: Results in the order of the items.
+    """
+    if workers <= 0:
+        yield from map(function, items)
+        return
+    # imported only when needed, as it takes longer than importing the rest of fixedcal
+    from concurrent.futures import ProcessPoolExecutor # pylint: disable=import-outside-toplevel
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # consumer stopped early or some item failed
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,34 @@
+import os
+
+PURE_PYTHON_VARIABLE = "FIXEDCAL_PURE_PYTHON"
+
+# pure Python implementations of the accelerated functions keyed with their names
+PURE_PYTHON = {}
+
+def _load_speedups():
+    if os.environ.get(PURE_PYTHON_VARIABLE, "") not in ("", "0"):
+        return None
+    try:
+        from fixedcal import _speedups # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return _speedups
+
+_speedups = _load_speedups()
+
+ENABLED = _speedups is not None
+
+def accelerated(function):
+    """Decorator replacing the function with its counterpart from the compiled
+    `fixedcal._speedups` extension when the extension is available and
+    the environment variable `FIXEDCAL_PURE_PYTHON` is not set.
+    The pure Python function is kept in `PURE_PYTHON`.
+
+    Args:
+        function (Callable): Pure Python implementation
+
+    Returns:
+        Callable: The compiled function or the given one.
+    """
+    PURE_PYTHON[function.__name__] = function
+    return getattr(_speedups, function.__name__, function)
@@ -0,0 +1,52 @@
+from typing import NamedTuple
+
+RAISE = "raise"
+MASK = "mask"
+COLLECT = "collect"
+ERROR_MODES = (RAISE, MASK, COLLECT)
+
+class FieldError(NamedTuple):
+    """Invalid row found in batch conversion of IFC fields.
+
+    Attributes:
+        index (int): Position of the row in the input.
+        message (str): Reason why the row is invalid.
+    """
+    index: int
+    message: str
+
+def check_error_mode(errors: str) -> None:
+    """Validate the error handling mode of a batch conversion.
+
+    Args:
+        errors (str): "raise", "mask" or "collect"
+
+    Raises:
+        ValueError: The mode is unknown.
+    """
+    if errors not in ERROR_MODES:
+        raise ValueError(f"Parameter errors should be one of {', '.join(ERROR_MODES)}")
+
+def field_error(day, month, year, leap_flags: bytes) -> str:
+    """Validate IFC day of month, month and year.
+    Year is checked first, then month, and day of month last.
+
+    Args:
+        day (int): Day of month
+        month (int): Month
+        year (int): Year
+        leap_flags (bytes): Leap flags of `fixedcal.services.year_table.YearTable`
+
+    Returns:
+        Optional[str]: Description of the first invalid field, None if the fields are valid.
+    """
+    if not (isinstance(day, int) and isinstance(month, int) and isinstance(year, int)):
+        return "Day, month and year should be integers"
+    if year < 1 or year > 9999:
+        return "Year should be in range 1...9999"
+    if month < 1 or month > 13:
+        return "Month should be in range 1...13"
+    maximum_day = 29 if month == 13 or (month == 6 and leap_flags[year]) else 28
+    if day < 1 or day > maximum_day:
+        return f"Day should be in range 1...{maximum_day}"
+    return None
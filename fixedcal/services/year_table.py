@@ -0,0 +1,37 @@
+from array import array
+from typing import NamedTuple
+from fixedcal.services.leap_days import is_leap_year, leap_years_before
+
+FIRST_YEAR = 1
+LAST_YEAR = 9999
+
+class YearTable(NamedTuple):
+    """Precomputed data of years, indexed by the year itself.
+
+    Attributes:
+        year_starts (array): Proleptic Gregorian ordinal of the first day of each year.
+            Covers years 0...10000, year 10000 being a sentinel ending year 9999.
+        leap_flags (bytes): 1 for leap years and 0 for others, covers years 0...10000.
+    """
+    year_starts: array
+    leap_flags: bytes
+
+_year_table = None
+
+def _build_year_table() -> YearTable:
+    years = range(FIRST_YEAR-1, LAST_YEAR+2)
+    year_starts = array("i", (365*(year-1) + leap_years_before(year) + 1 for year in years))
+    leap_flags = bytes(is_leap_year(year) for year in years)
+    return YearTable(year_starts, leap_flags)
+
+def get_year_table() -> YearTable:
+    """The table of years 1...9999, built on the first call and shared after that.
+    The table must not be modified.
+
+    Returns:
+        YearTable: The shared table.
+    """
+    global _year_table # pylint: disable=global-statement
+    if _year_table is None:
+        _year_table = _build_year_table()
+    return _year_table
@@ -0,0 +1,245 @@
+"""Vectorized conversion of Gregorian date arrays into IFC fields.
+
+This module requires NumPy, which is available as an optional extra:
+``pip install fixedcal[numpy]``.
+
+Dates are given either as ``datetime64`` arrays or as arrays of proleptic
+Gregorian ordinals (as returned by ``datetime.date.toordinal``).
+The produced fields follow the semantics of the properties of ``FixedDate``.
+Because arrays cannot hold ``None``, weekday of leap day and year day
+is given as ``WEEKDAY_NONE``.
+"""
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("fixedcal.vectorized requires NumPy, "
+                      "install it with `pip install fixedcal[numpy]`") from error
+
+from fixedcal.services.ordinals import MIN_ORDINAL, MAX_ORDINAL
+from fixedcal.services.validation import FieldError, check_error_mode, field_error, RAISE, MASK
+from fixedcal.services.year_table import get_year_table
+
+WEEKDAY_NONE = 0            # weekday of leap day and year day
+
+_EPOCH_ORDINAL = 719163     # ordinal of 1970-01-01, the epoch of datetime64
+
+FIELDS_DTYPE = np.dtype([
+    ("year", np.int16),
+    ("day_of_year", np.int16),
+    ("month", np.int8),
+    ("day_of_month", np.int8),
+    ("week_of_month", np.int8),
+    ("weekday", np.int8),
+    ("week_of_year", np.int8),
+    ("year_quarter", np.int8),
+    ("is_leap_year", np.bool_),
+    ("is_leap_day", np.bool_),
+    ("is_year_day", np.bool_),
+])
+
+def to_ordinals(dates) -> np.ndarray:
+    """Convert dates into an array of proleptic Gregorian ordinals.
+
+    Args:
+        dates (array_like): Either datetime64 values or integer ordinals.
+
+    Raises:
+        ValueError: Some date is NaT or outside the range of years 1...9999.
+
+    Returns:
+        np.ndarray: Ordinals as int64 array.
+    """
+    dates = np.asarray(dates)
+    if np.issubdtype(dates.dtype, np.datetime64):
+        days = dates.astype("datetime64[D]")
+        if np.isnat(days).any():
+            raise ValueError("Dates should not contain NaT")
+        ordinals = days.astype(np.int64) + _EPOCH_ORDINAL
+    elif np.issubdtype(dates.dtype, np.integer):
+        ordinals = dates.astype(np.int64)
+    else:
+        raise ValueError("Dates should be given as datetime64 or integer ordinal array")
+
+    if ordinals.size and (ordinals.min() < MIN_ORDINAL or ordinals.max() > MAX_ORDINAL):
+        raise ValueError("Dates should be in range of years 1...9999")
+    return ordinals
+
+def is_leap_year(years) -> np.ndarray:
+    """Vectorized counterpart of `fixedcal.services.leap_days.is_leap_year`.
+
+    Args:
+        years (array_like): Integer years
+
+    Returns:
+        np.ndarray: Boolean array
+    """
+    years = np.asarray(years)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+def year_and_day_of_year(ordinals) -> tuple:
+    """Split Gregorian ordinals into years and ordinals of the days in year.
+
+    Args:
+        ordinals (array_like): Proleptic Gregorian ordinals
+
+    Returns:
+        tuple: Years and days of year (1...366) as int64 arrays
+    """
+    days = np.asarray(ordinals, dtype=np.int64) - 1
+    cycles_400, days = np.divmod(days, 146097)
+    cycles_100, days = np.divmod(days, 36524)
+    cycles_4, days = np.divmod(days, 1461)
+    cycles_1, days = np.divmod(days, 365)
+    years = 400*cycles_400 + 100*cycles_100 + 4*cycles_4 + cycles_1 + 1
+
+    # the last day of a leap year or of a 400-year cycle overflows into the next cycle
+    last_of_cycle = (cycles_1 == 4) | (cycles_100 == 4)
+    years = np.where(last_of_cycle, years-1, years)
+    day_of_year = np.where(last_of_cycle, 366, days+1)
+    return years, day_of_year
+
+def to_fixed_fields(dates) -> dict:
+    """Convert dates into IFC fields.
+
+    Args:
+        dates (array_like): Either datetime64 values or integer ordinals.
+
+    Returns:
+        dict: Arrays keyed with the names of the fields in `FIELDS_DTYPE`.
+    """
+    years, day_of_year = year_and_day_of_year(to_ordinals(dates))
+
+    leap_year = is_leap_year(years)
+    leap_day = leap_year & (day_of_year == 169)
+    year_day = day_of_year == 365 + leap_year
+    special_day = leap_day | year_day
+
+    past_leap_day = leap_year & (day_of_year > 169)
+    day_in_months = day_of_year - 1 - past_leap_day     # zero-based, leap day skipped
+    month = np.where(leap_day, 6, np.where(year_day, 13, (day_in_months // 28) + 1))
+    day_of_month = np.where(special_day, 29, (day_in_months % 28) + 1)
+    week_of_year = np.where(leap_day, 24, np.where(year_day, 52, (day_in_months // 7) + 1))
+    year_quarter = ((week_of_year-1) // 13) + 1
+
+    fields = {
+        "year": years,
+        "day_of_year": day_of_year,
+        "month": month,
+        "day_of_month": day_of_month,
+        "week_of_month": np.where(special_day, 4, ((day_of_month-1) // 7) + 1),
+        "weekday": np.where(special_day, WEEKDAY_NONE, ((day_of_month-1) % 7) + 1),
+        "week_of_year": week_of_year,
+        "year_quarter": year_quarter,
+        "is_leap_year": leap_year,
+        "is_leap_day": leap_day,
+        "is_year_day": year_day,
+    }
+    return {name: fields[name].astype(FIELDS_DTYPE[name]) for name in FIELDS_DTYPE.names}
+
+def to_fixed_records(dates) -> np.ndarray:
+    """Convert dates into a structured array of IFC fields.
+
+    Args:
+        dates (array_like): Either datetime64 values or integer ordinals.
+
+    Returns:
+        np.ndarray: Structured array with dtype `FIELDS_DTYPE`.
+    """
+    fields = to_fixed_fields(dates)
+    records = np.empty(fields["year"].shape, dtype=FIELDS_DTYPE)
+    for name, values in fields.items():
+        records[name] = values
+    return records
+
+def timestamps_to_fixed_fields(timestamps, utc_offset: int = 0) -> dict:
+    """Convert POSIX timestamps into IFC fields and time of day.
+    Counterpart of `FixedDateTime.fromtimestamp` for a fixed-offset timezone.
+
+    Args:
+        timestamps (array_like): Integer seconds since 1970-01-01 00:00 UTC
+        utc_offset (int): Offset of the timezone from UTC in seconds
+
+    Raises:
+        ValueError: Some moment is outside the range of years 1...9999.
+
+    Returns:
+        dict: Arrays of the fields in `FIELDS_DTYPE` as well as
+        hour, minute and second (int8) of the local time.
+    """
+    timestamps = np.asarray(timestamps)
+    if not np.issubdtype(timestamps.dtype, np.integer):
+        raise ValueError("Timestamps should be given as integer array")
+    days, seconds = np.divmod(timestamps.astype(np.int64) + utc_offset, 86400)
+    fields = to_fixed_fields(days + _EPOCH_ORDINAL)
+    minutes, second = np.divmod(seconds, 60)
+    hour, minute = np.divmod(minutes, 60)
+    fields["hour"] = hour.astype(np.int8)
+    fields["minute"] = minute.astype(np.int8)
+    fields["second"] = second.astype(np.int8)
+    return fields
+
+def from_fixed_fields(days, months, years, errors: str = RAISE):
+    """Validate and convert IFC fields into ordinals.
+    Vectorized counterpart of `FixedDate.from_fields_many`.
+
+    Args:
+        days (array_like): Integer days of month in range 1...29
+        months (array_like): Integer months in range 1...13
+        years (array_like): Integer years in range 1...9999
+        errors (str): What to do with invalid rows: "raise" raises ValueError,
+            "mask" and "collect" give them ordinal 0 and report them as
+            a boolean mask or a list of `FieldError`s.
+
+    Raises:
+        ValueError: Arrays are not integer arrays of the same shape, the error mode
+            is unknown, or some row is invalid and errors is "raise".
+
+    Returns:
+        Union[np.ndarray, tuple]: With "raise", the int64 array of proleptic ordinals.
+        With "mask", the ordinals and a boolean array telling which rows are invalid.
+        With "collect", the ordinals and a list of `FieldError`s of the invalid rows.
+    """
+    check_error_mode(errors)
+    days, months, years = (np.asarray(values) for values in (days, months, years))
+    if not days.shape == months.shape == years.shape:
+        raise ValueError("Parameters days, months and years should have equal shapes")
+    if not all(np.issubdtype(values.dtype, np.integer) for values in (days, months, years)):
+        raise ValueError("Days, months and years should be given as integer arrays")
+    days, months, years = (values.astype(np.int64) for values in (days, months, years))
+
+    leap_year = is_leap_year(years)
+    maximum_day = np.where((months == 13) | ((months == 6) & leap_year), 29, 28)
+    invalid = (years < 1) | (years > 9999) | (months < 1) | (months > 13) \
+        | (days < 1) | (days > maximum_day)
+    if errors == RAISE and invalid.any():
+        index = int(np.flatnonzero(invalid)[0])
+        row = (days.flat[index], months.flat[index], years.flat[index])
+        message = field_error(*(int(value) for value in row), get_year_table().leap_flags)
+        raise ValueError(f"Invalid date on row {index}: {message}")
+
+    past_leap_day = leap_year & (months > 6)
+    ordinals = year_start_ordinals(years) + 28*(months-1) + days - 1 + past_leap_day
+    ordinals[invalid] = 0
+    if errors == RAISE:
+        return ordinals
+    if errors == MASK:
+        return ordinals, invalid
+    leap_flags = get_year_table().leap_flags
+    return ordinals, [FieldError(int(index), field_error(int(days.flat[index]),
+                                                         int(months.flat[index]),
+                                                         int(years.flat[index]), leap_flags))
+                      for index in np.flatnonzero(invalid)]
+
+def year_start_ordinals(years) -> np.ndarray:
+    """Proleptic Gregorian ordinals of the first days of years.
+
+    Args:
+        years (array_like): Years in range 1...10000, 10000 for the day after year 9999
+
+    Returns:
+        np.ndarray: Ordinals as int64 array
+    """
+    previous_years = np.asarray(years, dtype=np.int64) - 1
+    leap_years_before = previous_years//4 - previous_years//100 + previous_years//400
+    return 365*previous_years + leap_years_before + 1
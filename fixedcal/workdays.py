@@ -0,0 +1,351 @@
+"""Working day arithmetic on IFC dates.
+
+Every IFC month starts on Sunday, so the weekday of a date follows directly
+from its position among the regular days, that is, the days other than leap day
+and year day. Counting workdays is therefore closed-form, and only holidays
+need a binary search::
+
+    calendar = WorkCalendar(weekend=(1, 7), holidays=[FixedDate(day=1, month=1, year=2024)])
+    calendar.add_workdays(FixedDate(day=27, month=13, year=2023), 2)
+    calendar.workdays_between(start, end)
+
+For arrays of dates, `workday_mask`, `workdays_between_arrays` and `add_workdays_arrays`
+do the same with NumPy, which is imported only when they are first called.
+"""
+
+from bisect import bisect_left, bisect_right
+from fixedcal.core.date import FixedDate
+from fixedcal.services.leap_days import leap_years_before
+from fixedcal.services.ordinals import year_and_day_of_year
+from fixedcal.services.year_table import FIRST_YEAR, LAST_YEAR, get_year_table
+
+WORKDAY = "workday"
+DAY_OFF = "day_off"
+
+_LEAP_DAY_OF_YEAR = 169
+_WEEKS_BEFORE_LEAP_DAY = 24
+
+def _numpy() -> tuple:
+    """NumPy and `fixedcal.vectorized`, imported on first use of the array methods"""
+    # pylint: disable=import-outside-toplevel
+    import numpy
+    from fixedcal import vectorized
+    return numpy, vectorized
+
+class WorkCalendar:
+    """Calendar of workdays. Instances are immutable.
+
+    Args:
+        weekend (Iterable[int]): Weekdays that are not workdays, 1 for Sunday and 7 for Saturday
+            like in `FixedDate.weekday`. Saturday and Sunday by default.
+        holidays (Iterable[Union[FixedDate, datetime.date]]): Dates that are not workdays
+        special_days (str): "workday" if leap day and year day are workdays,
+            "day_off" (the default) if not
+
+    Raises:
+        ValueError: Weekend covers all weekdays or special day policy is unknown.
+    """
+
+    def __init__(self, weekend=(1, 7), holidays=(), special_days: str = DAY_OFF) -> None:
+        weekend = frozenset(weekend)
+        if not weekend <= set(range(1, 8)):
+            raise ValueError("Weekend should consist of weekdays 1...7")
+        if len(weekend) == 7:
+            raise ValueError("Weekend should not cover all weekdays")
+        if special_days not in (WORKDAY, DAY_OFF):
+            raise ValueError(f"Special days should be either {WORKDAY} or {DAY_OFF}")
+
+        self._special_workdays = int(special_days == WORKDAY)
+        workday_offsets = [offset for offset in range(7) if offset+1 not in weekend]
+        self._workday_offsets = tuple(workday_offsets)
+        self._workdays_per_week = len(workday_offsets)
+        # count of workdays among the first k days of a week
+        self._workdays_before_offset = tuple(sum(1 for offset in workday_offsets if offset < k)
+                                             for k in range(8))
+        self._workdays_per_year = 52 * self._workdays_per_week
+
+        # only holidays falling on otherwise working days affect the counts
+        self._holidays = tuple(sorted({holiday.toordinal() for holiday in holidays
+                                       if self._is_base_workday(holiday.toordinal())}))
+        # i-th holiday is preceded by this many workdays, holidays excluded
+        self._holiday_positions = tuple(self._base_workdays_before(ordinal) - index
+                                        for index, ordinal in enumerate(self._holidays))
+
+    @property
+    def weekend(self) -> frozenset:
+        """Weekdays that are not workdays"""
+        return frozenset(offset+1 for offset in range(7) if offset not in self._workday_offsets)
+
+    @property
+    def holidays(self) -> tuple:
+        """Sorted ordinals of the holidays falling on days that would otherwise be workdays"""
+        return self._holidays
+
+    @property
+    def special_days(self) -> str:
+        """Policy of leap day and year day, either "workday" or "day_off\""""
+        return WORKDAY if self._special_workdays else DAY_OFF
+
+    def _is_base_workday(self, ordinal: int) -> bool:
+        """Whether the day is a workday when holidays are not taken into account"""
+        year, day_of_year = year_and_day_of_year(ordinal)
+        leap_year = get_year_table().leap_flags[year]
+        if day_of_year == 365 + leap_year or (leap_year and day_of_year == _LEAP_DAY_OF_YEAR):
+            return bool(self._special_workdays)
+        regular_index = day_of_year - 1 - (leap_year and day_of_year > _LEAP_DAY_OF_YEAR)
+        return regular_index % 7 in self._workday_offsets
+
+    def _workdays_before_year(self, year: int) -> int:
+        special_days = (year-1) + leap_years_before(year)
+        return (year-1) * self._workdays_per_year + special_days * self._special_workdays
+
+    def _base_workdays_before(self, ordinal: int) -> int:
+        """Count of workdays before the day since the beginning of year 1, holidays included"""
+        year, day_of_year = year_and_day_of_year(ordinal)
+        past_leap_day = get_year_table().leap_flags[year] and day_of_year > _LEAP_DAY_OF_YEAR
+        regular_index = day_of_year - 1 - past_leap_day     # regular days before this day
+        weeks, offset = divmod(regular_index, 7)
+        return self._workdays_before_year(year) \
+            + weeks * self._workdays_per_week + self._workdays_before_offset[offset] \
+            + past_leap_day * self._special_workdays
+
+    def _base_workday_at(self, position: int) -> int:
+        """Ordinal of the workday preceded by the given count of workdays, holidays included"""
+        year_table = get_year_table()
+        # average length of year gives the year or one of its neighbours
+        workdays_per_year = self._workdays_per_year + self._special_workdays * 1.2425
+        year = min(int(position / workdays_per_year) + 1, LAST_YEAR + 1)
+        while year > FIRST_YEAR and self._workdays_before_year(year) > position:
+            year -= 1
+        while year <= LAST_YEAR and self._workdays_before_year(year+1) <= position:
+            year += 1
+        if year > LAST_YEAR:
+            raise OverflowError("Result is out of range of years 1...9999")
+
+        position -= self._workdays_before_year(year)
+        leap_year = year_table.leap_flags[year]
+        leap_day_position = _WEEKS_BEFORE_LEAP_DAY * self._workdays_per_week
+        if self._special_workdays and leap_year and position >= leap_day_position:
+            if position == leap_day_position:
+                return year_table.year_starts[year] + _LEAP_DAY_OF_YEAR - 1
+            position -= 1
+        if position == self._workdays_per_year:                 # year day is a workday
+            return year_table.year_starts[year+1] - 1
+        weeks, index = divmod(position, self._workdays_per_week)
+        regular_index = 7*weeks + self._workday_offsets[index]
+        if leap_year and regular_index >= _LEAP_DAY_OF_YEAR - 1:
+            regular_index += 1
+        return year_table.year_starts[year] + regular_index
+
+    def _workdays_before(self, ordinal: int) -> int:
+        return self._base_workdays_before(ordinal) - bisect_left(self._holidays, ordinal)
+
+    def _workday_at(self, position: int) -> FixedDate:
+        if position < 0:
+            raise OverflowError("Result is out of range of years 1...9999")
+        # holidays are skipped by moving forward past each one preceding the position
+        position += bisect_right(self._holiday_positions, position)
+        return FixedDate.fromordinal(self._base_workday_at(position))
+
+    def _workdays_before_years(self, years):
+        _, vectorized = _numpy()
+        special_days = vectorized.year_start_ordinals(years) - 1 - 364*(years-1)
+        return (years-1) * self._workdays_per_year + special_days * self._special_workdays
+
+    def _split_ordinals(self, ordinals) -> tuple:
+        """Arrays of years, whether the day is leap day or year day,
+        regular days before the day in its year and whether leap day is before the day"""
+        _, vectorized = _numpy()
+        years, day_of_year = vectorized.year_and_day_of_year(ordinals)
+        leap_year = vectorized.is_leap_year(years)
+        special_day = (day_of_year == 365 + leap_year) \
+            | (leap_year & (day_of_year == _LEAP_DAY_OF_YEAR))
+        past_leap_day = leap_year & (day_of_year > _LEAP_DAY_OF_YEAR)
+        return years, special_day, day_of_year - 1 - past_leap_day, past_leap_day
+
+    def _base_workdays_before_array(self, ordinals):
+        """Array counterpart of `_base_workdays_before`"""
+        np, _ = _numpy()
+        years, _, regular_index, past_leap_day = self._split_ordinals(ordinals)
+        return self._workdays_before_years(years) \
+            + (regular_index // 7) * self._workdays_per_week \
+            + np.asarray(self._workdays_before_offset)[regular_index % 7] \
+            + past_leap_day * self._special_workdays
+
+    def _workdays_before_array(self, ordinals):
+        np, _ = _numpy()
+        return self._base_workdays_before_array(ordinals) \
+            - np.searchsorted(np.asarray(self._holidays, dtype=np.int64), ordinals, side="left")
+
+    def _base_workdays_at_array(self, positions):
+        """Array counterpart of `_base_workday_at`"""
+        np, vectorized = _numpy()
+        # average length of year gives the year or one of its neighbours
+        workdays_per_year = self._workdays_per_year + self._special_workdays * 1.2425
+        years = np.minimum(positions // workdays_per_year + 1, LAST_YEAR + 1).astype(np.int64)
+        for _ in range(2):
+            years = np.where((years > FIRST_YEAR)
+                             & (self._workdays_before_years(years) > positions),
+                             years-1, years)
+            years = np.where((years <= LAST_YEAR)
+                             & (self._workdays_before_years(years+1) <= positions),
+                             years+1, years)
+        if years.size and years.max() > LAST_YEAR:
+            raise OverflowError("Result is out of range of years 1...9999")
+
+        positions = positions - self._workdays_before_years(years)
+        year_starts = vectorized.year_start_ordinals(years)
+        leap_year = vectorized.is_leap_year(years)
+        leap_day_position = _WEEKS_BEFORE_LEAP_DAY * self._workdays_per_week
+        special_leap_year = leap_year & bool(self._special_workdays)
+        leap_day = special_leap_year & (positions == leap_day_position)
+        positions = positions - (special_leap_year & (positions > leap_day_position))
+        year_day = positions == self._workdays_per_year
+        weeks, index = np.divmod(positions, self._workdays_per_week)
+        regular_index = 7*weeks + np.asarray(self._workday_offsets)[index]
+        regular_index += leap_year & (regular_index >= _LEAP_DAY_OF_YEAR - 1)
+        return np.where(leap_day, year_starts + _LEAP_DAY_OF_YEAR - 1,
+                        np.where(year_day, year_starts + 364 + leap_year,
+                                 year_starts + regular_index))
+
+    def is_workday(self, date) -> bool:
+        """Whether the date is a workday.
+
+        Args:
+            date (Union[FixedDate, datetime.date]): The date
+
+        Returns:
+            bool: False for weekends and holidays, and for leap day and year day
+            unless they are workdays by the policy.
+        """
+        ordinal = date.toordinal()
+        if not self._is_base_workday(ordinal):
+            return False
+        index = bisect_left(self._holidays, ordinal)
+        return index == len(self._holidays) or self._holidays[index] != ordinal
+
+    def workdays_between(self, start, end) -> int:
+        """Count of workdays from start (inclusive) to end (exclusive).
+
+        Args:
+            start (Union[FixedDate, datetime.date]): The first date of the span
+            end (Union[FixedDate, datetime.date]): The date ending the span, not itself included
+
+        Returns:
+            int: Count of workdays, negative if end is before start.
+        """
+        return self._workdays_before(end.toordinal()) - self._workdays_before(start.toordinal())
+
+    def add_workdays(self, date, workdays: int) -> FixedDate:
+        """The date the given count of workdays later.
+        With zero, the date itself if it is a workday and the next workday otherwise.
+
+        Args:
+            date (Union[FixedDate, datetime.date]): The starting date
+            workdays (int): Count of workdays, negative to go backwards
+
+        Raises:
+            OverflowError: The result is outside of years 1...9999.
+
+        Returns:
+            FixedDate: The resulting workday.
+        """
+        ordinal = date.toordinal()
+        position = self._workdays_before(ordinal)
+        if workdays > 0 and self.is_workday(date):
+            position += workdays
+        else:
+            position += workdays - (workdays > 0)
+        return self._workday_at(position)
+
+    def next_workday(self, date) -> FixedDate:
+        """The first workday after the date.
+
+        Args:
+            date (Union[FixedDate, datetime.date]): The date
+
+        Raises:
+            OverflowError: The result is after year 9999.
+
+        Returns:
+            FixedDate: The next workday.
+        """
+        return self.add_workdays(date, 1)
+
+    def previous_workday(self, date) -> FixedDate:
+        """The last workday before the date.
+
+        Args:
+            date (Union[FixedDate, datetime.date]): The date
+
+        Raises:
+            OverflowError: The result is before year 1.
+
+        Returns:
+            FixedDate: The previous workday.
+        """
+        return self.add_workdays(date, -1)
+
+    def workday_mask(self, dates):
+        """Array counterpart of `is_workday`. Requires NumPy.
+
+        Args:
+            dates (array_like): Either datetime64 values or integer ordinals
+
+        Returns:
+            np.ndarray: Boolean array, True for workdays.
+        """
+        np, vectorized = _numpy()
+        ordinals = vectorized.to_ordinals(dates)
+        _, special_day, regular_index, _ = self._split_ordinals(ordinals)
+        is_workday_offset = np.array([offset in self._workday_offsets for offset in range(7)])
+        mask = np.where(special_day, bool(self._special_workdays),
+                        is_workday_offset[regular_index % 7])
+        if self._holidays:
+            holidays = np.asarray(self._holidays, dtype=np.int64)
+            index = np.minimum(np.searchsorted(holidays, ordinals), len(holidays)-1)
+            mask &= holidays[index] != ordinals
+        return mask
+
+    def workdays_between_arrays(self, starts, ends):
+        """Array counterpart of `workdays_between`. Requires NumPy.
+
+        Args:
+            starts (array_like): The first dates of the spans, datetime64 values or ordinals
+            ends (array_like): The dates ending the spans, not themselves included
+
+        Returns:
+            np.ndarray: Counts of workdays, negative where end is before start.
+        """
+        _, vectorized = _numpy()
+        return self._workdays_before_array(vectorized.to_ordinals(ends)) \
+            - self._workdays_before_array(vectorized.to_ordinals(starts))
+
+    def add_workdays_arrays(self, dates, workdays):
+        """Array counterpart of `add_workdays`. Requires NumPy.
+
+        Args:
+            dates (array_like): The starting dates, datetime64 values or ordinals
+            workdays (array_like): Counts of workdays, negative to go backwards
+
+        Raises:
+            OverflowError: Some result is outside of years 1...9999.
+
+        Returns:
+            np.ndarray: Ordinals of the resulting workdays.
+        """
+        np, vectorized = _numpy()
+        ordinals = vectorized.to_ordinals(dates)
+        workdays = np.asarray(workdays, dtype=np.int64)
+        forward = workdays > 0
+        positions = self._workdays_before_array(ordinals) + workdays \
+            - (forward & ~self.workday_mask(ordinals))
+        if positions.size and positions.min() < 0:
+            raise OverflowError("Result is out of range of years 1...9999")
+        # holidays are skipped by moving forward past each one preceding the position
+        positions = positions + np.searchsorted(self._holiday_positions, positions, side="right")
+        return self._base_workdays_at_array(positions)
+
+    def __repr__(self) -> str:
+        return f"WorkCalendar(weekend={sorted(self.weekend)}, " \
+               f"holidays={len(self._holidays)}, special_days={self.special_days!r})"
@@ -0,0 +1,85 @@
+import unittest
+import asyncio
+import datetime
+from fixedcal.core.date import FixedDate
+from fixedcal.aio import aconvert
+from fixedcal.parallel import TO_GREGORIAN
+
+async def _source(values, delay=0, consumed=None, error=None):
+    for value in values:
+        if delay:
+            await asyncio.sleep(delay)
+        if consumed is not None:
+            consumed.append(value)
+        yield value
+    if error is not None:
+        raise error
+
+async def _collect(results):
+    return [text async for text in results]
+
+class TestAsyncConversion(unittest.TestCase):
+    def setUp(self):
+        start = datetime.date(2023, 12, 1).toordinal()
+        self.dates = [datetime.date.fromordinal(start + offset) for offset in range(0, 900, 3)]
+
+    def test_convert_in_batches(self):
+        expected = [str(FixedDate(date)) for date in self.dates]
+        results = asyncio.run(_collect(aconvert(_source(self.dates), batch_size=7)))
+        self.assertEqual(results, expected)
+
+    def test_convert_mixed_values(self):
+        values = [1, FixedDate(day=29, month=6, year=2024), datetime.date(9999, 12, 31)]
+        self.assertEqual(asyncio.run(_collect(aconvert(_source(values)))),
+                         ["0001-01-01", "2024-06-29", "9999-13-29"])
+        self.assertEqual(asyncio.run(_collect(aconvert(_source(values), TO_GREGORIAN))),
+                         ["0001-01-01", "2024-06-17", "9999-12-31"])
+        self.assertEqual(asyncio.run(_collect(aconvert(_source([])))), [])
+
+    def test_partial_batch_is_flushed_after_latency(self):
+        async def first_result():
+            results = aconvert(_source(self.dates, delay=0.01), batch_size=1000, max_latency=0.02)
+            try:
+                return await asyncio.wait_for(results.__anext__(), 1)
+            finally:
+                await results.aclose()
+        self.assertEqual(asyncio.run(first_result()), str(FixedDate(self.dates[0])))
+
+    def test_slow_consumer_limits_reading(self):
+        consumed = []
+        async def consume_slowly():
+            results = aconvert(_source(self.dates, consumed=consumed),
+                               batch_size=10, max_buffered=20)
+            try:
+                await results.__anext__()
+                await asyncio.sleep(0.05)
+                return len(consumed)
+            finally:
+                await results.aclose()
+        self.assertLessEqual(asyncio.run(consume_slowly()), 32)
+
+    def test_source_error_is_raised_after_dates_read_before_it(self):
+        results = []
+        async def consume():
+            async for text in aconvert(_source(self.dates[:3], error=OSError("lost"))):
+                results.append(text)
+        with self.assertRaises(OSError):
+            asyncio.run(consume())
+        self.assertEqual(results, [str(FixedDate(date)) for date in self.dates[:3]])
+
+    def test_early_stop_cancels_reader(self):
+        async def first_and_tasks():
+            results = aconvert(_source(self.dates, delay=0.001), batch_size=5)
+            first = await results.__anext__()
+            await results.aclose()
+            return first, asyncio.all_tasks() - {asyncio.current_task()}
+        first, pending = asyncio.run(first_and_tasks())
+        self.assertEqual(first, str(FixedDate(self.dates[0])))
+        self.assertEqual(pending, set())
+
+    def test_invalid_arguments(self):
+        for arguments in [{"direction": "to-julian"}, {"batch_size": 0}, {"max_latency": -1}]:
+            with self.assertRaises(ValueError):
+                aconvert(_source(self.dates), **arguments)
+        with self.assertRaises(ValueError):
+            asyncio.run(_collect(aconvert(_source([1, 0]))))
@@ -33,3 +33,13 @@ class TestBasicDayOfYearInit(unittest.TestCase):
         self.assertEqual(fixed_date.month, 13)
         self.assertEqual(fixed_date.day_of_month, 29)
         self.assertTrue(fixed_date.is_year_day)
+
+    def test_day_of_year_zero_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDate(day_of_year=0, year=2022))
+
+    def test_day_of_year_too_big_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDate(day_of_year=366, year=2022))
+
+    def test_year_out_of_range_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDate(day_of_year=1, year=0))
+        self.assertRaises(ValueError, lambda : FixedDate(day=1, month=1, year=10000))
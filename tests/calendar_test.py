@@ -0,0 +1,75 @@
+import unittest
+from fixedcal.core.date import FixedDate
+from fixedcal import calendar
+
+class TestCalendar(unittest.TestCase):
+    def test_month_dates_match_fixed_dates(self):
+        for year in (2023, 2024):
+            for month in range(1, 14):
+                weeks = calendar.monthdatescalendar(year, month)
+                days = calendar.monthdayscalendar(year, month)
+                self.assertEqual([[date.day_of_month for date in week] for week in weeks], days)
+                for week in weeks[:4]:
+                    self.assertEqual([date.weekday for date in week], list(range(1, 8)))
+                for date in (date for week in weeks for date in week):
+                    self.assertEqual((date.year, date.month), (year, month))
+                dates = list(calendar.itermonthdates(year, month))
+                self.assertEqual(len(dates), calendar.monthrange(year, month)[1])
+                self.assertEqual(list(calendar.itermonthdays2(year, month)),
+                                 [(date.day_of_month, date.weekday) for date in dates])
+
+    def test_special_days(self):
+        self.assertEqual(calendar.special_day(2024, 6), calendar.LEAP_DAY)
+        self.assertIsNone(calendar.special_day(2023, 6))
+        self.assertEqual(calendar.special_day(2023, 13), calendar.YEAR_DAY)
+        self.assertEqual(calendar.monthdayscalendar(2024, 6)[-1], [29])
+        self.assertTrue(calendar.monthdatescalendar(2024, 6)[-1][0].is_leap_day)
+        self.assertTrue(calendar.monthdatescalendar(2024, 13)[-1][0].is_year_day)
+        self.assertEqual(len(calendar.monthdatescalendar(2024, 7)), 4)
+        self.assertEqual(list(calendar.itermonthdays2(2024, 13))[-1], (29, None))
+
+    def test_year_dates(self):
+        rows = calendar.yeardatescalendar(2024)
+        self.assertEqual([len(row) for row in rows], [3, 3, 3, 3, 1])
+        self.assertEqual(rows[4][0][-1][0], FixedDate(day=29, month=13, year=2024))
+        self.assertEqual(len(calendar.yeardatescalendar(2024, width=13)), 1)
+
+    def test_month_text(self):
+        self.assertEqual(calendar.month_text(2024, 6),
+                         "     June 2024\n"
+                         "Su Mo Tu We Th Fr Sa\n"
+                         " 1  2  3  4  5  6  7\n"
+                         " 8  9 10 11 12 13 14\n"
+                         "15 16 17 18 19 20 21\n"
+                         "22 23 24 25 26 27 28\n"
+                         "    29 Leap Day")
+        self.assertNotIn("29", calendar.month_text(2023, 6))
+
+    def test_year_text(self):
+        lines = calendar.year_text(2023).split("\n")
+        self.assertEqual(lines[0].strip(), "2023")
+        self.assertEqual(lines[1].split(), ["January", "2023", "February", "2023", "March", "2023"])
+        self.assertEqual(lines[-1].strip(), "29 Year Day")
+        self.assertEqual(len(lines), 1 + 4*6 + 4 + 7)
+        self.assertEqual(len(calendar.year_text(2024, width=1).split("\n")), 1 + 13*6 + 2 + 12)
+
+    def test_month_html(self):
+        html = calendar.month_html(2024, 6)
+        self.assertTrue(html.startswith('<table class="month">\n'
+                                        '<tr><th colspan="7" class="month">June 2024</th></tr>'))
+        self.assertIn('<td class="sat">28</td></tr>', html)
+        self.assertIn('<tr><td colspan="7" class="leap-day">29 Leap Day</td></tr>', html)
+        self.assertEqual(html.count("<tr>"), 7)
+        self.assertIn('class="year-day"', calendar.month_html(2023, 13))
+        self.assertEqual(calendar.month_html(2023, 6).count("<tr>"), 6)
+
+    def test_invalid_arguments(self):
+        for year, month in ((0, 1), (10000, 1), (2024, 0), (2024, 14)):
+            with self.assertRaises(ValueError):
+                calendar.month_text(year, month)
+            with self.assertRaises(ValueError):
+                calendar.itermonthdays2(year, month)
+        with self.assertRaises(ValueError):
+            calendar.yeardatescalendar(2024, width=0)
+        with self.assertRaises(ValueError):
+            calendar.year_text(2024, width=0)
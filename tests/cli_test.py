@@ -0,0 +1,98 @@
+import unittest
+import contextlib
+import io
+import os
+import json
+import tempfile
+from fixedcal.cli import main, convert_row, ConversionOptions
+
+class TestConvertRow(unittest.TestCase):
+    def test_to_ifc_string(self):
+        row = convert_row({"when": "2024-06-17", "other": "x"}, ConversionOptions(("when",)))
+        self.assertEqual(row, {"when": "2024-06-29", "other": "x"})
+
+    def test_to_ifc_with_formats(self):
+        options = ConversionOptions(("when",), ifc_format="%d %B %Y",
+                                    gregorian_format="%d.%m.%Y")
+        self.assertEqual(convert_row({"when": "20.06.2022"}, options)["when"], "03 Sol 2022")
+
+    def test_to_gregorian(self):
+        options = ConversionOptions(("when",), direction="to-gregorian")
+        self.assertEqual(convert_row({"when": "2022-13-29"}, options)["when"], "2022-12-31")
+
+    def test_fields(self):
+        row = convert_row({"when": "2022-12-31"}, ConversionOptions(("when",), fields=True))
+        self.assertEqual(row["when"], "2022-12-31")
+        self.assertEqual(row["when_month"], 13)
+        self.assertIsNone(row["when_weekday"])
+        self.assertTrue(row["when_is_year_day"])
+
+    def test_empty_value_is_kept(self):
+        self.assertEqual(convert_row({"when": ""}, ConversionOptions(("when",))), {"when": ""})
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "output")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def _read_output(self) -> str:
+        with open(self.output, encoding="utf-8") as file:
+            return file.read()
+
+    def test_csv(self):
+        path = self._write("input.csv", "id,when\n1,2024-06-17\n2,\n3,2022-12-31\n")
+        self.assertEqual(main([path, "-c", "when", "-o", self.output, "--chunk-size", "2"]), 0)
+        self.assertEqual(self._read_output(), "id,when\n1,2024-06-29\n2,\n3,2022-13-29\n")
+
+    def test_csv_fields(self):
+        path = self._write("input.csv", "when\n2024-06-18\n")
+        self.assertEqual(main([path, "-c", "when", "--fields", "-o", self.output]), 0)
+        header, row = self._read_output().splitlines()
+        self.assertEqual(header.split(",")[:4], ["when", "when_year", "when_month",
+                                                 "when_day_of_month"])
+        self.assertEqual(row.split(",")[:5], ["2024-06-18", "2024", "7", "1", "1"])
+
+    def test_jsonl_to_gregorian(self):
+        path = self._write("input.jsonl", '{"a": "2024-06-29", "b": 1}\n\n{"a": "2024-13-01"}\n')
+        self.assertEqual(main([path, "-c", "a", "--to-gregorian", "-o", self.output]), 0)
+        rows = [json.loads(line) for line in self._read_output().splitlines()]
+        self.assertEqual(rows, [{"a": "2024-06-17", "b": 1}, {"a": "2024-12-03"}])
+
+    def test_workers_keep_order(self):
+        lines = "".join(f"2022-01-{day:02d}\n" for day in range(1, 32))
+        path = self._write("input.csv", "when\n" + lines)
+        self.assertEqual(main([path, "-c", "when", "-o", self.output, "--workers", "2",
+                               "--chunk-size", "3"]), 0)
+        dates = self._read_output().splitlines()[1:]
+        self.assertEqual(dates[0], "2022-01-01")
+        self.assertEqual(dates[-1], "2022-02-03")
+        self.assertEqual(dates, sorted(dates))
+
+    def test_invalid_date_reports_row(self):
+        path = self._write("input.csv", "when\n2022-01-01\n2022-02-30\n")
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertEqual(main([path, "-c", "when", "-o", self.output]), 1)
+        self.assertIn("row 2", stderr.getvalue())
+
+    def test_jsonl_line_not_object_reports_row(self):
+        for line in ("[1, 2]", '"2022-01-01"', "3", "null"):
+            path = self._write("input.jsonl", '{"a": "2022-01-01"}\n' + line + "\n")
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(main([path, "-c", "a", "-o", self.output]), 1, line)
+            self.assertIn("row 2: row should be an object", stderr.getvalue())
+
+    def test_missing_column(self):
+        path = self._write("input.csv", "id\n1\n")
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main([path, "-c", "when", "-o", self.output]), 1)
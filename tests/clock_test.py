@@ -0,0 +1,112 @@
+import unittest
+import asyncio
+import datetime
+import threading
+import zoneinfo
+from fixedcal.core.date import FixedDate, FixedClock
+
+class ManualTime:
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.timestamp
+
+class TestFixedClock(unittest.TestCase):
+    def setUp(self):
+        # 2024-06-28 23:59:59 UTC, the day before leap day
+        gregorian = FixedDate(day=28, month=6, year=2024).date
+        self.time = ManualTime(datetime.datetime.combine(
+            gregorian, datetime.time(23, 59, 59), datetime.timezone.utc).timestamp())
+        self.clock = FixedClock(self.time, datetime.timezone.utc)
+
+    def test_date_is_cached_until_midnight(self):
+        date = self.clock.today()
+        self.assertEqual(str(date), "2024-06-28")
+        self.time.timestamp += 0.5
+        self.assertIs(self.clock.today(), date)
+        self.time.timestamp += 0.5
+        self.assertEqual(str(self.clock.today()), "2024-06-29")
+        self.assertTrue(self.clock.today().is_leap_day)
+        self.assertEqual(self.time.calls, 4)
+
+    def test_time_going_backwards(self):
+        self.clock.today()
+        self.time.timestamp -= 86400
+        self.assertEqual(str(self.clock.today()), "2024-06-27")
+        self.time.timestamp += 2*86400
+        self.assertEqual(str(self.clock.today()), "2024-06-29")
+
+    def test_timezones(self):
+        clock = FixedClock(self.time, datetime.timezone(datetime.timedelta(hours=3)))
+        self.assertEqual(str(clock.today()), "2024-06-29")
+        clock = FixedClock(self.time, datetime.timezone(-datetime.timedelta(hours=3)))
+        self.assertEqual(str(clock.today()), "2024-06-28")
+        clock = FixedClock(self.time)
+        local_date = datetime.datetime.fromtimestamp(self.time.timestamp).date()
+        self.assertEqual(clock.today(), FixedDate(local_date))
+
+    def test_day_with_daylight_saving_transition(self):
+        helsinki = zoneinfo.ZoneInfo("Europe/Helsinki")
+        self.time.timestamp = datetime.datetime(2024, 3, 31, tzinfo=helsinki).timestamp()
+        clock = FixedClock(self.time, helsinki)
+        date = clock.today()
+        # the day is only 23 hours long
+        self.time.timestamp += 22*3600 + 59*60
+        self.assertIs(clock.today(), date)
+        self.time.timestamp += 60
+        self.assertEqual(clock.today(), FixedDate(datetime.date(2024, 4, 1)))
+
+    def test_last_day(self):
+        self.time.timestamp = datetime.datetime(9999, 12, 31, 12,
+                                                tzinfo=datetime.timezone.utc).timestamp()
+        date = self.clock.today()
+        self.assertEqual(str(date), "9999-13-29")
+        self.time.timestamp += 3600
+        self.assertIs(self.clock.today(), date)
+
+    def test_concurrent_use(self):
+        dates = []
+        def read():
+            for _ in range(1000):
+                dates.append(self.clock.today())
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(set(dates), {FixedDate(day=28, month=6, year=2024)})
+
+        async def read_async():
+            await asyncio.sleep(0)
+            return self.clock.today()
+        async def gather():
+            return await asyncio.gather(*(read_async() for _ in range(100)))
+        self.assertEqual(set(asyncio.run(gather())), set(dates))
+
+    def test_invalid_timezone(self):
+        with self.assertRaises(ValueError):
+            FixedClock(tz="UTC")
+
+    def test_repr(self):
+        self.assertEqual(repr(FixedClock(tz=datetime.timezone.utc)),
+                         "FixedClock(time_source=<built-in function time>, "
+                         "tz=datetime.timezone.utc)")
+
+class TestDefaultClock(unittest.TestCase):
+    def test_today_uses_default_clock(self):
+        time_source = lambda: 0
+        previous = FixedDate.set_default_clock(FixedClock(time_source, datetime.timezone.utc))
+        try:
+            self.assertEqual(str(FixedDate.today()), "1970-01-01")
+            self.assertIs(FixedDate.default_clock().tz, datetime.timezone.utc)
+        finally:
+            FixedDate.set_default_clock(previous)
+        self.assertIs(FixedDate.default_clock(), previous)
+        self.assertEqual(FixedDate.today().date, datetime.date.today())
+
+    def test_invalid_default_clock(self):
+        with self.assertRaises(ValueError):
+            FixedDate.set_default_clock(datetime.datetime.now)
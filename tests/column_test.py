@@ -0,0 +1,117 @@
+import unittest
+import datetime
+import os
+import pickle
+import tempfile
+from fixedcal.core.date import FixedDate
+from fixedcal.column import FixedDateColumn
+from fixedcal.services.ordinals import MIN_ORDINAL, MAX_ORDINAL
+
+class TestDateBytes(unittest.TestCase):
+    def test_round_trip(self):
+        for ordinal in list(range(MIN_ORDINAL, MAX_ORDINAL+1, 997)) + [MAX_ORDINAL]:
+            date = FixedDate.fromordinal(ordinal)
+            data = date.to_bytes()
+            self.assertEqual(len(data), 4)
+            self.assertEqual(FixedDate.from_bytes(data), date)
+
+    def test_encoding_is_little_endian_ordinal(self):
+        date = FixedDate(day=29, month=6, year=2024)
+        self.assertEqual(date.to_bytes(), (739054).to_bytes(4, "little"))
+
+    def test_invalid_bytes(self):
+        with self.assertRaises(ValueError):
+            FixedDate.from_bytes(b"\x01\x00\x00")
+        with self.assertRaises(ValueError):
+            FixedDate.from_bytes(b"\x00\x00\x00\x00")
+
+class TestFixedDateColumn(unittest.TestCase):
+    def setUp(self):
+        self.dates = [FixedDate.fromordinal(ordinal) for ordinal in range(739000, 739100, 3)]
+        self.column = FixedDateColumn(self.dates)
+
+    def test_sequence(self):
+        self.assertEqual(len(self.column), len(self.dates))
+        self.assertEqual(list(self.column), self.dates)
+        self.assertEqual(self.column[-1], self.dates[-1])
+        self.assertEqual(list(self.column[3:7]), self.dates[3:7])
+        self.assertEqual(list(self.column[::5]), self.dates[::5])
+        with self.assertRaises(IndexError):
+            self.column[len(self.dates)]
+
+    def test_slices_share_memory(self):
+        self.assertIs(self.column[3:7].ordinals.obj, self.column.ordinals.obj)
+
+    def test_native_dates_and_ordinals(self):
+        column = FixedDateColumn([datetime.date(2024, 2, 29)])
+        self.assertEqual(str(column[0]), "2024-03-04")
+        self.assertEqual(FixedDateColumn.from_ordinals(date.toordinal() for date in self.dates),
+                         self.column)
+        with self.assertRaises(ValueError):
+            FixedDateColumn.from_ordinals([1, MAX_ORDINAL + 1])
+        with self.assertRaises(ValueError):
+            FixedDateColumn.from_ordinals([2**40])
+
+    def test_ordinals_view(self):
+        ordinals = self.column.ordinals
+        self.assertTrue(ordinals.readonly)
+        self.assertEqual(ordinals.format, "i")
+        self.assertEqual(ordinals.tolist(), [date.toordinal() for date in self.dates])
+
+    def test_bytes_round_trip(self):
+        data = self.column.tobytes()
+        self.assertEqual(data, b"".join(date.to_bytes() for date in self.dates))
+        self.assertEqual(FixedDateColumn.frombytes(data), self.column)
+        self.assertEqual(len(FixedDateColumn.frombytes(b"")), 0)
+        with self.assertRaises(ValueError):
+            FixedDateColumn.frombytes(data[:-1])
+        invalid = FixedDateColumn.frombytes(bytes(4) + data)
+        self.assertEqual(invalid[1:], self.column)
+        with self.assertRaises(ValueError):
+            invalid[0]
+        with self.assertRaises(ValueError):
+            invalid.validate()
+        self.column.validate()
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dates.ifcd")
+            self.column.save(path)
+            for memory_map in (True, False):
+                loaded = FixedDateColumn.load(path, memory_map=memory_map)
+                self.assertEqual(loaded, self.column)
+                self.assertEqual(list(loaded[2:4]), self.dates[2:4])
+                del loaded
+            FixedDateColumn().save(path)
+            self.assertEqual(len(FixedDateColumn.load(path)), 0)
+            for content in (b"", b"IFCDATE", b"2024-01-01\n"):
+                with open(path, "wb") as file:
+                    file.write(content)
+                for memory_map in (True, False):
+                    with self.assertRaisesRegex(ValueError, "FixedDateColumn.save"):
+                        FixedDateColumn.load(path, memory_map=memory_map)
+            with open(path, "wb") as file:
+                file.write(b"IFCDATE\x01\x01\x00")
+            with self.assertRaises(ValueError):
+                FixedDateColumn.load(path)
+
+    def test_pickle(self):
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(self.column, protocol)), self.column)
+
+    def test_pickle_out_of_band(self):
+        buffers = []
+        data = pickle.dumps(self.column, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), 100)
+        received = bytearray(buffers[0].raw())
+        loaded = pickle.loads(data, buffers=[received])
+        self.assertEqual(loaded, self.column)
+        self.assertIs(loaded.ordinals.obj, received)
+
+    def test_equality_and_repr(self):
+        self.assertNotEqual(self.column, self.column[1:])
+        self.assertNotEqual(self.column, self.dates)
+        self.assertEqual(repr(self.column), f"FixedDateColumn(length={len(self.dates)})")
+        with self.assertRaises(TypeError):
+            hash(self.column)
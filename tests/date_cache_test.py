@@ -0,0 +1,71 @@
+import unittest
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from fixedcal.core.date import FixedDate, DEFAULT_CACHE_SIZE
+from fixedcal.services.cache import LRUCache
+
+class TestDateCache(unittest.TestCase):
+    def setUp(self):
+        FixedDate.configure_cache(3, clear=True)
+
+    def tearDown(self):
+        FixedDate.configure_cache(DEFAULT_CACHE_SIZE, clear=True)
+
+    def test_cached_date_is_shared(self):
+        first = FixedDate.cached(datetime.date(2024, 6, 17))
+        second = FixedDate.cached(datetime.date(2024, 6, 17))
+        self.assertIs(first, second)
+        self.assertEqual(first, FixedDate(day=29, month=6, year=2024))
+        self.assertIs(FixedDate.cached(first), first)
+
+    def test_cache_info(self):
+        FixedDate.cached(datetime.date(2024, 1, 1))
+        FixedDate.cached(datetime.date(2024, 1, 1))
+        FixedDate.cached(datetime.date(2024, 1, 2))
+        info = FixedDate.cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (1, 2, 3, 2))
+
+    def test_least_recently_used_is_evicted(self):
+        dates = [datetime.date(2024, 1, day) for day in range(1, 5)]
+        first = FixedDate.cached(dates[0])
+        FixedDate.cached(dates[1])
+        FixedDate.cached(dates[2])
+        FixedDate.cached(dates[0])      # dates[1] is now the least recently used
+        FixedDate.cached(dates[3])
+        self.assertIs(FixedDate.cached(dates[0]), first)
+        misses = FixedDate.cache_info().misses
+        FixedDate.cached(dates[1])
+        self.assertEqual(FixedDate.cache_info().misses, misses + 1)
+        self.assertEqual(FixedDate.cache_info().currsize, 3)
+
+    def test_configure_cache_shrinks(self):
+        for day in range(1, 4):
+            FixedDate.cached(datetime.date(2024, 1, day))
+        FixedDate.configure_cache(1)
+        self.assertEqual(FixedDate.cache_info().currsize, 1)
+        with self.assertRaises(ValueError):
+            FixedDate.configure_cache(0)
+
+    def test_invalid_date_is_not_cached(self):
+        with self.assertRaises(ValueError):
+            FixedDate.cached("2024-01-01")
+        self.assertEqual(FixedDate.cache_info().currsize, 0)
+
+    def test_concurrent_use(self):
+        FixedDate.configure_cache(50)
+        ordinals = [datetime.date(2024, 1, 1).toordinal() + day % 40 for day in range(4000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            dates = list(executor.map(lambda ordinal: FixedDate.cached(
+                datetime.date.fromordinal(ordinal)), ordinals))
+        for ordinal, date in zip(ordinals, dates):
+            self.assertEqual(date.toordinal(), ordinal)
+        info = FixedDate.cache_info()
+        self.assertEqual(info.hits + info.misses, len(ordinals))
+        self.assertEqual(info.currsize, 40)
+
+class TestLRUCache(unittest.TestCase):
+    def test_concurrent_misses_share_value(self):
+        cache = LRUCache(lambda key: [key], 10)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(lambda _: cache.get(1), range(100)))
+        self.assertTrue(all(value is values[0] for value in values))
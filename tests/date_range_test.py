@@ -0,0 +1,108 @@
+import unittest
+import datetime
+from fixedcal import FixedDate, FixedDateRange
+
+class TestDayRange(unittest.TestCase):
+    def setUp(self):
+        self.start = FixedDate(day=25, month=13, year=2022)
+        self.stop = FixedDate(day=5, month=1, year=2023)
+        self.date_range = FixedDateRange(self.start, self.stop)
+
+    def test_iteration_includes_year_day(self):
+        dates = [str(date) for date in self.date_range]
+        self.assertEqual(dates, ["2022-13-25", "2022-13-26", "2022-13-27", "2022-13-28",
+                                 "2022-13-29", "2023-01-01", "2023-01-02", "2023-01-03",
+                                 "2023-01-04"])
+
+    def test_length(self):
+        self.assertEqual(len(self.date_range), 9)
+        self.assertEqual(len(FixedDateRange(self.stop, self.start)), 0)
+
+    def test_length_of_long_range(self):
+        long_range = FixedDateRange(FixedDate(day=1, month=1, year=1),
+                                    FixedDate(day=29, month=13, year=9999))
+        self.assertEqual(len(long_range), 3652058)
+        self.assertEqual(long_range[-1], FixedDate(day=28, month=13, year=9999))
+
+    def test_indexing(self):
+        self.assertEqual(self.date_range[0], self.start)
+        self.assertTrue(self.date_range[4].is_year_day)
+        self.assertEqual(self.date_range[-1], FixedDate(day=4, month=1, year=2023))
+        self.assertRaises(IndexError, lambda : self.date_range[9])
+
+    def test_slicing(self):
+        sliced = self.date_range[2:8:2]
+        self.assertIsInstance(sliced, FixedDateRange)
+        self.assertEqual([str(date) for date in sliced],
+                         ["2022-13-27", "2022-13-29", "2023-01-02"])
+
+    def test_contains(self):
+        self.assertIn(FixedDate(day=29, month=13, year=2022), self.date_range)
+        self.assertNotIn(self.stop, self.date_range)
+        self.assertNotIn(datetime.date(2022, 12, 28), self.date_range)
+
+    def test_reversed(self):
+        self.assertEqual(list(reversed(self.date_range)), list(self.date_range)[::-1])
+
+    def test_negative_step(self):
+        backwards = FixedDateRange(self.stop, self.start, -2)
+        self.assertEqual([str(date) for date in backwards],
+                         ["2023-01-05", "2023-01-03", "2023-01-01", "2022-13-28", "2022-13-26"])
+
+    def test_index(self):
+        self.assertEqual(self.date_range.index(FixedDate(day=1, month=1, year=2023)), 5)
+        self.assertRaises(ValueError, lambda : self.date_range.index(self.stop))
+
+    def test_equality(self):
+        self.assertEqual(self.date_range, FixedDateRange(self.start, self.stop, 1))
+        self.assertNotEqual(self.date_range, FixedDateRange(self.start, self.stop, 2))
+
+    def test_zero_step_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDateRange(self.start, self.stop, 0))
+
+    def test_unknown_unit_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDateRange(self.start, self.stop, unit="year"))
+
+class TestWeekAndMonthRange(unittest.TestCase):
+    def test_week_range_skips_leap_day(self):
+        weeks = FixedDateRange(FixedDate(day=22, month=6, year=2024),
+                               FixedDate(day=20, month=7, year=2024), unit="week")
+        self.assertEqual([str(date) for date in weeks],
+                         ["2024-06-22", "2024-07-01", "2024-07-08", "2024-07-15"])
+        self.assertEqual(len(weeks), 4)
+        self.assertTrue(all(date.weekday == 1 for date in weeks))
+
+    def test_week_range_skips_year_day(self):
+        weeks = FixedDateRange(FixedDate(day=28, month=13, year=2022),
+                               FixedDate(day=15, month=1, year=2023), unit="week")
+        self.assertEqual([str(date) for date in weeks],
+                         ["2022-13-28", "2023-01-07", "2023-01-14"])
+
+    def test_month_range(self):
+        months = FixedDateRange(FixedDate(day=10, month=12, year=2023),
+                                FixedDate(day=10, month=3, year=2024), unit="month")
+        self.assertEqual([str(date) for date in months],
+                         ["2023-12-10", "2023-13-10", "2024-01-10", "2024-02-10"])
+        self.assertEqual(months.step, 1)
+        self.assertEqual(months.unit, "month")
+
+    def test_special_days_are_never_contained(self):
+        months = FixedDateRange(FixedDate(day=29, month=6, year=2024),
+                                FixedDate(day=1, month=1, year=2026), unit="month")
+        self.assertEqual(months[0], FixedDate(day=1, month=7, year=2024))
+        self.assertNotIn(FixedDate(day=29, month=13, year=2024), months)
+        self.assertIn(FixedDate(day=1, month=13, year=2025), months)
+        self.assertNotIn(FixedDate(day=2, month=13, year=2025), months)
+
+    def test_descending_week_range_ending_at_year_day(self):
+        weeks = FixedDateRange(FixedDate(day=14, month=1, year=2023),
+                               FixedDate(day=29, month=13, year=2022), -1, unit="week")
+        self.assertEqual([str(date) for date in weeks],
+                         ["2023-01-14", "2023-01-07"])
+
+    def test_repr(self):
+        weeks = FixedDateRange(FixedDate(day=1, month=1, year=2023),
+                               FixedDate(day=1, month=2, year=2023), 2, unit="week")
+        self.assertEqual(repr(weeks),
+                         "FixedDateRange(2023-01-01...2023-01-15, step=2, unit='week')")
+        self.assertEqual(repr(weeks[5:]), "FixedDateRange(empty, step=2, unit='week')")
@@ -0,0 +1,112 @@
+import unittest
+import datetime
+from fixedcal.core.date import FixedDate
+from fixedcal.core.date_time import FixedDateTime
+
+UTC = datetime.timezone.utc
+HELSINKI_WINTER = datetime.timezone(datetime.timedelta(hours=2))
+
+class TestFixedDateTime(unittest.TestCase):
+    def setUp(self):
+        self.leap_noon = FixedDateTime(FixedDate(day=29, month=6, year=2024),
+                                       datetime.time(12, 30, tzinfo=UTC))
+
+    def test_init_with_time_components(self):
+        self.assertEqual(self.leap_noon.fixed_date, FixedDate(day=29, month=6, year=2024))
+        self.assertEqual(self.leap_noon.hour, 12)
+        self.assertEqual(self.leap_noon.minute, 30)
+        self.assertEqual(self.leap_noon.second, 0)
+        self.assertEqual(self.leap_noon.microsecond, 0)
+        self.assertEqual(self.leap_noon.tzinfo, UTC)
+        self.assertEqual(self.leap_noon.time, datetime.time(12, 30, tzinfo=UTC))
+
+    def test_init_with_default_time(self):
+        moment = FixedDateTime(FixedDate(day=1, month=1, year=2024))
+        self.assertEqual(moment.time, datetime.time())
+        self.assertIsNone(moment.tzinfo)
+
+    def test_init_with_invalid_values(self):
+        with self.assertRaises(ValueError):
+            FixedDateTime(FixedDate(day=1, month=1, year=2024), 12)
+        with self.assertRaises(ValueError):
+            FixedDateTime(datetime.date(2024, 1, 1))
+
+    def test_from_and_to_datetime(self):
+        native = datetime.datetime(2024, 6, 17, 12, 30, tzinfo=UTC)
+        self.assertEqual(FixedDateTime.fromdatetime(native), self.leap_noon)
+        self.assertEqual(self.leap_noon.to_datetime(), native)
+
+    def test_fromtimestamp_with_fixed_offset(self):
+        timestamps = [0, -1, 1718627400, 1703980799.5, 1e9 + 0.25, -62135596800,
+                      1718627400.123456, -0.5e-6, 1.5e-6, -1.9999996, 0.9999996]
+        for timestamp in timestamps:
+            for tz in (UTC, HELSINKI_WINTER):
+                native = datetime.datetime.fromtimestamp(timestamp, tz)
+                expected = FixedDateTime.fromdatetime(native)
+                self.assertEqual(FixedDateTime.fromtimestamp(timestamp, tz), expected)
+                self.assertEqual(str(FixedDateTime.fromtimestamp(timestamp, tz)), str(expected))
+
+    def test_fromtimestamp_with_local_time(self):
+        moment = FixedDateTime.fromtimestamp(1718627400)
+        self.assertIsNone(moment.tzinfo)
+        self.assertEqual(moment.to_datetime(), datetime.datetime.fromtimestamp(1718627400))
+
+    def test_fromtimestamp_out_of_range(self):
+        with self.assertRaises(ValueError):
+            FixedDateTime.fromtimestamp(-62135596801, UTC)
+        with self.assertRaises(ValueError):
+            FixedDateTime.fromtimestamp(-62135596800.5, UTC)
+        with self.assertRaises(ValueError):
+            FixedDateTime.fromtimestamp(float("nan"), UTC)
+
+    def test_timestamp_round_trip(self):
+        self.assertEqual(self.leap_noon.timestamp(), 1718627400)
+        for timestamp in (0, -1, 1703980799.5, 253402200000):
+            for tz in (UTC, HELSINKI_WINTER, None):
+                self.assertEqual(FixedDateTime.fromtimestamp(timestamp, tz).timestamp(), timestamp)
+
+    def test_fromtimestamp_many(self):
+        moments = FixedDateTime.fromtimestamp_many([0, 1718627400], UTC)
+        self.assertEqual([str(moment) for moment in moments],
+                         ["1970-01-01 00:00:00+00:00", "2024-06-29 12:30:00+00:00"])
+
+    def test_astimezone(self):
+        moment = FixedDateTime(FixedDate(day=28, month=13, year=2023),
+                               datetime.time(23, tzinfo=UTC))
+        converted = moment.astimezone(HELSINKI_WINTER)
+        self.assertTrue(converted.fixed_date.is_year_day)
+        self.assertEqual(converted.hour, 1)
+        self.assertEqual(converted, moment)
+        self.assertEqual(converted.utcoffset(), datetime.timedelta(hours=2))
+
+    def test_arithmetic(self):
+        later = self.leap_noon + datetime.timedelta(hours=12)
+        self.assertEqual(str(later), "2024-07-01 00:30:00+00:00")
+        self.assertEqual(later - self.leap_noon, datetime.timedelta(hours=12))
+        self.assertEqual(self.leap_noon - later, datetime.timedelta(hours=-12))
+        self.assertEqual(later - datetime.timedelta(hours=12), self.leap_noon)
+        self.assertTrue(self.leap_noon < later)
+        self.assertTrue(later > self.leap_noon)
+        self.assertTrue(self.leap_noon <= self.leap_noon <= later)
+        self.assertTrue(later >= self.leap_noon >= self.leap_noon)
+
+    def test_subtraction_round_trip_over_leap_days(self):
+        moments = [FixedDateTime.fromtimestamp(timestamp, tz)
+                   for timestamp in (1708905600, 1709380800.25, 1718627400, 1720051200,
+                                     1582243200, 1839801600.5)
+                   for tz in (UTC, HELSINKI_WINTER)]
+        for moment1 in moments:
+            for moment2 in moments:
+                self.assertEqual(moment2 + (moment1 - moment2), moment1)
+                self.assertEqual(moment1 - moment2,
+                                 moment1.to_datetime() - moment2.to_datetime())
+
+    def test_hashable(self):
+        same = FixedDateTime.fromdatetime(datetime.datetime(2024, 6, 17, 14, 30,
+                                                            tzinfo=HELSINKI_WINTER))
+        self.assertEqual(len({self.leap_noon, same}), 1)
+
+    def test_str(self):
+        self.assertEqual(str(self.leap_noon), "2024-06-29 12:30:00+00:00")
+        naive = FixedDateTime(FixedDate(day=1, month=1, year=2024), datetime.time(8, 5, 3, 500))
+        self.assertEqual(str(naive), "2024-01-01 08:05:03.000500")
@@ -0,0 +1,61 @@
+import unittest
+from fixedcal.core.date import FixedDate
+from fixedcal.services.leap_days import is_leap_year
+from fixedcal.services.validation import FieldError
+
+class TestFromFieldsMany(unittest.TestCase):
+    def setUp(self):
+        self.rows = [(1, 1, 2024), (29, 6, 2024), (29, 6, 2023), (1, 7, 2024), (29, 13, 2023),
+                     (29, 14, 2024), (0, 1, 1), (28, 13, 10000), ("1", 1, 2024), (28, 13, 9999)]
+        self.days, self.months, self.years = (list(column) for column in zip(*self.rows))
+
+    def expected(self):
+        ordinals = []
+        for day, month, year in self.rows:
+            try:
+                ordinals.append(FixedDate(day=day, month=month, year=year).toordinal())
+            except (ValueError, TypeError):
+                ordinals.append(0)
+        return ordinals
+
+    def test_mask(self):
+        ordinals, mask = FixedDate.from_fields_many(self.days, self.months, self.years, "mask")
+        self.assertEqual(ordinals, self.expected())
+        self.assertEqual(mask, [False, False, True, False, False, True, True, True, True, False])
+
+    def test_collect(self):
+        ordinals, errors = FixedDate.from_fields_many(self.days, self.months, self.years,
+                                                      errors="collect")
+        self.assertEqual(ordinals, self.expected())
+        self.assertEqual(errors, [
+            FieldError(2, "Day should be in range 1...28"),
+            FieldError(5, "Month should be in range 1...13"),
+            FieldError(6, "Day should be in range 1...28"),
+            FieldError(7, "Year should be in range 1...9999"),
+            FieldError(8, "Day, month and year should be integers"),
+        ])
+
+    def test_raise(self):
+        valid = [row for index, row in enumerate(self.rows) if index in (0, 1, 3, 4, 9)]
+        ordinals = FixedDate.from_fields_many(*zip(*valid))
+        self.assertEqual([str(FixedDate.fromordinal(ordinal)) for ordinal in ordinals],
+                         ["2024-01-01", "2024-06-29", "2024-07-01", "2023-13-29", "9999-13-28"])
+        with self.assertRaisesRegex(ValueError, "row 2: Day should be in range 1...28"):
+            FixedDate.from_fields_many(self.days, self.months, self.years)
+
+    def test_all_days_of_years(self):
+        for year in (1, 1900, 2000, 2023, 2024, 9999):
+            days_in_year = 366 if is_leap_year(year) else 365
+            dates = [FixedDate(day_of_year=day_of_year, year=year)
+                     for day_of_year in range(1, days_in_year+1)]
+            ordinals = FixedDate.from_fields_many([date.day_of_month for date in dates],
+                                                  [date.month for date in dates],
+                                                  [date.year for date in dates])
+            self.assertEqual(ordinals, [date.toordinal() for date in dates])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            FixedDate.from_fields_many([1, 2], [1], [2024])
+        with self.assertRaises(ValueError):
+            FixedDate.from_fields_many([1], [1], [2024], errors="ignore")
+        self.assertEqual(FixedDate.from_fields_many([], [], [], "collect"), ([], []))
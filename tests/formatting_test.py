@@ -0,0 +1,88 @@
+import unittest
+from fixedcal import FixedDate
+
+class TestFormat(unittest.TestCase):
+    def setUp(self):
+        self.fixed_date = FixedDate(day=3, month=7, year=2024)
+        self.leap_day = FixedDate(day=29, month=6, year=2024)
+        self.year_day = FixedDate(day=29, month=13, year=2022)
+
+    def test_numeric_directives(self):
+        self.assertEqual(self.fixed_date.format("%Y/%m/%d %j"), "2024/07/03 172")
+        self.assertEqual(self.fixed_date.format("W%W w%w Q%q %u"), "W25 w1 Q2 3")
+
+    def test_sol_month_name(self):
+        self.assertEqual(self.fixed_date.format("%d %B %Y"), "03 Sol 2024")
+        self.assertEqual(self.fixed_date.format("%b"), "Sol")
+        self.assertEqual(FixedDate(day=1, month=8, year=2024).format("%B %b"), "July Jul")
+
+    def test_weekday_names(self):
+        self.assertEqual(self.fixed_date.format("%A %a"), "Tuesday Tue")
+
+    def test_leap_day_and_year_day_tokens(self):
+        self.assertEqual(self.leap_day.format("%A, %B %d"), "Leap Day, June 29")
+        self.assertEqual(self.year_day.format("%A %a %u %W"), "Year Day Year 0 52")
+
+    def test_literal_text(self):
+        self.assertEqual(self.fixed_date.format("{%Y} 100%%"), "{2024} 100%")
+
+    def test_unknown_directive_raises(self):
+        self.assertRaises(ValueError, lambda : self.fixed_date.format("%Y-%x"))
+        self.assertRaises(ValueError, lambda : self.fixed_date.format("%Y%"))
+
+    def test_format_spec_in_f_string(self):
+        self.assertEqual(f"{self.fixed_date}", "2024-07-03")
+        self.assertEqual(f"{self.fixed_date:%B %d}", "Sol 03")
+
+    def test_format_many(self):
+        dates = [self.fixed_date, self.leap_day, self.year_day]
+        self.assertEqual(FixedDate.format_many(dates, "%Y-%m-%d"),
+                         ["2024-07-03", "2024-06-29", "2022-13-29"])
+
+class TestParse(unittest.TestCase):
+    def test_fromisoformat(self):
+        self.assertEqual(FixedDate.fromisoformat("2024-06-29"),
+                         FixedDate(day=29, month=6, year=2024))
+        self.assertTrue(FixedDate.fromisoformat("2022-13-29").is_year_day)
+
+    def test_fromisoformat_invalid_raises(self):
+        for date_string in ("2024-6-29", "2024/06/29", "2024-06-2x", "+024-06-29",
+                            "2022-06-29", "2024-14-01", "2024-06-29 "):
+            self.assertRaises(ValueError, lambda s=date_string: FixedDate.fromisoformat(s))
+
+    def test_round_trip_of_every_day_in_leap_year(self):
+        for day_of_year in range(1, 367):
+            fixed_date = FixedDate(day_of_year=day_of_year, year=2024)
+            self.assertEqual(FixedDate.fromisoformat(str(fixed_date)), fixed_date)
+            self.assertEqual(FixedDate.parse(fixed_date.format("%A %d %B %Y"), "%A %d %B %Y"),
+                             fixed_date)
+
+    def test_parse_with_day_of_year(self):
+        self.assertEqual(FixedDate.parse("2024.366", "%Y.%j"),
+                         FixedDate(day_of_year=366, year=2024))
+
+    def test_parse_with_abbreviated_month(self):
+        self.assertEqual(FixedDate.parse("Sol 05, 2023", "%b %d, %Y"),
+                         FixedDate(day=5, month=7, year=2023))
+
+    def test_parse_mismatch_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDate.parse("2024-06", "%Y-%m-%d"))
+        self.assertRaises(ValueError, lambda : FixedDate.parse("Solar 05 2023", "%B %d %Y"))
+
+    def test_parse_inconsistent_weekday_raises(self):
+        self.assertEqual(FixedDate.parse("Tuesday 2024-07-03", "%A %Y-%m-%d"),
+                         FixedDate(day=3, month=7, year=2024))
+        self.assertRaises(ValueError, lambda : FixedDate.parse("Monday 2024-07-03", "%A %Y-%m-%d"))
+
+    def test_parse_inconsistent_day_of_year_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDate.parse("2024-07-03 001", "%Y-%m-%d %j"))
+
+    def test_format_without_date_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDate.parse("07-03", "%m-%d"))
+        self.assertRaises(ValueError, lambda : FixedDate.parse("2024-07", "%Y-%m"))
+
+    def test_parse_many(self):
+        self.assertEqual(FixedDate.parse_many(["2024-01-01", "2024-06-29"]),
+                         [FixedDate(day_of_year=1, year=2024), FixedDate(day_of_year=169, year=2024)])
+        self.assertEqual(FixedDate.parse_many(["001/2024"], "%j/%Y"),
+                         [FixedDate(day_of_year=1, year=2024)])
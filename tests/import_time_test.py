@@ -0,0 +1,59 @@
+import unittest
+import subprocess
+import sys
+
+# reference module imported in the same run, eager importing of fixedcal imported it too
+REFERENCE_MODULE = "datetime"
+
+def import_report(statement):
+    """Run the statement in a fresh interpreter with `-X importtime`,
+    returning the cumulative import times keyed with module names,
+    and the names of all imported modules printed by the statement.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True, text=True, check=True)
+    times = {}
+    for line in output.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+    return times, set(output.stdout.split())
+
+class TestImportTime(unittest.TestCase):
+    def test_import_cheaper_than_reference_module(self):
+        # compared within the same runs, so that the speed of the machine does not matter,
+        # and best of a few runs, as the first one may read the files from disk
+        reports = [import_report(f"import fixedcal\nimport {REFERENCE_MODULE}")[0]
+                   for _ in range(3)]
+        if REFERENCE_MODULE not in reports[0]:
+            self.skipTest(f"{REFERENCE_MODULE} is imported at interpreter startup")
+        self.assertLess(min(times["fixedcal"] for times in reports),
+                        min(times[REFERENCE_MODULE] for times in reports))
+
+    def test_import_loads_nothing_until_used(self):
+        _, modules = import_report("import fixedcal")
+        for name in ("fixedcal.core.date", "numpy", "pandas", "concurrent.futures"):
+            self.assertNotIn(name, modules)
+        _, modules = import_report("import fixedcal\nfixedcal.FixedDate")
+        self.assertIn("fixedcal.core.date", modules)
+        self.assertNotIn("numpy", modules)
+        _, modules = import_report("import fixedcal.workdays")
+        self.assertNotIn("numpy", modules)
+
+    def test_command_line_tool_does_not_load_worker_processes(self):
+        _, modules = import_report("import fixedcal.cli")
+        self.assertNotIn("concurrent.futures.process", modules)
+
+class TestLazyAttributes(unittest.TestCase):
+    def test_classes_and_submodules(self):
+        # pylint: disable=import-outside-toplevel
+        import fixedcal
+        from fixedcal.core.date import FixedDate
+        from fixedcal.periods import IFCMonth
+        self.assertIs(fixedcal.FixedDate, FixedDate)
+        self.assertIs(fixedcal.periods.IFCMonth, IFCMonth)
+        self.assertIn("FixedDateRange", dir(fixedcal))
+        self.assertIn("vectorized", dir(fixedcal))
+        with self.assertRaises(AttributeError):
+            getattr(fixedcal, "FixedWeek")
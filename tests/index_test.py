@@ -0,0 +1,64 @@
+import unittest
+import datetime
+import random
+from fixedcal.core.date import FixedDate
+from fixedcal.index import FixedDateIndex
+from fixedcal.periods import IFCWeek, IFCMonth, IFCQuarter, IFCYear
+
+class TestFixedDateIndex(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(21)
+        start = datetime.date(2023, 11, 1).toordinal()
+        self.dates = [FixedDate.fromordinal(start + generator.randrange(500)) for _ in range(2000)]
+        self.events = [(date, number) for number, date in enumerate(self.dates)]
+        self.index = FixedDateIndex(self.dates, values=self.events)
+
+    def naive(self, predicate):
+        return sorted((event for event in self.events if predicate(event[0])),
+                      key=lambda event: (event[0].toordinal(), event[1]))
+
+    def test_values_are_sorted_stably(self):
+        self.assertEqual(list(self.index), self.naive(lambda date: True))
+        self.assertEqual(len(self.index), 2000)
+
+    def test_between(self):
+        start = FixedDate(day=20, month=13, year=2023)
+        end = FixedDate(day=3, month=7, year=2024)
+        self.assertEqual(self.index.between(start, end),
+                         self.naive(lambda date: start <= date < end))
+        self.assertEqual(self.index.between(start.date, end.date),
+                         self.naive(lambda date: start <= date < end))
+        self.assertEqual(self.index.between(end, start), [])
+
+    def test_slices_by_periods(self):
+        for month in range(1, 14):
+            self.assertEqual(self.index.slice_by_month(2024, month),
+                             self.naive(lambda date: IFCMonth(2024, month).contains(date)))
+        self.assertTrue(any(event[0].is_leap_day for event in self.index.slice_by_month(2024, 6)))
+        for week in (1, 24, 52):
+            self.assertEqual(self.index.slice_by_week(2023, week),
+                             self.naive(lambda date: IFCWeek(2023, week).contains(date)))
+        for quarter in range(1, 5):
+            self.assertEqual(self.index.slice_by_quarter(2024, quarter),
+                             self.naive(lambda date: IFCQuarter(2024, quarter).contains(date)))
+        self.assertEqual(self.index.slice_by_year(2024),
+                         self.naive(lambda date: IFCYear(2024).contains(date)))
+        with self.assertRaises(ValueError):
+            self.index.slice_by_month(2024, 14)
+
+    def test_insert(self):
+        index = FixedDateIndex()
+        for event in self.events:
+            index.insert(event[0], event)
+        self.assertEqual(list(index), list(self.index))
+        index.insert(FixedDate(day=29, month=6, year=2024))
+        self.assertEqual(index.slice_by_week(2024, 24)[-1], FixedDate(day=29, month=6, year=2024))
+
+    def test_dates_as_values(self):
+        index = FixedDateIndex(reversed(self.dates))
+        self.assertEqual(list(index), sorted(self.dates))
+        self.assertEqual(repr(index), "FixedDateIndex(length=2000)")
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            FixedDateIndex(self.dates, values=[1, 2])
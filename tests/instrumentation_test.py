@@ -0,0 +1,81 @@
+import unittest
+import datetime
+from fixedcal.core.date import FixedDate
+from fixedcal import instrumentation
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(instrumentation.is_enabled())
+        FixedDate(datetime.date(2024, 1, 1)).weekday
+        self.assertEqual(instrumentation.snapshot(), {})
+        self.assertFalse(hasattr(FixedDate.weekday.fget, "__wrapped__"))
+
+    def test_counts_operations(self):
+        instrumentation.enable()
+        date = FixedDate(datetime.date(2024, 1, 1))
+        FixedDate(day=1, month=1, year=2024)
+        FixedDate(day=1, month=1, year=2025)
+        FixedDate(day_of_year=1, year=2024)
+        FixedDate.fromordinal(739000)
+        date.weekday
+        date.weekday
+        date.add_days(3)
+        date + datetime.timedelta(1)
+        str(date)
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats["init/date"].calls, 1)
+        self.assertEqual(stats["init/day_month_year"].calls, 2)
+        self.assertEqual(stats["init/day_of_year"].calls, 1)
+        self.assertEqual(stats["init/ordinal"].calls, 1)
+        self.assertEqual(stats["property/weekday"].calls, 2)
+        self.assertEqual(stats["add/days"].calls, 2)
+        self.assertEqual(stats["add/timedelta"].calls, 1)
+        self.assertEqual(stats["str"].calls, 1)
+        self.assertGreater(stats["property/weekday"].total_time, 0)
+
+    def test_subtraction_is_bucketed_by_span(self):
+        first = FixedDate(day=1, month=1, year=2024)
+        with instrumentation.recording():
+            for days in (0, 7, 8, 366, 367, 40000):
+                first.add_days(days) - first
+            first - datetime.timedelta(3)
+        stats = instrumentation.snapshot()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual({name: value.calls for name, value in stats.items()
+                          if name.startswith("sub/")},
+                         {"sub/span<=7": 2, "sub/span<=28": 1, "sub/span<=366": 1,
+                          "sub/span<=3653": 1, "sub/span>36525": 1, "sub/timedelta": 1})
+
+    def test_failing_calls_are_counted(self):
+        with instrumentation.recording():
+            with self.assertRaises(ValueError):
+                FixedDate(day=30, month=1, year=2024)
+        self.assertEqual(instrumentation.snapshot()["init/day_month_year"].calls, 1)
+
+    def test_reset_and_nested_recording(self):
+        instrumentation.enable()
+        with instrumentation.recording():
+            FixedDate.fromordinal(1)
+        self.assertTrue(instrumentation.is_enabled())
+        instrumentation.enable()
+        FixedDate.fromordinal(1)
+        self.assertEqual(instrumentation.snapshot()["init/ordinal"].calls, 2)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_disable_restores_behavior(self):
+        original = FixedDate.__dict__["weekday"]
+        instrumentation.enable()
+        date = FixedDate(day=29, month=6, year=2024)
+        self.assertIsNone(date.weekday)
+        self.assertEqual(FixedDate.weekday.__doc__, original.__doc__)
+        instrumentation.disable()
+        self.assertIs(FixedDate.__dict__["weekday"], original)
+        self.assertEqual(str(FixedDate.fromisoformat("2024-06-29")), "2024-06-29")
@@ -0,0 +1,78 @@
+import unittest
+import random
+import datetime
+from fixedcal.services.leap_days import is_leap_year, leap_years_before,\
+    gregorian_leap_days_between, fixed_leap_days_between
+
+def loop_leap_days_between(date1: datetime.date, date2: datetime.date,
+                           month: int, day: int) -> int:
+    # reference implementation stepping through every day
+    count = 0
+    if date1 > date2:
+        date1, date2 = date2, date1
+    for plusday in range(0, (date2 - date1).days):
+        date = date1 + datetime.timedelta(plusday)
+        if is_leap_year(date.year) and date.month == month and date.day == day:
+            count += 1
+    return count
+
+def random_date(rng: random.Random, low: int = 1, high: int = 3652059) -> datetime.date:
+    return datetime.date.fromordinal(rng.randint(low, high))
+
+class TestLeapDays(unittest.TestCase):
+    def test_leap_years_before_first_year(self):
+        self.assertEqual(leap_years_before(1), 0)
+
+    def test_leap_years_before_matches_is_leap_year(self):
+        count = 0
+        for year in range(1, 10000):
+            self.assertEqual(leap_years_before(year), count)
+            count += is_leap_year(year)
+
+    def test_gregorian_leap_day_itself_is_included_at_start(self):
+        leap_day = datetime.date(2024, 2, 29)
+        self.assertEqual(gregorian_leap_days_between(leap_day, datetime.date(2024, 3, 1)), 1)
+        self.assertEqual(gregorian_leap_days_between(datetime.date(2024, 2, 28), leap_day), 0)
+
+    def test_fixed_leap_day_itself_is_included_at_start(self):
+        leap_day = datetime.date(2024, 6, 27)
+        self.assertEqual(fixed_leap_days_between(leap_day, datetime.date(2024, 6, 28)), 1)
+        self.assertEqual(fixed_leap_days_between(datetime.date(2024, 6, 26), leap_day), 0)
+
+    def test_whole_supported_range(self):
+        first, last = datetime.date(1, 1, 1), datetime.date(9999, 12, 31)
+        self.assertEqual(gregorian_leap_days_between(first, last), 2424)
+        self.assertEqual(fixed_leap_days_between(last, first), 2424)
+
+    def test_equivalence_with_loop_around_leap_days(self):
+        for year in (1, 4, 100, 400, 1900, 2000, 2023, 2024, 9996, 9999):
+            for month, day in ((2, 28), (3, 1), (6, 26), (6, 27), (6, 28)):
+                start = datetime.date(year, month, day)
+                for span in (-400, -1, 0, 1, 2, 400):
+                    try:
+                        end = start + datetime.timedelta(span)
+                    except OverflowError:
+                        continue
+                    self._assert_equivalent(start, end)
+
+    def test_equivalence_with_loop_random_short_spans(self):
+        rng = random.Random(20221205)
+        for _ in range(300):
+            date1 = random_date(rng)
+            date2 = random_date(rng, max(1, date1.toordinal() - 800),
+                                min(3652059, date1.toordinal() + 800))
+            self._assert_equivalent(date1, date2)
+
+    def test_equivalence_with_loop_random_long_spans(self):
+        rng = random.Random(9999)
+        for _ in range(5):
+            date1 = random_date(rng)
+            date2 = random_date(rng, max(1, date1.toordinal() - 100000),
+                                min(3652059, date1.toordinal() + 100000))
+            self._assert_equivalent(date1, date2)
+
+    def _assert_equivalent(self, date1: datetime.date, date2: datetime.date):
+        self.assertEqual(gregorian_leap_days_between(date1, date2),
+                         loop_leap_days_between(date1, date2, 2, 29), (date1, date2))
+        self.assertEqual(fixed_leap_days_between(date1, date2),
+                         loop_leap_days_between(date1, date2, 6, 27), (date1, date2))
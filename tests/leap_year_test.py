@@ -57,6 +57,7 @@ class TestLeapYear(unittest.TestCase):
         date1 = FixedDate(datetime.date(2024, 2, 25))
         date2 = FixedDate(datetime.date(2024, 3, 3))
         self.assertEqual(date2-date1, datetime.timedelta(6))
+        self.assertEqual(date1-date2, datetime.timedelta(-6))
 
     def test_fixed_date_difference_over_fixed_leap_day(self):
         # in Gregorian system there are 7 days between,
@@ -86,3 +87,27 @@ class TestLeapYear(unittest.TestCase):
         date1 = FixedDate(datetime.date(2020, 2, 15))
         date2 = FixedDate(datetime.date(2028, 4, 20))
         self.assertEqual(date2-date1, datetime.timedelta(2986))
+        self.assertEqual(date1-date2, datetime.timedelta(-2986))
+
+    def test_last_day_of_sol_in_leap_year(self):
+        fixed_date = FixedDate(day=28, month=7, year=2024)
+        self.assertEqual(fixed_date.day_of_year, 197)
+        self.assertEqual(fixed_date.month, 7)
+        self.assertEqual(fixed_date.day_of_month, 28)
+        self.assertEqual(fixed_date.week_of_year, 28)
+        self.assertEqual(str(fixed_date), "2024-07-28")
+
+    def test_week_of_year_on_saturday_after_leap_day(self):
+        fixed_date = FixedDate(day=7, month=7, year=2024)
+        self.assertEqual(fixed_date.weekday, 7)
+        self.assertEqual(fixed_date.week_of_year, 25)
+
+    def test_first_day_of_third_quarter_in_leap_year(self):
+        self.assertEqual(FixedDate(day=14, month=7, year=2024).year_quarter, 2)
+        self.assertEqual(FixedDate(day=15, month=7, year=2024).year_quarter, 3)
+
+    def test_fields_round_trip_over_leap_year(self):
+        for day_of_year in range(1, 367):
+            fixed_date = FixedDate(day_of_year=day_of_year, year=2024)
+            same_date = FixedDate(day=fixed_date.day_of_month, month=fixed_date.month, year=2024)
+            self.assertEqual(same_date.day_of_year, day_of_year)
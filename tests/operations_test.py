@@ -29,6 +29,24 @@ class TestOperations(unittest.TestCase):
     def test_less_than_with_true_expected(self):
         self.assertTrue(self.fixed1 < self.fixed2)
 
+    def test_less_or_equal_and_greater_or_equal(self):
+        self.assertTrue(self.fixed1 <= self.fixed1)
+        self.assertTrue(self.fixed1 <= self.fixed2)
+        self.assertFalse(self.fixed2 <= self.fixed1)
+        self.assertTrue(self.fixed2 >= self.fixed2)
+        self.assertTrue(self.fixed2 >= self.fixed1)
+        self.assertFalse(self.fixed1 >= self.fixed2)
+
+    def test_comparison_with_other_type(self):
+        self.assertRaises(TypeError, lambda : self.fixed1 < datetime.date(2022, 12, 6))
+        self.assertRaises(TypeError, lambda : self.fixed1 >= 3)
+
+    def test_sorting(self):
+        dates = [FixedDate.fromordinal(ordinal) for ordinal in (739000, 5, 3652059, 739000, 1)]
+        self.assertEqual([date.toordinal() for date in sorted(dates)],
+                         [1, 5, 739000, 739000, 3652059])
+        self.assertEqual(max(dates).toordinal(), 3652059)
+
     def test_subtration_of_two_dates(self):
         self.assertEqual(self.fixed2-self.fixed1, datetime.timedelta(1))
 
@@ -0,0 +1,116 @@
+import unittest
+import random
+import datetime
+from fixedcal import FixedDate
+from fixedcal.services.leap_days import gregorian_leap_days_between, fixed_leap_days_between
+
+class TestOrdinal(unittest.TestCase):
+    def test_ordinal_matches_gregorian_ordinal(self):
+        for gregorian in (datetime.date(1, 1, 1), datetime.date(2024, 6, 17),
+                          datetime.date(2100, 12, 31), datetime.date(9999, 12, 31)):
+            fixed_date = FixedDate(gregorian)
+            self.assertEqual(fixed_date.toordinal(), gregorian.toordinal())
+            self.assertEqual(FixedDate.fromordinal(gregorian.toordinal()), fixed_date)
+
+    def test_fromordinal_over_year_boundaries(self):
+        for year in (1, 4, 100, 400, 1900, 2000, 2023, 2024, 9999):
+            for gregorian in (datetime.date(year, 1, 1), datetime.date(year, 12, 31)):
+                fixed_date = FixedDate.fromordinal(gregorian.toordinal())
+                self.assertEqual(fixed_date.date, gregorian)
+                self.assertEqual(fixed_date.day_of_year, gregorian.timetuple().tm_yday)
+
+    def test_fromordinal_out_of_range_raises(self):
+        self.assertRaises(ValueError, lambda : FixedDate.fromordinal(0))
+        self.assertRaises(ValueError, lambda : FixedDate.fromordinal(3652060))
+
+    def test_timedelta_on_left_side(self):
+        fixed_date = FixedDate(day=28, month=13, year=2022)
+        self.assertEqual(datetime.timedelta(1) + fixed_date, FixedDate(day=29, month=13, year=2022))
+
+    def test_addition_of_invalid_type_raises(self):
+        self.assertRaises(TypeError, lambda : FixedDate(day=1, month=1, year=2022) + 3)
+
+    def test_addition_out_of_range_raises(self):
+        last = FixedDate(day=29, month=13, year=9999)
+        self.assertRaises(OverflowError, lambda : last + datetime.timedelta(1))
+        first = FixedDate(day=1, month=1, year=1)
+        self.assertRaises(OverflowError, lambda : first - datetime.timedelta(1))
+
+    def test_subtraction_matches_leap_day_counting_of_native_dates(self):
+        rng = random.Random(2024)
+        for _ in range(500):
+            date1 = datetime.date.fromordinal(rng.randint(1, 3652059))
+            date2 = datetime.date.fromordinal(rng.randint(1, 3652059))
+            leap_days = fixed_leap_days_between(date1, date2) \
+                - gregorian_leap_days_between(date1, date2)
+            expected = date1 - date2 + datetime.timedelta(leap_days if date1 >= date2
+                                                          else -leap_days)
+            self.assertEqual(FixedDate(date1) - FixedDate(date2), expected)
+            self.assertEqual(FixedDate(date2) - FixedDate(date1), -expected)
+
+class TestCalendarArithmetic(unittest.TestCase):
+    def test_add_days(self):
+        fixed_date = FixedDate(day=28, month=6, year=2024)
+        self.assertTrue(fixed_date.add_days(1).is_leap_day)
+        self.assertEqual(fixed_date.add_days(2), FixedDate(day=1, month=7, year=2024))
+        self.assertEqual(fixed_date.add_days(-28), FixedDate(day=28, month=5, year=2024))
+
+    def test_add_weeks_keeps_weekday(self):
+        fixed_date = FixedDate(day=3, month=1, year=2023)
+        for weeks in (-60, -1, 0, 1, 25, 52, 100):
+            self.assertEqual(fixed_date.add_weeks(weeks).weekday, fixed_date.weekday)
+
+    def test_add_weeks_skips_leap_day(self):
+        fixed_date = FixedDate(day=24, month=6, year=2024)
+        self.assertEqual(fixed_date.add_weeks(1), FixedDate(day=3, month=7, year=2024))
+        self.assertEqual(fixed_date.add_weeks(1) - fixed_date, datetime.timedelta(8))
+
+    def test_add_weeks_skips_year_day(self):
+        fixed_date = FixedDate(day=28, month=13, year=2022)
+        self.assertEqual(fixed_date.add_weeks(1), FixedDate(day=7, month=1, year=2023))
+        self.assertEqual(fixed_date.add_weeks(-52), FixedDate(day=28, month=13, year=2021))
+
+    def test_add_weeks_from_year_day(self):
+        year_day = FixedDate(day=29, month=13, year=2022)
+        self.assertEqual(year_day.add_weeks(1), FixedDate(day=7, month=1, year=2023))
+
+    def test_add_months(self):
+        fixed_date = FixedDate(day=15, month=12, year=2022)
+        self.assertEqual(fixed_date.add_months(1), FixedDate(day=15, month=13, year=2022))
+        self.assertEqual(fixed_date.add_months(2), FixedDate(day=15, month=1, year=2023))
+        self.assertEqual(fixed_date.add_months(-12), FixedDate(day=15, month=13, year=2021))
+        self.assertEqual(fixed_date.add_months(-25), FixedDate(day=15, month=13, year=2020))
+
+    def test_add_months_clamps_leap_day(self):
+        leap_day = FixedDate(day=29, month=6, year=2024)
+        self.assertEqual(leap_day.add_months(1), FixedDate(day=28, month=7, year=2024))
+        self.assertEqual(leap_day.add_months(13), FixedDate(day=28, month=6, year=2025))
+        self.assertTrue(leap_day.add_months(4*13).is_leap_day)
+
+    def test_add_months_clamps_year_day(self):
+        year_day = FixedDate(day=29, month=13, year=2022)
+        self.assertEqual(year_day.add_months(1), FixedDate(day=28, month=1, year=2023))
+        self.assertTrue(year_day.add_months(13).is_year_day)
+
+    def test_add_years(self):
+        fixed_date = FixedDate(day=5, month=7, year=2022)
+        self.assertEqual(fixed_date.add_years(2), FixedDate(day=5, month=7, year=2024))
+        self.assertEqual(fixed_date.add_years(-2021), FixedDate(day=5, month=7, year=1))
+
+    def test_add_years_clamps_leap_day(self):
+        leap_day = FixedDate(day=29, month=6, year=2024)
+        self.assertEqual(leap_day.add_years(1), FixedDate(day=28, month=6, year=2025))
+        self.assertTrue(leap_day.add_years(4).is_leap_day)
+        self.assertFalse(leap_day.add_years(76).is_leap_day)
+
+    def test_add_years_keeps_year_day(self):
+        year_day = FixedDate(day=29, month=13, year=2023)
+        self.assertTrue(year_day.add_years(1).is_year_day)
+        self.assertEqual(year_day.add_years(1).day_of_year, 366)
+
+    def test_calendar_arithmetic_out_of_range_raises(self):
+        fixed_date = FixedDate(day=1, month=1, year=9999)
+        self.assertRaises(OverflowError, lambda : fixed_date.add_years(1))
+        self.assertRaises(OverflowError, lambda : fixed_date.add_months(13))
+        self.assertRaises(OverflowError, lambda : fixed_date.add_weeks(-52*9999))
+        self.assertRaises(OverflowError, lambda : fixed_date.add_days(400))
@@ -0,0 +1,97 @@
+import unittest
+import datetime
+from fixedcal import FixedDate
+
+try:
+    import numpy as np
+    import pandas as pd
+    from fixedcal.pandas import FixedDateArray, FixedDateDtype
+except ImportError:
+    pd = None
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestFixedDateArray(unittest.TestCase):
+    def setUp(self):
+        self.series = pd.Series([FixedDate(day=29, month=6, year=2024), None,
+                                 datetime.date(2022, 12, 31), "2024-07-03"], dtype="fixeddate")
+
+    def test_dtype_and_storage(self):
+        self.assertIsInstance(self.series.dtype, FixedDateDtype)
+        self.assertEqual(self.series.array.to_ordinals().dtype, np.int32)
+        self.assertEqual(self.series.array.nbytes, 4*5)
+
+    def test_scalars(self):
+        self.assertEqual(self.series[0], FixedDate(day=29, month=6, year=2024))
+        self.assertIs(self.series[1], pd.NA)
+        self.assertTrue(self.series[2].is_year_day)
+
+    def test_missing_values(self):
+        self.assertEqual(self.series.isna().tolist(), [False, True, False, False])
+        self.assertEqual(len(self.series.dropna()), 3)
+
+    def test_sorting_and_unique(self):
+        self.assertEqual([str(date) for date in self.series.sort_values().dropna()],
+                         ["2022-13-29", "2024-06-29", "2024-07-03"])
+        self.assertEqual(self.series.nunique(), 3)
+
+    def test_comparison_with_scalar(self):
+        self.assertEqual((self.series == FixedDate(day=3, month=7, year=2024)).tolist(),
+                         [False, False, False, True])
+
+    def test_concat_take_and_setitem(self):
+        concatenated = pd.concat([self.series, self.series], ignore_index=True)
+        self.assertEqual(len(concatenated), 8)
+        taken = self.series.take([3, 0])
+        self.assertEqual(taken.iloc[0], FixedDate(day=3, month=7, year=2024))
+        self.series[1] = FixedDate(day=1, month=1, year=2000)
+        self.assertEqual(self.series[1], FixedDate(day=1, month=1, year=2000))
+
+    def test_datetime64_round_trip(self):
+        dates = np.array(["2024-06-17", "NaT"], dtype="datetime64[D]")
+        array = FixedDateArray.from_datetime64(dates)
+        self.assertTrue(array[0].is_leap_day)
+        self.assertIs(array[1], pd.NA)
+        np.testing.assert_array_equal(array.to_datetime64(), dates)
+
+    def test_string_representation(self):
+        self.assertIn("2024-06-29", repr(self.series))
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestIFCAccessor(unittest.TestCase):
+    def setUp(self):
+        self.dates = pd.Series(pd.to_datetime(["2024-06-17", "2024-06-18", None, "2022-12-31"]),
+                               index=["a", "b", "c", "d"], name="when")
+
+    def test_fields_of_datetime64_series(self):
+        self.assertEqual(self.dates.ifc.month.tolist(), [6, 7, pd.NA, 13])
+        self.assertEqual(self.dates.ifc.day_of_month.tolist(), [29, 1, pd.NA, 29])
+        self.assertEqual(self.dates.ifc.is_leap_day.tolist(), [True, False, pd.NA, False])
+        self.assertEqual(self.dates.ifc.is_year_day.tolist(), [False, False, pd.NA, True])
+        self.assertEqual(list(self.dates.ifc.year.index), ["a", "b", "c", "d"])
+        self.assertEqual(self.dates.ifc.year.name, "when")
+
+    def test_weekday_is_missing_on_special_days(self):
+        self.assertEqual(self.dates.ifc.weekday.tolist(), [pd.NA, 1, pd.NA, pd.NA])
+
+    def test_fields_match_fixed_date(self):
+        dates = pd.Series(pd.date_range("2023-12-20", "2025-01-10"))
+        fixed = dates.ifc.to_fixed()
+        for name in ("month", "day_of_month", "week_of_year", "year_quarter", "weekday"):
+            values = getattr(fixed.ifc, name).tolist()
+            expected = [getattr(date, name) for date in fixed]
+            self.assertEqual([None if value is pd.NA else value for value in values], expected)
+
+    def test_timezone_aware_series_uses_wall_time(self):
+        dates = pd.Series(pd.to_datetime(["2022-12-31 23:30"]).tz_localize("Europe/Helsinki"))
+        self.assertTrue(dates.ifc.is_year_day[0])
+
+    def test_group_by_month(self):
+        frame = pd.DataFrame({"date": pd.Series(pd.date_range("2024-06-01", "2024-07-15")),
+                              "value": 1})
+        sums = frame.groupby(frame["date"].ifc.month_start)["value"].sum()
+        self.assertEqual([str(date) for date in sums.index],
+                         ["2024-06-01", "2024-07-01"])
+        self.assertEqual(sums.tolist(), [17, 28])
+
+    def test_other_dtype_raises(self):
+        self.assertRaises(AttributeError, lambda : pd.Series([1, 2]).ifc)
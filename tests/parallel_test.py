@@ -0,0 +1,51 @@
+import unittest
+import datetime
+import pickle
+from fixedcal.core.date import FixedDate
+from fixedcal.column import FixedDateColumn
+from fixedcal.parallel import convert, iconvert, convert_column, TO_IFC, TO_GREGORIAN
+
+class TestParallelConversion(unittest.TestCase):
+    def setUp(self):
+        start = datetime.date(2023, 12, 1).toordinal()
+        self.dates = [datetime.date.fromordinal(start + offset) for offset in range(0, 900, 3)]
+
+    def test_convert_in_worker_processes(self):
+        expected = [str(FixedDate(date)) for date in self.dates]
+        self.assertEqual(convert(self.dates, TO_IFC, chunksize=7, workers=2), expected)
+        fixed_dates = [FixedDate(date) for date in self.dates]
+        self.assertEqual(convert(fixed_dates, TO_GREGORIAN, chunksize=50, workers=2),
+                         [date.isoformat() for date in self.dates])
+
+    def test_convert_in_this_process(self):
+        values = [1, FixedDate(day=29, month=6, year=2024), datetime.date(9999, 12, 31)]
+        self.assertEqual(convert(values, workers=0), ["0001-01-01", "2024-06-29", "9999-13-29"])
+        self.assertEqual(convert(values, TO_GREGORIAN, workers=0),
+                         ["0001-01-01", "2024-06-17", "9999-12-31"])
+        self.assertEqual(convert([], workers=0), [])
+
+    def test_streaming_reads_input_lazily(self):
+        consumed = []
+        def values():
+            for date in self.dates:
+                consumed.append(date)
+                yield date
+        results = iconvert(values(), chunksize=10, workers=1, max_pending=2)
+        self.assertEqual(next(results), str(FixedDate(self.dates[0])))
+        self.assertLessEqual(len(consumed), 30)
+        self.assertEqual(len(list(results)), len(self.dates) - 1)
+
+    def test_chunks_are_packed_ordinals(self):
+        column = FixedDateColumn(self.dates[:3])
+        self.assertEqual(convert_column(TO_IFC, pickle.loads(pickle.dumps(column))),
+                         [str(FixedDate(date)) for date in self.dates[:3]])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            convert(self.dates, "to-julian")
+        with self.assertRaises(ValueError):
+            convert(self.dates, chunksize=0)
+        with self.assertRaises(ValueError):
+            convert([1, 0], workers=0)
+        with self.assertRaises(ValueError):
+            convert([1, 2**40], workers=2)
@@ -0,0 +1,115 @@
+import unittest
+import datetime
+from fixedcal.core.date import FixedDate
+from fixedcal.core.date_time import FixedDateTime
+from fixedcal.periods import IFCWeek, IFCMonth, IFCQuarter, IFCYear, bucketize
+
+class TestPeriods(unittest.TestCase):
+    def test_regular_month(self):
+        month = IFCMonth(2023, 7)
+        self.assertEqual(month.start, FixedDate(day=1, month=7, year=2023))
+        self.assertEqual(month.end, FixedDate(day=28, month=7, year=2023))
+        self.assertEqual(len(month), 28)
+        self.assertEqual(str(month), "2023-07")
+
+    def test_leap_day_belongs_to_june(self):
+        leap_day = FixedDate(day=29, month=6, year=2024)
+        self.assertEqual(IFCMonth(2024, 6).end, leap_day)
+        self.assertEqual(len(IFCMonth(2024, 6)), 29)
+        self.assertEqual(IFCWeek.of(leap_day), IFCWeek(2024, 24))
+        self.assertEqual(len(IFCWeek(2024, 24)), 8)
+        self.assertEqual(IFCQuarter.of(leap_day), IFCQuarter(2024, 2))
+        self.assertEqual(len(IFCQuarter(2024, 2)), 92)
+        self.assertEqual(IFCMonth(2024, 7).start, FixedDate(day=1, month=7, year=2024))
+
+    def test_year_day_belongs_to_december(self):
+        year_day = FixedDate(day=29, month=13, year=2023)
+        self.assertEqual(IFCMonth(2023, 13).end, year_day)
+        self.assertEqual(IFCWeek(2023, 52).end, year_day)
+        self.assertEqual(IFCQuarter(2023, 4).end, year_day)
+        self.assertEqual(IFCYear(2023).end, year_day)
+        self.assertEqual(len(IFCYear(2023)), 365)
+        self.assertEqual(len(IFCYear(2024)), 366)
+
+    def test_periods_match_date_fields(self):
+        start = datetime.date(2023, 12, 20).toordinal()
+        for ordinal in range(start, start + 400):
+            date = FixedDate.fromordinal(ordinal)
+            self.assertEqual(IFCWeek.of(date), IFCWeek(date.year, date.week_of_year))
+            self.assertEqual(IFCMonth.of(date), IFCMonth(date.year, date.month))
+            self.assertEqual(IFCQuarter.of(date), IFCQuarter(date.year, date.year_quarter))
+            self.assertEqual(IFCYear.of(date), IFCYear(date.year))
+            self.assertIn(date, IFCWeek(date.year, date.week_of_year))
+
+    def test_periods_cover_years_without_gaps(self):
+        for period_type in (IFCWeek, IFCMonth, IFCQuarter, IFCYear):
+            period = period_type.of(FixedDate(day=1, month=1, year=2023))
+            for _ in range(100):
+                following = period.next()
+                self.assertEqual(following.start_ordinal, period.end_ordinal + 1)
+                self.assertEqual(following.prev(), period)
+                period = following
+
+    def test_contains(self):
+        month = IFCMonth(2024, 6)
+        self.assertTrue(month.contains(datetime.date(2024, 6, 17)))
+        self.assertFalse(month.contains(datetime.date(2024, 6, 18)))
+        self.assertNotIn(FixedDate(day=28, month=5, year=2024), month)
+
+    def test_next_and_prev_over_year_boundary(self):
+        self.assertEqual(IFCWeek(2023, 52).next(), IFCWeek(2024, 1))
+        self.assertEqual(IFCQuarter(2024, 1).prev(), IFCQuarter(2023, 4))
+        self.assertEqual(IFCYear(2023).next(), IFCYear(2024))
+        with self.assertRaises(OverflowError):
+            IFCMonth(9999, 13).next()
+        with self.assertRaises(OverflowError):
+            IFCYear(1).prev()
+
+    def test_invalid_periods(self):
+        with self.assertRaises(ValueError):
+            IFCWeek(2024, 53)
+        with self.assertRaises(ValueError):
+            IFCMonth(2024, 0)
+        with self.assertRaises(ValueError):
+            IFCYear(10000)
+
+    def test_equality_and_repr(self):
+        self.assertEqual(len({IFCMonth(2024, 1), IFCMonth(2024, 1), IFCWeek(2024, 1)}), 2)
+        self.assertNotEqual(IFCMonth(2024, 1), IFCWeek(2024, 1))
+        self.assertEqual(repr(IFCQuarter(2024, 3)), "IFCQuarter(2024, 3)")
+        self.assertEqual(repr(IFCYear(2024)), "IFCYear(2024)")
+        self.assertEqual(str(IFCWeek(2024, 5)), "2024-W05")
+        self.assertEqual(str(IFCQuarter(2024, 3)), "2024-Q3")
+
+class TestBucketize(unittest.TestCase):
+    def test_dates_grouped_by_month(self):
+        dates = [datetime.date(2024, 6, 16), datetime.date(2024, 6, 17),
+                 datetime.date(2024, 6, 18), datetime.date(2024, 8, 1)]
+        buckets = list(bucketize(dates, IFCMonth))
+        self.assertEqual([period for period, _ in buckets],
+                         [IFCMonth(2024, 6), IFCMonth(2024, 7), IFCMonth(2024, 8)])
+        self.assertEqual(buckets[0][1], dates[:2])
+
+    def test_mixed_values_with_key(self):
+        rows = [{"at": FixedDate(day=1, month=1, year=2024)},
+                {"at": FixedDateTime(FixedDate(day=28, month=13, year=2023),
+                                     datetime.time(23))},
+                {"at": 1704067200},     # 2024-01-01 00:00 UTC
+                {"at": datetime.datetime(2024, 1, 8, 12)}]
+        rows[0], rows[1] = rows[1], rows[0]
+        buckets = list(bucketize(rows, IFCWeek, key=lambda row: row["at"]))
+        self.assertEqual([(str(period), len(values)) for period, values in buckets],
+                         [("2023-W52", 1), ("2024-W01", 2), ("2024-W02", 1)])
+
+    def test_timestamps_with_utc_offset(self):
+        timestamps = [1704063600]   # 2023-12-31 23:00 UTC
+        self.assertEqual(next(bucketize(timestamps, IFCYear))[0], IFCYear(2023))
+        self.assertEqual(next(bucketize(timestamps, IFCYear, utc_offset=7200))[0], IFCYear(2024))
+
+    def test_empty_input(self):
+        self.assertEqual(list(bucketize([], IFCQuarter)), [])
+
+    def test_unsorted_input(self):
+        dates = [datetime.date(2024, 2, 1), datetime.date(2024, 1, 1)]
+        with self.assertRaises(ValueError):
+            list(bucketize(dates, IFCMonth))
@@ -0,0 +1,117 @@
+import unittest
+import datetime
+from fixedcal.core.date import FixedDate
+from fixedcal.recurrence import Recurrence, DAY, WEEK, MONTH, YEAR, LEAP_DAY, YEAR_DAY
+
+def naive_occurrences(predicate, start, end):
+    return [FixedDate.fromordinal(ordinal)
+            for ordinal in range(start.toordinal(), end.toordinal())
+            if predicate(FixedDate.fromordinal(ordinal))]
+
+class TestRecurrence(unittest.TestCase):
+    def setUp(self):
+        self.start = FixedDate(day=20, month=13, year=2023)
+        self.end = FixedDate(day=10, month=2, year=2025)
+
+    def assert_matches_naive(self, rule, predicate, skip_special_days=False):
+        expected = naive_occurrences(predicate, self.start, self.end)
+        occurrences = list(rule.occurrences_between(self.start, self.end, skip_special_days))
+        self.assertEqual([str(date) for date in occurrences], [str(date) for date in expected])
+        self.assertEqual(rule.count_between(self.start, self.end, skip_special_days),
+                         len(expected))
+
+    def test_every_day(self):
+        rule = Recurrence.parse("every day")
+        self.assert_matches_naive(rule, lambda date: True)
+        self.assert_matches_naive(rule, lambda date: date.weekday is not None,
+                                  skip_special_days=True)
+
+    def test_every_third_day(self):
+        rule = Recurrence.parse("every 3 days")
+        def predicate(date):
+            return date.weekday is not None and \
+                (364*(date.year-1) + 28*(date.month-1) + date.day_of_month-1) % 3 == 0
+        self.assert_matches_naive(rule, predicate)
+
+    def test_weekdays(self):
+        self.assert_matches_naive(Recurrence.parse("every Tuesday"),
+                                  lambda date: date.weekday == 3)
+        self.assert_matches_naive(Recurrence.parse("every monday and friday plus year day"),
+                                  lambda date: date.weekday in (2, 6) or date.is_year_day)
+
+    def test_every_other_week_with_anchor(self):
+        anchor = FixedDate(day=8, month=1, year=2024)
+        rule = Recurrence(WEEK, [2], interval=2, anchor=anchor)
+        def predicate(date):
+            return date.weekday == 2 and \
+                (FixedDate(day=date.day_of_month, month=date.month, year=date.year)
+                 .week_of_year - 2 + 52*(date.year - 2024)) % 2 == 0
+        self.assert_matches_naive(rule, predicate)
+
+    def test_nth_weekday_of_month(self):
+        rule = Recurrence.parse("every 2nd Tuesday of each IFC month")
+        self.assertEqual(rule.days, (10,))
+        self.assert_matches_naive(rule, lambda date: date.day_of_month == 10)
+        rule = Recurrence.parse("last Saturday of every month")
+        self.assert_matches_naive(rule, lambda date: date.day_of_month == 28)
+
+    def test_day_of_month_plus_year_day(self):
+        rule = Recurrence.parse("day 28 of every month plus year day")
+        self.assertEqual(rule.special_days, frozenset({YEAR_DAY}))
+        self.assert_matches_naive(rule, lambda date: date.day_of_month == 28 or date.is_year_day)
+        self.assert_matches_naive(rule, lambda date: date.day_of_month == 28,
+                                  skip_special_days=True)
+
+    def test_days_of_every_other_month(self):
+        rule = Recurrence.parse("every 2 months on day 1, 15 and 28 plus leap day")
+        self.assert_matches_naive(rule, lambda date: date.is_leap_day or (
+            date.day_of_month in (1, 15, 28) and (13*(date.year-1) + date.month - 1) % 2 == 0))
+
+    def test_yearly(self):
+        rule = Recurrence.parse("every year on Sol 5 and 1 January")
+        self.assertEqual(rule.unit, YEAR)
+        self.assert_matches_naive(rule, lambda date: (date.month, date.day_of_month) in
+                                  ((7, 5), (1, 1)))
+
+    def test_leap_day_only(self):
+        rule = Recurrence(MONTH, [1], special_days=[LEAP_DAY])
+        leap_days = [date for date in rule.occurrences_between(
+            FixedDate(day=1, month=1, year=1890), FixedDate(day=1, month=1, year=1910))
+                     if date.is_leap_day]
+        self.assertEqual([date.year for date in leap_days], [1892, 1896, 1904, 1908])
+
+    def test_lazy_occurrences_until_the_end(self):
+        rule = Recurrence.parse("every day")
+        occurrences = rule.occurrences(FixedDate(day=27, month=13, year=9999))
+        self.assertEqual([str(date) for date in occurrences],
+                         ["9999-13-27", "9999-13-28", "9999-13-29"])
+        occurrences = Recurrence.parse("every sunday").occurrences(datetime.date(2024, 1, 1))
+        self.assertEqual(str(next(occurrences)), "2024-01-01")
+        self.assertEqual(str(next(occurrences)), "2024-01-08")
+
+    def test_count_over_long_span(self):
+        rule = Recurrence.parse("day 28 of every month plus year day")
+        first = FixedDate(day=1, month=1, year=1)
+        last = FixedDate(day=29, month=13, year=9999)
+        self.assertEqual(rule.count_between(first, last), 9999*13 + 9998)
+        ordinals = rule.ordinals_between(FixedDate(day=1, month=1, year=9999), last)
+        self.assertEqual(len(list(ordinals)), 13)
+        self.assertEqual(rule.count_between(last, first), 0)
+
+    def test_invalid_rules(self):
+        for spec in ("every fortnight", "day 29 of every month", "every year on sol 30",
+                     "every day plus holiday", "every 0 days"):
+            with self.assertRaises(ValueError, msg=spec):
+                Recurrence.parse(spec)
+        for spec in ("every month on foo", "day x of every month", "every year on sol x",
+                     "the x day of every month"):
+            with self.assertRaisesRegex(ValueError, "Invalid recurrence rule", msg=spec):
+                Recurrence.parse(spec)
+        with self.assertRaises(ValueError):
+            Recurrence(WEEK, [8])
+        with self.assertRaises(ValueError):
+            Recurrence(DAY, special_days=["new year"])
+
+    def test_repr(self):
+        self.assertEqual(repr(Recurrence.parse("2nd tuesday of every month plus year day")),
+                         "Recurrence('month', days=[10], interval=1, special_days=['year_day'])")
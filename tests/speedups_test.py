@@ -0,0 +1,60 @@
+import unittest
+import os
+import subprocess
+import sys
+from fixedcal.services import speedups
+from fixedcal.services.speedups import PURE_PYTHON, PURE_PYTHON_VARIABLE
+from fixedcal.services.leap_days import GREGORIAN_LEAP_DAY_OF_YEAR, FIXED_LEAP_DAY_OF_YEAR
+from fixedcal.services.ordinals import MAX_ORDINAL, fixed_fields
+
+@unittest.skipUnless(speedups.ENABLED, "compiled speedups are not available")
+class TestSpeedupsMatchPurePython(unittest.TestCase):
+    def assert_same(self, name, *args):
+        compiled = getattr(speedups._speedups, name)
+        self.assertEqual(compiled(*args), PURE_PYTHON[name](*args), (name, args))
+
+    def test_all_functions_are_compared(self):
+        for name in PURE_PYTHON:
+            self.assertTrue(hasattr(speedups._speedups, name), name)
+
+    def test_year_functions(self):
+        for year in range(1, 10000):
+            self.assert_same("is_leap_year", year)
+            self.assert_same("leap_years_before", year)
+            self.assert_same("year_start_ordinal", year)
+        self.assertIs(speedups._speedups.is_leap_year(2024), True)
+
+    def test_year_and_day_of_year(self):
+        for ordinal in list(range(1, 800)) + list(range(1, MAX_ORDINAL+1, 97)) \
+                + list(range(MAX_ORDINAL-800, MAX_ORDINAL+1)):
+            self.assert_same("year_and_day_of_year", ordinal)
+
+    def test_fields_and_leap_days_of_every_day(self):
+        for year in (1, 4, 100, 1900, 2000, 2023, 2024, 9996, 9999):
+            days_in_year = 366 if PURE_PYTHON["is_leap_year"](year) else 365
+            for day_of_year in range(1, days_in_year+1):
+                self.assert_same("fixed_fields", day_of_year, year)
+                self.assert_same("leap_days_before", year, day_of_year,
+                                 GREGORIAN_LEAP_DAY_OF_YEAR)
+                self.assert_same("leap_days_before", year, day_of_year, FIXED_LEAP_DAY_OF_YEAR)
+
+    def test_invalid_argument_types(self):
+        with self.assertRaises(TypeError):
+            speedups._speedups.is_leap_year("2024")
+        with self.assertRaises(TypeError):
+            speedups._speedups.fixed_fields(1)
+
+class TestPurePythonFallback(unittest.TestCase):
+    def test_pure_fields(self):
+        self.assertEqual(PURE_PYTHON["fixed_fields"](169, 2024), (739054, 6, 29, True))
+        self.assertEqual(PURE_PYTHON["fixed_fields"](365, 2023), (738885, 13, 29, False))
+        self.assertEqual(fixed_fields(170, 2024), (739055, 7, 1, True))
+
+    def test_environment_variable_forces_pure_python(self):
+        environment = dict(os.environ, **{PURE_PYTHON_VARIABLE: "1"})
+        output = subprocess.run(
+            [sys.executable, "-c", "from fixedcal.services import speedups\n"
+             "from fixedcal.services.leap_days import is_leap_year\n"
+             "print(speedups.ENABLED, is_leap_year is speedups.PURE_PYTHON['is_leap_year'])"],
+            env=environment, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), "False True")
@@ -14,3 +14,8 @@ class TestStringRepresentation(unittest.TestCase):
     def test_string_of_year_day(self):
         fixed_date = FixedDate(day_of_year=365, year=2022)
         self.assertEqual(str(fixed_date), "2022-13-29")
+
+    def test_string_of_early_year(self):
+        fixed_date = FixedDate(day=5, month=7, year=24)
+        self.assertEqual(str(fixed_date), "0024-07-05")
+        self.assertEqual(FixedDate.fromisoformat(str(fixed_date)), fixed_date)
@@ -0,0 +1,40 @@
+import unittest
+import datetime
+from fixedcal import FixedDate
+
+class TestValueType(unittest.TestCase):
+    def setUp(self):
+        self.fixed_date = FixedDate(date=datetime.date(2022, 12, 5))
+
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.fixed_date, "__dict__"))
+        def set_attribute():
+            self.fixed_date.extra = 1
+        self.assertRaises(AttributeError, set_attribute)
+
+    def test_equal_dates_have_equal_hashes(self):
+        same_date = FixedDate(day_of_year=339, year=2022)
+        self.assertEqual(self.fixed_date, same_date)
+        self.assertEqual(hash(self.fixed_date), hash(same_date))
+
+    def test_usable_as_dict_key(self):
+        lookup = {self.fixed_date: "found"}
+        self.assertEqual(lookup[FixedDate(day=3, month=13, year=2022)], "found")
+
+    def test_set_removes_duplicates(self):
+        dates = {self.fixed_date, FixedDate(day_of_year=339, year=2022),
+                 FixedDate(day_of_year=340, year=2022)}
+        self.assertEqual(len(dates), 2)
+
+    def test_not_equal_to_other_types(self):
+        self.assertFalse(self.fixed_date == datetime.date(2022, 12, 5))
+        self.assertTrue(self.fixed_date != "2022-13-03")
+
+    def test_ordering_with_other_type_raises(self):
+        self.assertRaises(TypeError, lambda : self.fixed_date > 5)
+
+    def test_date_round_trip_over_whole_range(self):
+        for year in (1, 4, 100, 1900, 2000, 2024, 9999):
+            for day in (1, 59, 60, 168, 169, 170, 365):
+                gregorian = datetime.date(year, 1, 1) + datetime.timedelta(day-1)
+                self.assertEqual(FixedDate(date=gregorian).date, gregorian)
@@ -0,0 +1,134 @@
+import unittest
+import datetime
+from fixedcal.core.date import FixedDate
+from fixedcal.core.date_time import FixedDateTime
+
+try:
+    import numpy as np
+    from fixedcal import vectorized
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+    def test_datetime64_and_ordinals_give_same_fields(self):
+        dates = np.array(["2022-01-01", "2024-06-17", "1900-12-31"], dtype="datetime64[D]")
+        ordinals = [datetime.date(2022, 1, 1).toordinal(),
+                    datetime.date(2024, 6, 17).toordinal(),
+                    datetime.date(1900, 12, 31).toordinal()]
+        from_datetime64 = vectorized.to_fixed_fields(dates)
+        from_ordinals = vectorized.to_fixed_fields(ordinals)
+        for name, values in from_datetime64.items():
+            np.testing.assert_array_equal(values, from_ordinals[name])
+
+    def test_datetime64_with_other_unit(self):
+        dates = np.array(["2022-02-07T13:45"], dtype="datetime64[m]")
+        records = vectorized.to_fixed_records(dates)
+        self.assertEqual(records["month"][0], 2)
+        self.assertEqual(records["day_of_month"][0], 10)
+
+    def test_year_day_fields(self):
+        fields = vectorized.to_fixed_fields(np.array(["2022-12-31"], dtype="datetime64[D]"))
+        self.assertEqual(fields["month"][0], 13)
+        self.assertEqual(fields["day_of_month"][0], 29)
+        self.assertEqual(fields["weekday"][0], vectorized.WEEKDAY_NONE)
+        self.assertTrue(fields["is_year_day"][0])
+        self.assertFalse(fields["is_leap_day"][0])
+
+    def test_leap_day_fields(self):
+        fields = vectorized.to_fixed_fields(np.array(["2024-06-17"], dtype="datetime64[D]"))
+        self.assertEqual(fields["month"][0], 6)
+        self.assertEqual(fields["day_of_month"][0], 29)
+        self.assertEqual(fields["weekday"][0], vectorized.WEEKDAY_NONE)
+        self.assertEqual(fields["week_of_year"][0], 24)
+        self.assertTrue(fields["is_leap_day"][0])
+
+    def test_records_are_structured(self):
+        records = vectorized.to_fixed_records([1, 2, 3])
+        self.assertEqual(records.dtype, vectorized.FIELDS_DTYPE)
+        self.assertEqual(records.shape, (3,))
+        self.assertEqual(list(records["day_of_year"]), [1, 2, 3])
+
+    def test_multidimensional_input_keeps_shape(self):
+        ordinals = np.arange(730120, 730126).reshape(2, 3)
+        self.assertEqual(vectorized.to_fixed_fields(ordinals)["year"].shape, (2, 3))
+
+    def test_empty_input(self):
+        fields = vectorized.to_fixed_fields(np.array([], dtype="datetime64[D]"))
+        self.assertEqual(fields["year"].size, 0)
+
+    def test_nat_raises(self):
+        dates = np.array(["2022-01-01", "NaT"], dtype="datetime64[D]")
+        self.assertRaises(ValueError, lambda : vectorized.to_fixed_fields(dates))
+
+    def test_ordinal_out_of_range_raises(self):
+        self.assertRaises(ValueError, lambda : vectorized.to_fixed_fields([0]))
+        self.assertRaises(ValueError, lambda : vectorized.to_fixed_fields([3652060]))
+
+    def test_invalid_dtype_raises(self):
+        self.assertRaises(ValueError, lambda : vectorized.to_fixed_fields([1.5]))
+
+    def test_year_and_day_of_year_over_whole_range(self):
+        ordinals = np.arange(vectorized.MIN_ORDINAL, vectorized.MAX_ORDINAL+1)
+        years, day_of_year = vectorized.year_and_day_of_year(ordinals)
+        dates = np.datetime64("0001-01-01") + (ordinals - 1)
+        np.testing.assert_array_equal(years, dates.astype("datetime64[Y]").astype(int) + 1970)
+        year_starts = dates.astype("datetime64[Y]").astype("datetime64[D]")
+        np.testing.assert_array_equal(day_of_year, (dates - year_starts).astype(int) + 1)
+
+    def test_equivalence_with_fixed_date(self):
+        start = datetime.date(1899, 12, 25)
+        ordinals = [start.toordinal() + plusday for plusday in range(0, 2*366 + 20)]
+        ordinals += [datetime.date(year, 12, 31).toordinal() for year in (1600, 2000, 2100)]
+        ordinals += [vectorized.MIN_ORDINAL, vectorized.MAX_ORDINAL]
+        ordinals += list(range(datetime.date(2023, 12, 25).toordinal(),
+                               datetime.date(2025, 1, 5).toordinal()))
+        records = vectorized.to_fixed_records(ordinals)
+        for ordinal, record in zip(ordinals, records):
+            fixed_date = FixedDate(date=datetime.date.fromordinal(ordinal))
+            for name in vectorized.FIELDS_DTYPE.names:
+                expected = getattr(fixed_date, name)
+                if expected is None:
+                    expected = vectorized.WEEKDAY_NONE
+                self.assertEqual(record[name], expected, (fixed_date.date, name))
+
+    def test_timestamps_to_fixed_fields(self):
+        timestamps = [0, 1718625600, 1703980799, -1]
+        fields = vectorized.timestamps_to_fixed_fields(timestamps, utc_offset=3600)
+        for index, timestamp in enumerate(timestamps):
+            moment = FixedDateTime.fromtimestamp(
+                timestamp, datetime.timezone(datetime.timedelta(hours=1)))
+            self.assertEqual(fields["year"][index], moment.fixed_date.year)
+            self.assertEqual(fields["day_of_year"][index], moment.fixed_date.day_of_year)
+            self.assertEqual(fields["hour"][index], moment.hour)
+            self.assertEqual(fields["minute"][index], moment.minute)
+            self.assertEqual(fields["second"][index], moment.second)
+
+    def test_timestamps_should_be_integers(self):
+        with self.assertRaises(ValueError):
+            vectorized.timestamps_to_fixed_fields([1.5])
+
+    def test_from_fixed_fields_matches_from_fields_many(self):
+        rng = np.random.default_rng(5)
+        days = rng.integers(0, 31, 5000)
+        months = rng.integers(0, 15, 5000)
+        years = rng.choice([0, 1, 4, 100, 1900, 2000, 2023, 2024, 9999, 10000], 5000)
+        ordinals, errors = vectorized.from_fixed_fields(days, months, years, errors="collect")
+        expected = FixedDate.from_fields_many(days, months, years, errors="collect")
+        self.assertEqual(ordinals.tolist(), expected[0])
+        self.assertEqual(errors, expected[1])
+        ordinals, mask = vectorized.from_fixed_fields(days, months, years, errors="mask")
+        self.assertEqual(mask.tolist(), [ordinal == 0 for ordinal in expected[0]])
+
+    def test_from_fixed_fields_raises(self):
+        ordinals = vectorized.from_fixed_fields(np.array([29, 1]), np.array([6, 7]),
+                                                np.array([2024, 2024], dtype=np.int16))
+        self.assertEqual(ordinals.tolist(), [datetime.date(2024, 6, 17).toordinal(),
+                                             datetime.date(2024, 6, 18).toordinal()])
+        with self.assertRaisesRegex(ValueError, "row 1: Day should be in range 1...28"):
+            vectorized.from_fixed_fields([29, 29], [6, 6], [2024, 2023])
+        with self.assertRaises(ValueError):
+            vectorized.from_fixed_fields([1.0], [1], [2024])
+        with self.assertRaises(ValueError):
+            vectorized.from_fixed_fields([1, 1], [1], [2024])
+        self.assertEqual(vectorized.from_fixed_fields([1], [1], [2024], "collect")[1], [])
@@ -0,0 +1,135 @@
+import unittest
+import datetime
+from fixedcal.core.date import FixedDate
+from fixedcal.services.ordinals import MIN_ORDINAL, MAX_ORDINAL
+from fixedcal.workdays import WorkCalendar, WORKDAY, DAY_OFF
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def naive_is_workday(calendar, weekend, holidays, special_days, date):
+    if date.weekday is None:
+        return special_days == WORKDAY
+    return date.weekday not in weekend and date.toordinal() not in holidays
+
+class TestWorkCalendar(unittest.TestCase):
+    def setUp(self):
+        self.holidays = [FixedDate(day=1, month=1, year=2024),
+                         FixedDate(day=2, month=1, year=2024),
+                         FixedDate(day=7, month=1, year=2024),     # on weekend
+                         FixedDate(day=28, month=6, year=2024),
+                         FixedDate(day=3, month=7, year=2024)]
+        self.calendars = []
+        for weekend in ((1, 7), (6, 7), (), (1, 2, 3, 4, 5, 6)):
+            for special_days in (WORKDAY, DAY_OFF):
+                calendar = WorkCalendar(weekend, self.holidays, special_days)
+                self.calendars.append((calendar, set(weekend), special_days))
+        start = datetime.date(2023, 12, 1).toordinal()
+        self.dates = [FixedDate.fromordinal(ordinal) for ordinal in range(start, start + 420)]
+
+    def test_is_workday_matches_naive(self):
+        holiday_ordinals = {holiday.toordinal() for holiday in self.holidays}
+        for calendar, weekend, special_days in self.calendars:
+            for date in self.dates:
+                self.assertEqual(
+                    calendar.is_workday(date),
+                    naive_is_workday(calendar, weekend, holiday_ordinals, special_days, date),
+                    (calendar, str(date)))
+
+    def test_workdays_between_matches_naive(self):
+        for calendar, _, _ in self.calendars:
+            workdays = [calendar.is_workday(date) for date in self.dates]
+            for start in range(0, len(self.dates), 37):
+                for end in range(start, len(self.dates), 29):
+                    expected = sum(workdays[start:end])
+                    self.assertEqual(calendar.workdays_between(self.dates[start], self.dates[end]),
+                                     expected, (calendar, str(self.dates[start])))
+                    self.assertEqual(calendar.workdays_between(self.dates[end], self.dates[start]),
+                                     -expected)
+
+    def test_add_workdays_matches_naive(self):
+        for calendar, _, _ in self.calendars:
+            workdays = [date for date in self.dates if calendar.is_workday(date)]
+            for date in self.dates[20:-220:7]:
+                following = [workday for workday in workdays if workday > date]
+                preceding = [workday for workday in workdays if workday < date]
+                for count in (1, 2, 5, 30):
+                    self.assertEqual(calendar.add_workdays(date, count), following[count-1],
+                                     (calendar, str(date), count))
+                    if count <= len(preceding):
+                        self.assertEqual(calendar.add_workdays(date, -count), preceding[-count],
+                                         (calendar, str(date), -count))
+                expected = date if calendar.is_workday(date) else following[0]
+                self.assertEqual(calendar.add_workdays(date, 0), expected)
+
+    def test_next_and_previous_workday(self):
+        calendar = WorkCalendar(holidays=self.holidays)
+        year_day = FixedDate(day=29, month=13, year=2023)
+        self.assertEqual(calendar.next_workday(year_day), FixedDate(day=3, month=1, year=2024))
+        self.assertEqual(calendar.previous_workday(datetime.date(2024, 1, 3)),
+                         FixedDate(day=27, month=13, year=2023))
+
+    def test_special_days_policy(self):
+        leap_day = FixedDate(day=29, month=6, year=2024)
+        self.assertFalse(WorkCalendar().is_workday(leap_day))
+        self.assertTrue(WorkCalendar(special_days=WORKDAY).is_workday(leap_day))
+        self.assertEqual(WorkCalendar(special_days=WORKDAY).next_workday(
+            FixedDate(day=27, month=6, year=2024)), leap_day)
+
+    def test_long_spans(self):
+        calendar = WorkCalendar(special_days=WORKDAY)
+        first = FixedDate(day=1, month=1, year=1)
+        last = FixedDate(day=29, month=13, year=9999)
+        count = calendar.workdays_between(first, last)
+        self.assertEqual(count, 9999*52*5 + 9998 + 2424)
+        self.assertEqual(calendar.add_workdays(first, count + 1), last)
+        with self.assertRaises(OverflowError):
+            calendar.add_workdays(last, 1)
+        with self.assertRaises(OverflowError):
+            calendar.add_workdays(first, -1)
+
+    def test_invalid_calendars(self):
+        with self.assertRaises(ValueError):
+            WorkCalendar(weekend=range(1, 8))
+        with self.assertRaises(ValueError):
+            WorkCalendar(weekend=(0,))
+        with self.assertRaises(ValueError):
+            WorkCalendar(special_days="maybe")
+
+    def test_properties(self):
+        calendar = WorkCalendar(weekend=[7, 1], holidays=self.holidays)
+        self.assertEqual(calendar.weekend, frozenset({1, 7}))
+        self.assertEqual(len(calendar.holidays), 2)
+        self.assertEqual(calendar.special_days, DAY_OFF)
+        self.assertEqual(repr(calendar),
+                         "WorkCalendar(weekend=[1, 7], holidays=2, special_days='day_off')")
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestWorkCalendarArrays(unittest.TestCase):
+    def test_array_methods_match_scalar_methods(self):
+        holidays = [FixedDate(day=2, month=1, year=2024), FixedDate(day=3, month=7, year=2024)]
+        ordinals = np.arange(datetime.date(2023, 12, 1).toordinal(),
+                             datetime.date(2025, 1, 10).toordinal())
+        dates = [datetime.date.fromordinal(int(ordinal)) for ordinal in ordinals]
+        for weekend in ((1, 7), (6,), (1, 2, 3, 4, 5, 6)):
+            for special_days in (WORKDAY, DAY_OFF):
+                calendar = WorkCalendar(weekend, holidays, special_days)
+                np.testing.assert_array_equal(calendar.workday_mask(ordinals),
+                                              [calendar.is_workday(date) for date in dates])
+                np.testing.assert_array_equal(
+                    calendar.workdays_between_arrays(ordinals, ordinals[::-1]),
+                    [calendar.workdays_between(start, end)
+                     for start, end in zip(dates, dates[::-1])])
+                for count in (0, 1, -3, 30):
+                    np.testing.assert_array_equal(
+                        calendar.add_workdays_arrays(ordinals, count),
+                        [calendar.add_workdays(date, count).toordinal() for date in dates])
+
+    def test_add_workdays_arrays_out_of_range(self):
+        calendar = WorkCalendar()
+        with self.assertRaises(OverflowError):
+            calendar.add_workdays_arrays([MAX_ORDINAL], [1])
+        with self.assertRaises(OverflowError):
+            calendar.add_workdays_arrays([MIN_ORDINAL], [-1])
@@ -0,0 +1,31 @@
+import unittest
+import datetime
+from fixedcal.services.leap_days import is_leap_year
+from fixedcal.services.ordinals import year_start_ordinal, year_and_day_of_year
+from fixedcal.services.year_table import get_year_table
+
+class TestYearTable(unittest.TestCase):
+    def test_table_is_shared(self):
+        self.assertIs(get_year_table(), get_year_table())
+
+    def test_year_starts_match_native_dates(self):
+        year_starts = get_year_table().year_starts
+        for year in range(1, 10000):
+            self.assertEqual(year_starts[year], datetime.date(year, 1, 1).toordinal())
+        self.assertEqual(year_starts[10000], datetime.date(9999, 12, 31).toordinal() + 1)
+
+    def test_leap_flags_match_is_leap_year(self):
+        leap_flags = get_year_table().leap_flags
+        for year in range(1, 10000):
+            self.assertEqual(leap_flags[year] == 1, is_leap_year(year))
+
+    def test_year_start_ordinal(self):
+        self.assertEqual(year_start_ordinal(1), 1)
+        self.assertEqual(year_start_ordinal(2024), datetime.date(2024, 1, 1).toordinal())
+
+    def test_year_and_day_of_year_at_year_boundaries(self):
+        for year in range(1, 10000):
+            first = datetime.date(year, 1, 1).toordinal()
+            last = datetime.date(year, 12, 31).toordinal()
+            self.assertEqual(year_and_day_of_year(first), (year, 1))
+            self.assertEqual(year_and_day_of_year(last), (year, last - first + 1))